@@ -0,0 +1,41 @@
+"""
+compile_mc_aot.py — Ahead-of-time build of the Monte Carlo Numba kernel.
+
+Compiles ``reduce_rows`` from src/optimization/_mc_numba.py with
+numba.pycc into a ``_mc_aot`` extension module inside src/optimization.
+Once built, monte_carlo.py loads the prebuilt kernel on import, so the
+first run_monte_carlo() call pays no JIT compilation cost and numba is not
+required at runtime.
+
+Usage (from the repo root, needs numba and a C compiler):
+    python scripts/compile_mc_aot.py
+
+The output is a platform-specific .so/.pyd and is not committed; delete it
+to fall back to the JIT (parallel) kernel.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from numba.pycc import CC  # noqa: E402
+
+from src.optimization._mc_numba import reduce_rows_py  # noqa: E402
+
+
+def main() -> None:
+    cc = CC("_mc_aot")
+    cc.output_dir = str(ROOT / "src" / "optimization")
+    cc.export(
+        "reduce_rows", "void(f8[:, ::1], f8, f8[::1], f8[::1])",
+    )(reduce_rows_py)
+    cc.compile()
+    print(f"Built _mc_aot in {cc.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,7 +20,7 @@ Requirements covered:
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
@@ -198,16 +198,16 @@ def _pair_fills_to_trades(fill_log: list[FillEvent]) -> list[dict]:
     Returns list of {entry_fill, exit_fill, pnl, entry_time, exit_time}.
     """
     trades = []
-    open_fills: dict[str, list[FillEvent]] = {}
+    open_fills: dict[str, deque[FillEvent]] = {}
 
     for fill in fill_log:
         symbol = fill.symbol
         if symbol not in open_fills:
-            open_fills[symbol] = []
+            open_fills[symbol] = deque()
 
         existing = open_fills[symbol]
         if existing and existing[0].side != fill.side:
-            open_fill = existing.pop(0)
+            open_fill = existing.popleft()
             if open_fill.side == OrderSide.BUY:
                 pnl = (fill.fill_price - open_fill.fill_price) * min(
                     fill.quantity, open_fill.quantity
@@ -10,6 +10,8 @@ Design:
 - Beta = covariance(strategy, benchmark) / variance(benchmark)
 - Information Ratio = active_return / tracking_error
 - All returns computed from equity log sequences
+- Metrics are float statistics: equity logs are converted to float64
+  arrays once and reduced with NumPy
 
 Requirement: PORT-12, PORT-13
 """
@@ -20,6 +22,8 @@ from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Optional
 
+import numpy as np
+
 from src.events import MarketEvent
 
 
@@ -47,6 +51,22 @@ class BenchmarkResult:
     metrics: Optional[BenchmarkMetrics] = None
 
 
+def _to_float_array(equity_log: list[dict]) -> np.ndarray:
+    """Equity column of an equity log as a float64 array."""
+    return np.fromiter(
+        (float(e["equity"]) for e in equity_log),
+        dtype=np.float64,
+        count=len(equity_log),
+    )
+
+
+def _simple_returns(equities: np.ndarray) -> np.ndarray:
+    """Bar-to-bar simple returns, skipping steps from a zero equity."""
+    prev = equities[:-1]
+    valid = prev != 0
+    return equities[1:][valid] / prev[valid] - 1
+
+
 def compute_benchmark_equity(
     bars: list[MarketEvent],
     initial_equity: Decimal = Decimal("10000"),
@@ -54,7 +74,7 @@ def compute_benchmark_equity(
     """Compute buy-and-hold equity curve.
 
     Invests 100% at the first bar's close and holds throughout.
-    Returns list of {timestamp, equity} dicts.
+    Returns list of {timestamp, equity} dicts, equity in Decimal.
     """
     if not bars:
         return []
@@ -64,16 +84,10 @@ def compute_benchmark_equity(
         return []
 
     shares = initial_equity / entry_price
-    equity_log: list[dict] = []
-
-    for bar in bars:
-        equity = shares * bar.close
-        equity_log.append({
-            "timestamp": bar.timestamp,
-            "equity": equity,
-        })
-
-    return equity_log
+    return [
+        {"timestamp": bar.timestamp, "equity": shares * bar.close}
+        for bar in bars
+    ]
 
 
 def compute_benchmark_metrics(
@@ -88,7 +102,7 @@ def compute_benchmark_metrics(
     strategy_equity_log : list[dict]
         Strategy equity log (from BacktestResult).
     benchmark_equity_log : list[dict]
-        Buy-and-hold equity log (from compute_benchmark_equity).
+        Buy-and-hold equity curve (from compute_benchmark_equity).
     initial_equity : Decimal
         Starting equity.
 
@@ -99,22 +113,24 @@ def compute_benchmark_metrics(
     """
     init_eq = float(initial_equity)
 
-    # Extract equity series
-    strat_equities = [float(e["equity"]) for e in strategy_equity_log]
-    bench_equities = [float(e["equity"]) for e in benchmark_equity_log]
+    # Extract equity series (one float64 conversion per log)
+    strat_equities = _to_float_array(strategy_equity_log)
+    bench_equities = _to_float_array(benchmark_equity_log)
 
     # Align lengths
     n = min(len(strat_equities), len(bench_equities))
     if n < 2:
         strat_ret = 0.0
         bench_ret = 0.0
-        if strat_equities:
-            strat_ret = (strat_equities[-1] / init_eq - 1) * 100
-        if bench_equities:
-            bench_ret = (bench_equities[-1] / init_eq - 1) * 100
+        if len(strat_equities):
+            strat_ret = (float(strat_equities[-1]) / init_eq - 1) * 100
+        if len(bench_equities):
+            bench_ret = (float(bench_equities[-1]) / init_eq - 1) * 100
         return BenchmarkMetrics(
             benchmark_return_pct=bench_ret,
-            benchmark_final_equity=bench_equities[-1] if bench_equities else init_eq,
+            benchmark_final_equity=(
+                float(bench_equities[-1]) if len(bench_equities) else init_eq
+            ),
             alpha=0.0,
             beta=0.0,
             information_ratio=0.0,
@@ -124,47 +140,41 @@ def compute_benchmark_metrics(
 
     strat_equities = strat_equities[:n]
     bench_equities = bench_equities[:n]
+    strat_total_ret = (float(strat_equities[-1]) / init_eq - 1) * 100
+    bench_total_ret = (float(bench_equities[-1]) / init_eq - 1) * 100
+    bench_final = float(bench_equities[-1])
 
-    # Compute bar-to-bar returns
-    strat_returns = [
-        (strat_equities[i] / strat_equities[i - 1] - 1)
-        for i in range(1, n)
-        if strat_equities[i - 1] != 0
-    ]
-    bench_returns = [
-        (bench_equities[i] / bench_equities[i - 1] - 1)
-        for i in range(1, n)
-        if bench_equities[i - 1] != 0
-    ]
+    # Compute bar-to-bar returns (bars with a zero previous equity are skipped)
+    strat_returns = _simple_returns(strat_equities)
+    bench_returns = _simple_returns(bench_equities)
 
     # Align return lengths
     m = min(len(strat_returns), len(bench_returns))
     if m < 2:
-        strat_total = (strat_equities[-1] / init_eq - 1) * 100
-        bench_total = (bench_equities[-1] / init_eq - 1) * 100
         return BenchmarkMetrics(
-            benchmark_return_pct=bench_total,
-            benchmark_final_equity=bench_equities[-1],
+            benchmark_return_pct=bench_total_ret,
+            benchmark_final_equity=bench_final,
             alpha=0.0,
             beta=0.0,
             information_ratio=0.0,
             correlation=0.0,
-            strategy_return_pct=strat_total,
+            strategy_return_pct=strat_total_ret,
         )
 
     strat_returns = strat_returns[:m]
     bench_returns = bench_returns[:m]
 
-    # Statistics
-    mean_s = sum(strat_returns) / m
-    mean_b = sum(bench_returns) / m
-
-    var_b = sum((r - mean_b) ** 2 for r in bench_returns) / m
-    cov_sb = sum(
-        (strat_returns[i] - mean_s) * (bench_returns[i] - mean_b)
-        for i in range(m)
-    ) / m
-    var_s = sum((r - mean_s) ** 2 for r in strat_returns) / m
+    # Statistics: one 2x2 population covariance matrix of the stacked
+    # return series gives var_s, var_b and cov_sb from a single
+    # mean-centering pass.
+    returns = np.vstack((strat_returns, bench_returns))
+    means = returns.mean(axis=1)
+    mean_s = float(means[0])
+    mean_b = float(means[1])
+    cov = np.cov(returns, bias=True)
+    var_s = float(cov[0, 0])
+    var_b = float(cov[1, 1])
+    cov_sb = float(cov[0, 1])
 
     # Beta
     beta = cov_sb / var_b if abs(var_b) > 1e-20 else 0.0
@@ -178,10 +188,9 @@ def compute_benchmark_metrics(
     correlation = cov_sb / (std_s * std_b) if (std_s * std_b) > 1e-20 else 0.0
 
     # Active returns and tracking error
-    active_returns = [strat_returns[i] - bench_returns[i] for i in range(m)]
-    mean_active = sum(active_returns) / m
-    tracking_var = sum((r - mean_active) ** 2 for r in active_returns) / m
-    tracking_error = tracking_var ** 0.5
+    active_returns = strat_returns - bench_returns
+    mean_active = float(active_returns.mean())
+    tracking_error = float(active_returns.std())
 
     # Information Ratio (annualized)
     information_ratio = (
@@ -190,13 +199,9 @@ def compute_benchmark_metrics(
         else 0.0
     )
 
-    # Total returns
-    strat_total_ret = (strat_equities[-1] / init_eq - 1) * 100
-    bench_total_ret = (bench_equities[-1] / init_eq - 1) * 100
-
     return BenchmarkMetrics(
         benchmark_return_pct=bench_total_ret,
-        benchmark_final_equity=bench_equities[-1],
+        benchmark_final_equity=bench_final,
         alpha=alpha,
         beta=beta,
         information_ratio=information_ratio,
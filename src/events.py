@@ -2,6 +2,13 @@
 events.py — Immutable event types for the apex-backtest EDA pipeline.
 
 All dataclasses are frozen (immutable after construction).
+MarketEvent and SignalEvent additionally use __slots__: one is created per
+bar and one per signal, so dropping the per-instance __dict__ matters, and
+MarketEvent's fields are read on every merge/strategy step. MarketEvent also
+carries float mirrors of its OHLC prices (open_f, high_f, low_f,
+close_f) for indicator math; they are never used for accounting. ts_ns is
+its timestamp as epoch nanoseconds, used as the ordering key when merging
+bar streams.
 All financial fields use decimal.Decimal with string constructor:
     Decimal('123.45')  # correct
     Decimal(123.45)    # FORBIDDEN — imprecise due to binary representation
@@ -9,8 +16,8 @@ All financial fields use decimal.Decimal with string constructor:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
 from typing import Optional
@@ -37,11 +44,26 @@ class OrderSide(Enum):
     SELL = "SELL"
 
 
+# ---------------------------------------------------------------------------
+# Timestamp helpers
+# ---------------------------------------------------------------------------
+
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+
+def _to_epoch_ns(ts: datetime) -> int:
+    """Nanoseconds since the Unix epoch; naive datetimes count as UTC."""
+    epoch = _EPOCH_NAIVE if ts.tzinfo is None else _EPOCH_UTC
+    return (ts - epoch) // _ONE_US * 1000
+
+
 # ---------------------------------------------------------------------------
 # Frozen Dataclasses (causal order: Market → Signal → Order → Fill)
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarketEvent:
     symbol: str
     timestamp: datetime
@@ -52,8 +74,26 @@ class MarketEvent:
     volume: int
     timeframe: str
 
-
-@dataclass(frozen=True)
+    # float64 views of the OHLC prices, converted once at construction for
+    # indicator code. Accounting (fills, cash, PnL) must keep using the
+    # Decimal fields above.
+    open_f: float = field(init=False, repr=False, compare=False)
+    high_f: float = field(init=False, repr=False, compare=False)
+    low_f: float = field(init=False, repr=False, compare=False)
+    close_f: float = field(init=False, repr=False, compare=False)
+    # Timestamp as integer nanoseconds since the Unix epoch (naive
+    # timestamps are taken as UTC), for cheap ordering and arithmetic.
+    ts_ns: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "open_f", float(self.open))
+        object.__setattr__(self, "high_f", float(self.high))
+        object.__setattr__(self, "low_f", float(self.low))
+        object.__setattr__(self, "close_f", float(self.close))
+        object.__setattr__(self, "ts_ns", _to_epoch_ns(self.timestamp))
+
+
+@dataclass(frozen=True, slots=True)
 class SignalEvent:
     symbol: str
     timestamp: datetime
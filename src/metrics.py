@@ -10,6 +10,7 @@ Raises MetricsComputationError for missing/invalid data.
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
 from typing import Optional
@@ -298,17 +299,17 @@ def _compute_trade_stats(fill_log: list[FillEvent]) -> dict:
 
     # Pair fills into round-trip trades
     trades: list[dict] = []
-    open_fills: dict[str, list[FillEvent]] = {}
+    open_fills: dict[str, deque[FillEvent]] = {}
 
     for fill in fill_log:
         symbol = fill.symbol
         if symbol not in open_fills:
-            open_fills[symbol] = []
+            open_fills[symbol] = deque()
 
         existing = open_fills[symbol]
         if existing and existing[0].side != fill.side:
             # Closing trade
-            open_fill = existing.pop(0)
+            open_fill = existing.popleft()
             if open_fill.side == OrderSide.BUY:
                 pnl = (fill.fill_price - open_fill.fill_price) * min(fill.quantity, open_fill.quantity)
             else:
@@ -38,10 +38,11 @@ def merge_bars(
 ) -> Generator[MarketEvent, None, None]:
     """Merge N DataHandler generators into a single chronological stream.
 
-    Uses heapq with (timestamp, symbol, counter, bar) as sort key for
+    Uses heapq with (ts_ns, symbol, counter, bar) as sort key for
     deterministic ordering when timestamps are identical.  Secondary sort
     by symbol name (alphabetical); counter prevents comparison of
-    MarketEvent objects (not comparable).
+    MarketEvent objects (not comparable).  The epoch-nanosecond int key
+    (MarketEvent.ts_ns) compares faster than datetime objects.
     """
     counter = 0
     iterators: dict[str, Generator] = {}
@@ -51,7 +52,7 @@ def merge_bars(
         it = iter(dh.stream_bars())
         try:
             bar = next(it)
-            heapq.heappush(heap, (bar.timestamp, symbol, counter, bar))
+            heapq.heappush(heap, (bar.ts_ns, symbol, counter, bar))
             counter += 1
             iterators[symbol] = it
         except StopIteration:
@@ -64,7 +65,7 @@ def merge_bars(
         if it is not None:
             try:
                 next_bar = next(it)
-                heapq.heappush(heap, (next_bar.timestamp, _sym, counter, next_bar))
+                heapq.heappush(heap, (next_bar.ts_ns, _sym, counter, next_bar))
                 counter += 1
             except StopIteration:
                 del iterators[_sym]
@@ -82,6 +83,15 @@ class MultiAssetResult:
     event_log: list = field(default_factory=list)
     final_equity: Decimal = Decimal("0")
     total_bars: int = 0
+    symbol_ids: dict[str, int] = field(default_factory=dict)
+    fill_symbol_mask: int = 0
+
+    def has_fills_for(self, symbol: str) -> bool:
+        """O(1) check whether any fill was recorded for ``symbol``."""
+        sid = self.symbol_ids.get(symbol)
+        if sid is None:
+            return False
+        return bool(self.fill_symbol_mask >> sid & 1)
 
 
 class MultiAssetEngine:
@@ -116,6 +126,21 @@ class MultiAssetEngine:
         self._risk_manager = risk_manager
         self._last_prices: dict[str, Decimal] = {}
         self._event_log: list = []
+        # Small int ID per symbol — fill presence is tracked as a bitmask
+        # instead of building a set of symbol strings from the fill log.
+        self._sym_id: dict[str, int] = {
+            s: i for i, s in enumerate(sorted(handlers))
+        }
+        self._fill_mask = 0
+        # Symbols already holding a position in the portfolio passed in.
+        # Together with _fill_mask, a clear bit means the symbol cannot
+        # have an open position, which lets the per-bar margin check and
+        # EXIT handling skip the portfolio scans.
+        self._held_mask = 0
+        for symbol, pos in portfolio.positions.items():
+            sid = self._sym_id.get(symbol)
+            if sid is not None and pos.quantity > Decimal("0"):
+                self._held_mask |= 1 << sid
 
     def run(self) -> MultiAssetResult:
         """Run the multi-asset backtest.
@@ -137,9 +162,15 @@ class MultiAssetEngine:
             for fill in fills:
                 self._event_log.append(fill)
                 self._portfolio.process_fill(fill)
-
-            # 2. Check margin with ALL current prices
-            to_liquidate = self._portfolio.check_margin(self._last_prices)
+                self._mark_fill(fill.symbol)
+
+            # 2. Check margin with ALL current prices (nothing to check
+            # until some symbol has been filled or held a position)
+            to_liquidate = (
+                self._portfolio.check_margin(self._last_prices)
+                if self._fill_mask | self._held_mask
+                else ()
+            )
             for symbol in to_liquidate:
                 if symbol in self._last_prices:
                     liq_fill = self._portfolio.force_liquidate(
@@ -147,6 +178,7 @@ class MultiAssetEngine:
                     )
                     if liq_fill:
                         self._event_log.append(liq_fill)
+                        self._mark_fill(symbol)
 
             # 3. Route bar to matching strategy
             strategy = self._strategies.get(bar.symbol)
@@ -179,8 +211,27 @@ class MultiAssetEngine:
             event_log=self._event_log,
             final_equity=final_equity,
             total_bars=total_bars,
+            symbol_ids=dict(self._sym_id),
+            fill_symbol_mask=self._fill_mask,
         )
 
+    def _mark_fill(self, symbol: str) -> None:
+        """Set the fill-presence bit for ``symbol``."""
+        sid = self._sym_id.get(symbol)
+        if sid is not None:
+            self._fill_mask |= 1 << sid
+
+    def _may_hold(self, symbol: str) -> bool:
+        """False only if ``symbol`` can have no open position.
+
+        Positions only come from fills, so a symbol that was neither
+        filled during the run nor held at the start has none.
+        """
+        sid = self._sym_id.get(symbol)
+        if sid is None:
+            return True
+        return bool((self._fill_mask | self._held_mask) >> sid & 1)
+
     def _snapshot_equity(self, timestamp) -> None:
         """Append equity snapshot with ALL symbols' last known prices."""
         equity = self._portfolio.compute_equity(self._last_prices)
@@ -233,6 +284,8 @@ class MultiAssetEngine:
             )
 
         elif signal.signal_type == SignalType.EXIT:
+            if not self._may_hold(signal.symbol):
+                return None
             pos = self._portfolio.positions.get(signal.symbol)
             if pos is None or pos.quantity <= Decimal("0"):
                 return None
@@ -0,0 +1,66 @@
+"""
+_mc_numba.py — Optional Numba kernels for Monte Carlo trade shuffling.
+
+The equity/drawdown scan over each shuffled PnL row is a tight numeric
+loop. When numba is installed it is compiled with @njit into one fused
+pass per row and the rows are spread across cores with prange; otherwise
+NUMBA_AVAILABLE is False and monte_carlo.py keeps using its NumPy
+implementation.
+
+If the ahead-of-time build from ``scripts/compile_mc_aot.py`` is present
+(``_mc_aot`` extension next to this file), its ``reduce_rows`` is used
+instead: no JIT compilation on first call, and numba is not needed at
+runtime. The AOT build runs rows serially (pycc has no prange).
+
+Shuffling itself stays in NumPy (Generator.permuted) so a given seed
+produces the same permutations with or without numba.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    _HAVE_NUMBA = False
+    prange = range
+
+
+def reduce_rows_py(
+    pnl_matrix: np.ndarray,
+    initial: float,
+    final_eq: np.ndarray,
+    max_dd: np.ndarray,
+) -> None:
+    """Final equity and max drawdown (%) per row, written in place.
+
+    Cumsum, running peak, drawdown and both reductions are fused into
+    one streaming pass per row — no equity/peak matrices are built.
+    Plain-Python source shared by the JIT and AOT builds.
+    """
+    n_rows, n_cols = pnl_matrix.shape
+    for i in prange(n_rows):
+        equity = initial
+        peak = initial
+        max_dd_pct = 0.0
+        for j in range(n_cols):
+            equity += pnl_matrix[i, j]
+            if equity > peak:
+                peak = equity
+            elif peak > 0.0:
+                dd_pct = (peak - equity) * 100.0 / peak
+                if dd_pct > max_dd_pct:
+                    max_dd_pct = dd_pct
+        final_eq[i] = equity
+        max_dd[i] = max_dd_pct
+
+
+try:
+    from src.optimization._mc_aot import reduce_rows
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = _HAVE_NUMBA
+    if _HAVE_NUMBA:
+        reduce_rows = njit(cache=True, parallel=True)(reduce_rows_py)
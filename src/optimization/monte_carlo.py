@@ -18,20 +18,24 @@ Requirement: OPT-03
 
 from __future__ import annotations
 
-import random
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Sequence
 
+import numpy as np
 
-@dataclass(frozen=True)
+from src.optimization import _mc_numba
+from src.trade_pnl import pair_fills_to_scaled_pnls
+
+
+@dataclass(frozen=True, slots=True)
 class MCPermutation:
     """Single Monte Carlo permutation result."""
     final_equity: float
     max_drawdown_pct: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MCResult:
     """Aggregate Monte Carlo simulation results."""
     n_permutations: int = 0
@@ -54,61 +58,96 @@ def _pair_fills_to_pnls(
 ) -> tuple[list[Decimal], Decimal]:
     """Extract per-trade PnLs from fill log.
 
+    Decimal adapter over ``pair_fills_to_scaled_pnls``.
+
     Returns (pnl_list, final_equity).
     """
-    from src.events import OrderSide
-
-    pnls: list[Decimal] = []
-    open_fill = None
-
-    for fill in fill_log:
-        if open_fill is None:
-            open_fill = fill
-        else:
-            # Pair: entry and exit
-            if fill.side != open_fill.side:
-                if open_fill.side == OrderSide.BUY:
-                    pnl = (fill.fill_price - open_fill.fill_price) * open_fill.quantity
-                else:
-                    pnl = (open_fill.fill_price - fill.fill_price) * open_fill.quantity
-                # Subtract friction
-                pnl -= (open_fill.commission + open_fill.slippage + open_fill.spread_cost)
-                pnl -= (fill.commission + fill.slippage + fill.spread_cost)
-                pnls.append(pnl)
-                open_fill = None
-            else:
-                open_fill = fill
-
-    # Compute final equity from PnLs
-    equity = initial_equity
-    for pnl in pnls:
-        equity += pnl
-
+    scaled, scale = pair_fills_to_scaled_pnls(fill_log)
+    pnls = [Decimal(p).scaleb(-scale) for p in scaled]
+    equity = initial_equity + Decimal(sum(scaled)).scaleb(-scale)
     return pnls, equity
 
 
+def _simulate_equity_curves(
+    pnl_matrix: np.ndarray,
+    initial_equity: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Simulate one equity curve per row of a 2D PnL matrix.
+
+    Uses the parallel Numba kernel when numba is installed, otherwise the
+    NumPy implementation.
+
+    Returns (final_equities, max_drawdown_pcts), each of shape (n_rows,).
+    """
+    if _mc_numba.NUMBA_AVAILABLE:
+        n_rows = pnl_matrix.shape[0]
+        final_eq = np.empty(n_rows, dtype=np.float64)
+        max_dd = np.empty(n_rows, dtype=np.float64)
+        _mc_numba.reduce_rows(
+            np.ascontiguousarray(pnl_matrix, dtype=np.float64),
+            float(initial_equity), final_eq, max_dd,
+        )
+        return final_eq, max_dd
+    return _simulate_equity_curves_numpy(pnl_matrix, initial_equity)
+
+
+def _simulate_equity_curves_numpy(
+    pnl_matrix: np.ndarray,
+    initial_equity: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """NumPy fallback for ``_simulate_equity_curves``.
+
+    Vectorized: one cumulative sum for the equity paths and one running
+    maximum for the peaks. The initial equity is prepended as column 0
+    before the cumsum so the float additions happen in the same order as
+    a scalar loop (identical results, not just approximately equal).
+
+    Returns (final_equities, max_drawdown_pcts), each of shape (n_rows,).
+    """
+    n_rows = pnl_matrix.shape[0]
+    if pnl_matrix.shape[1] == 0:
+        return (
+            np.full(n_rows, float(initial_equity)),
+            np.zeros(n_rows),
+        )
+
+    equity = np.empty((n_rows, pnl_matrix.shape[1] + 1), dtype=np.float64)
+    equity[:, 0] = initial_equity
+    equity[:, 1:] = pnl_matrix
+    np.cumsum(equity, axis=1, out=equity)
+
+    final_eq = equity[:, -1].copy()
+
+    # No losing trade -> every path is non-decreasing and has no drawdown.
+    # Rows are permutations of one PnL set, so this holds for all or none.
+    if pnl_matrix.min() >= 0.0:
+        return final_eq, np.zeros(n_rows)
+
+    peaks = np.maximum.accumulate(equity, axis=1)
+
+    # Reuse the equity buffer for the drawdown instead of allocating a
+    # temporary per arithmetic step.
+    dd_pct = equity
+    np.subtract(peaks, equity, out=dd_pct)
+    np.multiply(dd_pct, 100.0, out=dd_pct)
+    positive = peaks > 0
+    np.divide(dd_pct, peaks, out=dd_pct, where=positive)
+    dd_pct[~positive] = 0.0
+
+    return final_eq, dd_pct.max(axis=1)
+
+
 def _simulate_equity_curve(
-    pnls: list[float],
+    pnls: Sequence[float] | np.ndarray,
     initial_equity: float,
 ) -> tuple[float, float]:
     """Simulate equity curve from PnL sequence.
 
     Returns (final_equity, max_drawdown_pct).
     """
-    equity = initial_equity
-    peak = equity
-    max_dd_pct = 0.0
-
-    for pnl in pnls:
-        equity += pnl
-        if equity > peak:
-            peak = equity
-        if peak > 0:
-            dd_pct = (peak - equity) / peak * 100.0
-            if dd_pct > max_dd_pct:
-                max_dd_pct = dd_pct
-
-    return equity, max_dd_pct
+    arr = np.asarray(pnls, dtype=np.float64).reshape(1, -1)
+    finals, max_dds = _simulate_equity_curves(arr, initial_equity)
+    return float(finals[0]), float(max_dds[0])
 
 
 def run_monte_carlo(
@@ -135,18 +174,21 @@ def run_monte_carlo(
     MCResult
         Percentile statistics and permutation details.
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     # Extract trade PnLs
-    pnls_decimal, original_equity = _pair_fills_to_pnls(fill_log, initial_equity)
-    pnls_float = [float(p) for p in pnls_decimal]
+    scaled_pnls, scale = pair_fills_to_scaled_pnls(fill_log)
+    denom = 10 ** scale
+    # int / int true division is correctly rounded, same as float(Decimal)
+    pnls_arr = np.array([p / denom for p in scaled_pnls], dtype=np.float64)
     init_eq_float = float(initial_equity)
 
-    n_trades = len(pnls_float)
+    n_trades = len(pnls_arr)
 
     if n_trades < 2:
-        orig_final = float(original_equity)
+        orig_final = float(
+            initial_equity + Decimal(sum(scaled_pnls)).scaleb(-scale)
+        )
         return MCResult(
             n_permutations=0,
             n_trades=n_trades,
@@ -158,30 +200,30 @@ def run_monte_carlo(
         )
 
     # Original equity curve
-    orig_final, orig_dd = _simulate_equity_curve(pnls_float, init_eq_float)
-
-    # Run permutations
-    permutations: list[MCPermutation] = []
-    for _ in range(n_permutations):
-        shuffled = list(pnls_float)
-        random.shuffle(shuffled)
-        final_eq, max_dd = _simulate_equity_curve(shuffled, init_eq_float)
-        permutations.append(MCPermutation(
-            final_equity=final_eq,
-            max_drawdown_pct=max_dd,
-        ))
+    orig_final, orig_dd = _simulate_equity_curve(pnls_arr, init_eq_float)
+
+    # Run all permutations as one (n_permutations x n_trades) batch:
+    # shuffle each row independently, then one cumsum/running-max pass.
+    shuffled = np.broadcast_to(pnls_arr, (n_permutations, n_trades)).copy()
+    rng.permuted(shuffled, axis=1, out=shuffled)
+    final_eqs, max_dds = _simulate_equity_curves(shuffled, init_eq_float)
+
+    permutations = [
+        MCPermutation(final_equity=eq, max_drawdown_pct=dd)
+        for eq, dd in zip(final_eqs.tolist(), max_dds.tolist())
+    ]
 
     # Sort for percentile calculation
-    equities = sorted(p.final_equity for p in permutations)
-    drawdowns = sorted(p.max_drawdown_pct for p in permutations)
+    equities = np.sort(final_eqs)
+    drawdowns = np.sort(max_dds)
 
-    def percentile(data: list[float], pct: float) -> float:
+    def percentile(data: np.ndarray, pct: float) -> float:
         idx = int(len(data) * pct / 100.0)
         idx = max(0, min(idx, len(data) - 1))
-        return data[idx]
+        return float(data[idx])
 
     # Where does original fall in the distribution?
-    eq_rank = sum(1 for e in equities if e <= orig_final)
+    eq_rank = int(np.searchsorted(equities, orig_final, side="right"))
     equity_pctile = eq_rank / len(equities) * 100.0
 
     return MCResult(
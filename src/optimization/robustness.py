@@ -22,7 +22,7 @@ from src.optimization.monte_carlo import MCResult
 from src.optimization.sensitivity import SensitivityResult
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RobustnessReport:
     """Aggregated robustness assessment."""
     # Walk-Forward
@@ -14,6 +14,7 @@ Requirement: OPT-02
 
 from __future__ import annotations
 
+import functools
 import importlib
 from dataclasses import dataclass, field
 from decimal import Decimal
@@ -24,7 +25,7 @@ from src.engine import create_engine
 from src.metrics import compute as compute_metrics
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SensitivityPoint:
     """Single data point in the sensitivity grid."""
     param_name: str
@@ -36,7 +37,7 @@ class SensitivityPoint:
     max_dd_pct: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SensitivityResult:
     """Aggregate sensitivity analysis results."""
     points: list[SensitivityPoint] = field(default_factory=list)
@@ -45,6 +46,7 @@ class SensitivityResult:
     baseline_sharpe: float = 0.0
 
 
+@functools.lru_cache(maxsize=None)
 def _import_strategy_class(strategy_name: str):
     from src.dashboard.callbacks import STRATEGY_MAP
     module_path, class_name = STRATEGY_MAP[strategy_name]
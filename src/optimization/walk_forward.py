@@ -14,9 +14,11 @@ Requirement: OPT-01
 
 from __future__ import annotations
 
+import functools
 import importlib
 from dataclasses import dataclass, field
 from decimal import Decimal
+from itertools import islice
 from typing import Optional
 
 from src.data_handler import DataHandler
@@ -25,7 +27,7 @@ from src.events import MarketEvent
 from src.metrics import compute as compute_metrics, MetricsResult
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WFOWindow:
     """Results for a single walk-forward window."""
     window_idx: int
@@ -38,7 +40,7 @@ class WFOWindow:
     efficiency: float  # OOS Sharpe / IS Sharpe (capped)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WFOResult:
     """Aggregate walk-forward validation results."""
     windows: list[WFOWindow] = field(default_factory=list)
@@ -52,12 +54,25 @@ class _BarSliceHandler:
 
     This avoids re-loading CSV/API data for each walk-forward window.
     Compatible with BacktestEngine which expects .stream_bars() generator.
+
+    ``start``/``stop`` select a window of ``bars`` by index, so every
+    walk-forward window shares the one loaded list instead of copying a
+    slice of it.
     """
 
-    def __init__(self, bars: list[MarketEvent], symbol: str, timeframe: str) -> None:
+    def __init__(
+        self,
+        bars: list[MarketEvent],
+        symbol: str,
+        timeframe: str,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> None:
         self._bars = bars
         self._symbol = symbol
         self._timeframe = timeframe
+        self._start = start
+        self._stop = len(bars) if stop is None else min(stop, len(bars))
 
     @property
     def symbol(self) -> str:
@@ -68,8 +83,8 @@ class _BarSliceHandler:
         return self._timeframe
 
     def stream_bars(self):
-        for bar in self._bars:
-            yield bar
+        # C-level iteration over the window; no per-bar Python indexing.
+        yield from islice(self._bars, self._start, self._stop)
 
 
 def _load_all_bars(
@@ -92,14 +107,25 @@ def _load_all_bars(
     return list(dh.stream_bars())
 
 
+@functools.lru_cache(maxsize=None)
 def _import_strategy_class(strategy_name: str):
-    """Dynamically import a strategy class."""
+    """Dynamically import a strategy class (memoized per strategy name)."""
     from src.dashboard.callbacks import STRATEGY_MAP
     module_path, class_name = STRATEGY_MAP[strategy_name]
     module = importlib.import_module(module_path)
     return getattr(module, class_name)
 
 
+def _window_starts(
+    n_bars: int, train_bars: int, test_bars: int, step_bars: int,
+) -> range:
+    """Start index of every full train+test window, computed arithmetically."""
+    last_start = n_bars - train_bars - test_bars
+    if last_start < 0:
+        return range(0)
+    return range(0, last_start + 1, step_bars)
+
+
 def _run_on_slice(
     bars: list[MarketEvent],
     strategy_cls,
@@ -107,10 +133,12 @@ def _run_on_slice(
     timeframe: str,
     params: Optional[dict] = None,
     initial_cash: Decimal = Decimal("10000"),
+    start: int = 0,
+    stop: Optional[int] = None,
 ) -> tuple[BacktestResult, MetricsResult]:
-    """Run a backtest on a bar slice with a fresh strategy + engine."""
+    """Run a backtest on ``bars[start:stop]`` with a fresh strategy + engine."""
     strategy = strategy_cls(symbol=symbol, timeframe=timeframe, params=params)
-    handler = _BarSliceHandler(bars, symbol, timeframe)
+    handler = _BarSliceHandler(bars, symbol, timeframe, start, stop)
     engine = create_engine(
         data_handler=handler,
         strategy=strategy,
@@ -177,22 +205,21 @@ def run_walk_forward(
     strategy_cls = _import_strategy_class(strategy_name)
 
     windows: list[WFOWindow] = []
-    window_start = 0
-    window_idx = 0
+    starts = _window_starts(len(all_bars), train_bars, test_bars, step_bars)
 
-    while window_start + train_bars + test_bars <= len(all_bars):
-        train_slice = all_bars[window_start: window_start + train_bars]
+    for window_idx, window_start in enumerate(starts):
         test_start = window_start + train_bars
-        test_slice = all_bars[test_start: test_start + test_bars]
 
         # Run IS (in-sample) on training window
         _, is_metrics = _run_on_slice(
-            train_slice, strategy_cls, symbol, timeframe, params, initial_cash,
+            all_bars, strategy_cls, symbol, timeframe, params, initial_cash,
+            start=window_start, stop=test_start,
         )
 
         # Run OOS (out-of-sample) on test window
         _, oos_metrics = _run_on_slice(
-            test_slice, strategy_cls, symbol, timeframe, params, initial_cash,
+            all_bars, strategy_cls, symbol, timeframe, params, initial_cash,
+            start=test_start, stop=test_start + test_bars,
         )
 
         is_sharpe = float(is_metrics.sharpe_ratio)
@@ -211,8 +238,8 @@ def run_walk_forward(
 
         windows.append(WFOWindow(
             window_idx=window_idx,
-            train_bars=len(train_slice),
-            test_bars=len(test_slice),
+            train_bars=train_bars,
+            test_bars=test_bars,
             is_sharpe=is_sharpe,
             oos_sharpe=oos_sharpe,
             is_return=is_ret,
@@ -220,9 +247,6 @@ def run_walk_forward(
             efficiency=efficiency,
         ))
 
-        window_start += step_bars
-        window_idx += 1
-
     # Aggregate
     if windows:
         mean_oos = sum(w.oos_sharpe for w in windows) / len(windows)
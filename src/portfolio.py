@@ -12,11 +12,20 @@ Uses FIFO for multi-position PnL attribution (PORT-07).
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
 from src.events import FillEvent, MarketEvent, OrderSide
 
+# Shared constant for the per-bar mark-to-market path — avoids re-parsing
+# Decimal("0") for every position on every bar.
+_ZERO = Decimal("0")
+
+# compute_equity() memoizes its last result only for price dicts smaller
+# than this — beyond it, building the cache key costs more than it saves.
+_EQUITY_CACHE_MAX_PRICES = 16
+
 
 @dataclass
 class Position:
@@ -58,6 +67,9 @@ class Portfolio:
         self._total_realized_pnl = Decimal("0")
         self._forced_liquidation_count = 0
         self._trade_builder: Optional[object] = None  # TradeBuilder (lazy import)
+        # Bumped on every fill; keys the compute_equity() memo.
+        self._mutation_count = 0
+        self._equity_cache: Optional[tuple[tuple, Decimal]] = None
 
     # ------------------------------------------------------------------
     # Properties
@@ -71,6 +83,16 @@ class Portfolio:
     def equity_log(self) -> list[dict]:
         return list(self._equity_log)
 
+    @property
+    def latest_equity(self) -> Decimal:
+        """Most recent equity_log value, or cash before the first bar.
+
+        Avoids copying the whole log just to read its last entry.
+        """
+        if self._equity_log:
+            return self._equity_log[-1]["equity"]
+        return self._cash
+
     @property
     def fill_log(self) -> list[FillEvent]:
         return list(self._fill_log)
@@ -121,8 +143,8 @@ class Portfolio:
     ) -> Decimal:
         """Mark-to-market value of a position."""
         pos = self._positions.get(symbol)
-        if pos is None or pos.quantity == Decimal("0"):
-            return Decimal("0")
+        if pos is None or pos.quantity == _ZERO:
+            return _ZERO
 
         if pos.side == OrderSide.BUY:
             # Long: value = quantity * (current - entry)
@@ -134,15 +156,35 @@ class Portfolio:
     def compute_equity(self, prices: dict[str, Decimal]) -> Decimal:
         """Compute total equity: cash + sum of all position values.
 
+        Runs once per bar, so position values are computed inline rather
+        than via ``_compute_position_value`` to skip the second dict lookup.
+        The last result is memoized on (mutation count, prices) because
+        the engine and risk manager query the same bar's equity repeatedly.
+
         Parameters
         ----------
         prices : dict[str, Decimal]
             Current prices per symbol.
         """
+        key = None
+        if len(prices) < _EQUITY_CACHE_MAX_PRICES:
+            key = (self._mutation_count, tuple(prices.items()))
+            cached = self._equity_cache
+            if cached is not None and cached[0] == key:
+                return cached[1]
+
         total = self._cash
         for symbol, pos in self._positions.items():
-            if symbol in prices and pos.quantity > Decimal("0"):
-                total += self._compute_position_value(symbol, prices[symbol])
+            price = prices.get(symbol)
+            if price is None or pos.quantity <= _ZERO:
+                continue
+            if pos.side == OrderSide.BUY:
+                total += pos.quantity * (price - pos.avg_entry_price)
+            else:
+                total += pos.quantity * (pos.avg_entry_price - price)
+
+        if key is not None:
+            self._equity_cache = (key, total)
         return total
 
     # ------------------------------------------------------------------
@@ -187,6 +229,9 @@ class Portfolio:
         total_cost = fill.commission + fill.spread_cost
         symbol = fill.symbol
 
+        # Invalidate the equity memo before touching cash or positions, so
+        # a fill that fails partway cannot leave a stale cached equity.
+        self._mutation_count += 1
         if fill.side == OrderSide.BUY:
             self._process_buy(fill, total_cost)
         else:
@@ -328,46 +373,50 @@ class Portfolio:
         """Check margin requirement, return symbols needing liquidation.
 
         Triggers when position value exceeds equity / margin_requirement.
+        Equity and per-symbol notional are gathered in one pass over the
+        positions instead of a compute_equity() pass plus a margin pass.
         """
-        equity = self.compute_equity(prices)
-        to_liquidate: list[str] = []
+        equity = self._cash
+        notionals: list[tuple[str, Decimal]] = []
 
         for symbol, pos in self._positions.items():
-            if pos.quantity == Decimal("0"):
+            price = prices.get(symbol)
+            if price is None or pos.quantity <= _ZERO:
                 continue
-            if symbol not in prices:
-                continue
-
-            position_value = abs(pos.quantity * prices[symbol])
-            required_equity = position_value * self._margin_requirement
-
-            if equity < required_equity:
-                to_liquidate.append(symbol)
+            if pos.side == OrderSide.BUY:
+                equity += pos.quantity * (price - pos.avg_entry_price)
+            else:
+                equity += pos.quantity * (pos.avg_entry_price - price)
+            notionals.append((symbol, abs(pos.quantity * price)))
 
-        return to_liquidate
+        margin = self._margin_requirement
+        return [
+            symbol for symbol, position_value in notionals
+            if equity < position_value * margin
+        ]
 
     def force_liquidate(
         self, symbol: str, current_price: Decimal,
     ) -> Optional[FillEvent]:
         """Force-close a position at current price (PORT-05)."""
         pos = self._positions.get(symbol)
-        if pos is None or pos.quantity == Decimal("0"):
+        if pos is None or pos.quantity == _ZERO:
             return None
 
         self._forced_liquidation_count += 1
 
-        # Create a fill to close the position
+        # Create a fill to close the position — the whole quantity is
+        # closed in one fill against the averaged entry price.
         close_side = OrderSide.SELL if pos.side == OrderSide.BUY else OrderSide.BUY
-        from datetime import datetime
         fill = FillEvent(
             symbol=symbol,
             timestamp=datetime.now(),
             side=close_side,
             quantity=pos.quantity,
             fill_price=current_price,
-            commission=Decimal("0"),
-            slippage=Decimal("0"),
-            spread_cost=Decimal("0"),
+            commission=_ZERO,
+            slippage=_ZERO,
+            spread_cost=_ZERO,
         )
         self.process_fill(fill)
         return fill
@@ -30,6 +30,11 @@ from src.execution import ExecutionHandler
 from src.metrics import compute as compute_metrics, MetricsResult
 from src.portfolio import Portfolio
 from src.strategy.base import BaseStrategy
+from src.trade_pnl import pair_fills_to_scaled_pnls
+
+_ZERO = Decimal("0")
+# Fraction of equity a full-weight (1.0) strategy commits per entry
+_SIZING_PCT = Decimal("0.10")
 
 
 @dataclass
@@ -94,6 +99,10 @@ class PortfolioRouter:
     ) -> None:
         self._strategies = strategies
         self._weights = weights
+        # Decimal weights parsed once instead of on every signal
+        self._decimal_weights: dict[str, Decimal] = {
+            name: Decimal(str(w)) for name, w in weights.items()
+        }
         self._data_handler = data_handler
         self._portfolio = Portfolio(
             initial_cash=initial_cash,
@@ -180,11 +189,11 @@ class PortfolioRouter:
         strategy_name: str,
     ) -> Optional[OrderEvent]:
         """Convert signal to order with weight-adjusted sizing."""
-        weight = Decimal(str(self._weights.get(strategy_name, 0.0)))
+        weight = self._decimal_weights.get(strategy_name, _ZERO)
 
         if signal.signal_type == SignalType.LONG:
             quantity = self._calculate_weighted_quantity(bar, weight)
-            if quantity <= Decimal("0"):
+            if quantity <= _ZERO:
                 return None
             valid, _ = self._portfolio.validate_order(
                 bar.symbol, OrderSide.BUY, quantity, bar.close, bar.volume,
@@ -203,7 +212,7 @@ class PortfolioRouter:
 
         elif signal.signal_type == SignalType.SHORT:
             quantity = self._calculate_weighted_quantity(bar, weight)
-            if quantity <= Decimal("0"):
+            if quantity <= _ZERO:
                 return None
             self._position_owner[signal.symbol] = strategy_name
             return OrderEvent(
@@ -217,7 +226,7 @@ class PortfolioRouter:
 
         elif signal.signal_type == SignalType.EXIT:
             pos = self._portfolio.positions.get(signal.symbol)
-            if pos is None or pos.quantity <= Decimal("0"):
+            if pos is None or pos.quantity <= _ZERO:
                 return None
             close_side = (
                 OrderSide.SELL if pos.side == OrderSide.BUY else OrderSide.BUY
@@ -237,39 +246,23 @@ class PortfolioRouter:
         self, bar: MarketEvent, weight: Decimal,
     ) -> Decimal:
         """Calculate position size adjusted by strategy weight."""
-        equity_log = self._portfolio.equity_log
-        if equity_log:
-            equity = equity_log[-1]["equity"]
-        else:
-            equity = self._portfolio.cash
+        # A non-positive weight or price can never size a position: one
+        # guard up front skips the equity lookup and Decimal math.
+        if weight <= _ZERO or bar.close <= _ZERO:
+            return _ZERO
 
-        if bar.close <= Decimal("0"):
-            return Decimal("0")
+        equity = self._portfolio.latest_equity
 
-        # Weight-adjusted: weight * 10% of equity / price
-        quantity = (weight * equity * Decimal("0.10")) / bar.close
-        return Decimal(str(int(quantity)))
+        # Weight-adjusted: weight * 10% of equity / price, whole shares
+        # (integer division truncates toward zero, like int()).
+        return (weight * equity * _SIZING_PCT) // bar.close
 
     @staticmethod
     def _compute_strategy_pnl(fills: list[FillEvent]) -> Decimal:
-        """Compute net PnL from a list of fills."""
-        pnl = Decimal("0")
-        open_fill: Optional[FillEvent] = None
-
-        for fill in fills:
-            if open_fill is None:
-                open_fill = fill
-            else:
-                if fill.side != open_fill.side:
-                    if open_fill.side == OrderSide.BUY:
-                        trade_pnl = (fill.fill_price - open_fill.fill_price) * open_fill.quantity
-                    else:
-                        trade_pnl = (open_fill.fill_price - fill.fill_price) * open_fill.quantity
-                    trade_pnl -= (open_fill.commission + open_fill.slippage + open_fill.spread_cost)
-                    trade_pnl -= (fill.commission + fill.slippage + fill.spread_cost)
-                    pnl += trade_pnl
-                    open_fill = None
-                else:
-                    open_fill = fill
-
-        return pnl
+        """Compute net PnL from a list of fills.
+
+        Fills are paired entry/exit by ``pair_fills_to_scaled_pnls``: the
+        sum runs on Python ints and is converted to Decimal once, exactly.
+        """
+        scaled_pnls, scale = pair_fills_to_scaled_pnls(fills)
+        return Decimal(sum(scaled_pnls)).scaleb(-scale)
@@ -15,71 +15,121 @@ Requirement: RPT-01, RPT-02, RPT-03
 from __future__ import annotations
 
 import base64
+import functools
+import gzip
 from datetime import datetime
 from decimal import Decimal
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import jinja2
-import plotly.graph_objects as go
 
-from src.engine import BacktestResult
 from src.events import FillEvent, OrderSide
-from src.metrics import MetricsResult
+from src.trade_pnl import pair_fills_to_scaled_pnls
+
+if TYPE_CHECKING:
+    # Annotation-only imports. Plotly and the engine (pandas) are
+    # imported where they are used, so that importing this module stays
+    # cheap.
+    import plotly.graph_objects as go
+
+    from src.engine import BacktestResult
+    from src.metrics import MetricsResult
 
 
 # Default template directory
 _TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
 
+# Shared environment for the built-in template: parsed and compiled once
+# per process. The shipped template never changes at runtime, so the
+# per-render mtime check (a stat() per get_template) is skipped; code that
+# swaps report.html in a running process must call _ENV.cache.clear().
+_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(str(_TEMPLATE_DIR)),
+    autoescape=True,
+    auto_reload=False,
+    cache_size=-1,
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _template_env(template_dir: str) -> jinja2.Environment:
+    """Jinja2 environment for a custom template directory.
+
+    Cached per (resolved) directory so repeated reports reuse the compiled
+    template. ``auto_reload`` stays on: user templates may be edited
+    between runs, and an mtime check is far cheaper than a recompile.
+    """
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(template_dir),
+        autoescape=True,
+        cache_size=-1,
+    )
+
+
+def _load_template(template_path: Optional[str]) -> jinja2.Template:
+    """Return the compiled report template (built-in if no path given)."""
+    if not template_path:
+        return _ENV.get_template("report.html")
+    path = Path(template_path).resolve()
+    return _template_env(str(path.parent)).get_template(path.name)
+
 
 def _pair_fills_to_trades(fills: list[FillEvent]) -> list[dict]:
-    """Extract round-trip trades from fill log for the trade table."""
+    """Extract round-trip trades from fill log for the trade table.
+
+    Fills pair up exactly as in ``pair_fills_to_scaled_pnls``, so the
+    PnLs come from that scaled-integer pass: exact, with one int to
+    float division per trade instead of a Decimal expression.
+    """
+    scaled_pnls, scale = pair_fills_to_scaled_pnls(fills)
+    divisor = 10 ** scale
+    pnls = iter(scaled_pnls)
+
     trades: list[dict] = []
     open_fill: Optional[FillEvent] = None
 
     for fill in fills:
-        if open_fill is None:
+        if open_fill is None or fill.side == open_fill.side:
             open_fill = fill
-        else:
-            if fill.side != open_fill.side:
-                if open_fill.side == OrderSide.BUY:
-                    pnl = float(
-                        (fill.fill_price - open_fill.fill_price) * open_fill.quantity
-                        - open_fill.commission - open_fill.slippage - open_fill.spread_cost
-                        - fill.commission - fill.slippage - fill.spread_cost
-                    )
-                    side = "LONG"
-                else:
-                    pnl = float(
-                        (open_fill.fill_price - fill.fill_price) * open_fill.quantity
-                        - open_fill.commission - open_fill.slippage - open_fill.spread_cost
-                        - fill.commission - fill.slippage - fill.spread_cost
-                    )
-                    side = "SHORT"
-
-                trades.append({
-                    "entry_time": open_fill.timestamp.strftime("%Y-%m-%d %H:%M"),
-                    "side": side,
-                    "quantity": float(open_fill.quantity),
-                    "entry_price": float(open_fill.fill_price),
-                    "exit_price": float(fill.fill_price),
-                    "pnl": pnl,
-                })
-                open_fill = None
-            else:
-                open_fill = fill
+            continue
+
+        trades.append({
+            "entry_time": open_fill.timestamp.strftime("%Y-%m-%d %H:%M"),
+            "side": "LONG" if open_fill.side == OrderSide.BUY else "SHORT",
+            "quantity": float(open_fill.quantity),
+            "entry_price": float(open_fill.fill_price),
+            "exit_price": float(fill.fill_price),
+            "pnl": next(pnls) / divisor,
+        })
+        open_fill = None
 
     return trades
 
 
+def _equity_columns(equity_log: list[dict]) -> tuple[list[str], list[float]]:
+    """Timestamp and equity columns of an equity log, ready for Plotly.
+
+    Timestamps are passed as ISO strings, which serialize to the same JSON
+    as datetimes but are immutable atoms: Plotly deep-copies trace data on
+    every ``to_dict``/``to_html``, and copying datetime objects dominated
+    figure serialization. The strings also go straight through orjson
+    (pandas Timestamps would fall back to Plotly's slow cleaning pass).
+    """
+    timestamps = [e["timestamp"].isoformat() for e in equity_log]
+    equities = [float(e["equity"]) for e in equity_log]
+    return timestamps, equities
+
+
 def _build_equity_figure(equity_log: list[dict]) -> go.Figure:
     """Build equity curve figure."""
+    import plotly.graph_objects as go
+
     if not equity_log:
         return go.Figure()
 
-    timestamps = [e["timestamp"] for e in equity_log]
-    equities = [float(e["equity"]) for e in equity_log]
+    timestamps, equities = _equity_columns(equity_log)
 
     fig = go.Figure()
     fig.add_trace(go.Scatter(
@@ -100,23 +150,24 @@ def _build_equity_figure(equity_log: list[dict]) -> go.Figure:
 
 def _build_drawdown_figure(equity_log: list[dict]) -> go.Figure:
     """Build drawdown chart."""
+    import numpy as np
+    import plotly.graph_objects as go
+
     if not equity_log:
         return go.Figure()
 
-    timestamps = [e["timestamp"] for e in equity_log]
-    equities = [float(e["equity"]) for e in equity_log]
+    timestamps, equities = _equity_columns(equity_log)
 
-    peak = equities[0]
-    drawdowns = []
-    for eq in equities:
-        if eq > peak:
-            peak = eq
-        dd = (eq - peak) / peak * 100 if peak > 0 else 0
-        drawdowns.append(dd)
+    # Drawdown % from the running peak, in one pass; 0 while peak <= 0
+    equity = np.array(equities)
+    peaks = np.maximum.accumulate(equity)
+    drawdowns = np.zeros_like(equity)
+    np.divide(equity - peaks, peaks, out=drawdowns, where=peaks > 0)
+    drawdowns *= 100
 
     fig = go.Figure()
     fig.add_trace(go.Scatter(
-        x=timestamps, y=drawdowns,
+        x=timestamps, y=drawdowns.tolist(),
         mode="lines", name="Drawdown %",
         line=dict(color="#dc3545", width=2),
         fill="tozeroy", fillcolor="rgba(220,53,69,0.15)",
@@ -147,6 +198,28 @@ def _fig_to_base64_png(fig: go.Figure, width: int = 900, height: int = 400) -> s
         return ""
 
 
+def _write_report(path: str, content: str, compress: bool = False) -> str:
+    """Write rendered report content to ``path`` as UTF-8.
+
+    Encoded once and written in binary mode, bypassing the text-layer
+    chunked encoding and newline translation. Gzipped (level 6) when
+    ``compress`` is set or ``path`` ends in ``.gz``; the embedded Plotly
+    JSON makes reports compress very well. A compressed report always
+    gets a ``.gz`` suffix, appended if ``path`` lacks one.
+
+    Returns the path actually written.
+    """
+    data = content.encode("utf-8")
+    if compress or path.endswith(".gz"):
+        if not path.endswith(".gz"):
+            path += ".gz"
+        with gzip.open(path, "wb", compresslevel=6) as f:
+            f.write(data)
+    else:
+        Path(path).write_bytes(data)
+    return path
+
+
 def generate_report(
     result: BacktestResult,
     metrics: MetricsResult,
@@ -160,6 +233,7 @@ def generate_report(
     show_sections: Optional[dict[str, bool]] = None,
     robustness: Optional[Any] = None,
     output_path: Optional[str] = None,
+    compress: bool = False,
 ) -> str:
     """Generate a backtest report.
 
@@ -189,28 +263,17 @@ def generate_report(
         RobustnessReport for robustness section.
     output_path : Optional[str]
         If provided, write the report to this file path.
+    compress : bool
+        Gzip the written file, appending ``.gz`` to ``output_path`` if it
+        lacks the suffix. Implied when ``output_path`` ends in ``.gz``.
 
     Returns
     -------
     str
         The rendered report content (HTML string or PDF file path).
     """
-    # Load template
-    if template_path:
-        template_dir = str(Path(template_path).parent)
-        template_name = Path(template_path).name
-        env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(template_dir),
-            autoescape=True,
-        )
-    else:
-        env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(str(_TEMPLATE_DIR)),
-            autoescape=True,
-        )
-        template_name = "report.html"
-
-    template = env.get_template(template_name)
+    # Load template (compiled once and cached, see _load_template)
+    template = _load_template(template_path)
 
     # Section visibility
     sections = {
@@ -291,11 +354,12 @@ def generate_report(
             weasyprint.HTML(string=html_content).write_pdf(pdf_path)
         except ImportError:
             # WeasyPrint not available — save HTML with note
-            pdf_path = pdf_path.replace(".pdf", ".html")
-            Path(pdf_path).write_text(html_content, encoding="utf-8")
+            pdf_path = _write_report(
+                pdf_path.replace(".pdf", ".html"), html_content, compress,
+            )
         return pdf_path
 
     if output_path:
-        Path(output_path).write_text(html_content, encoding="utf-8")
+        _write_report(output_path, html_content, compress)
 
     return html_content
@@ -11,7 +11,9 @@ Provides:
 
 from __future__ import annotations
 
+from collections import deque
 from decimal import Decimal
+from itertools import islice
 from typing import Optional
 
 from src.events import FillEvent, MarketEvent, OrderSide
@@ -27,7 +29,8 @@ class KellyCriterion:
     Parameters
     ----------
     lookback : int
-        Rolling window of round-trip trades (default 40).
+        Rolling window of round-trip trades (default 40). 0 uses every
+        trade; negative values are rejected.
     fraction : Decimal
         Kelly fraction — 0.5 = Half-Kelly (default).
     min_trades : int
@@ -43,6 +46,8 @@ class KellyCriterion:
         min_trades: int = 20,
         max_kelly_pct: Decimal = Decimal("0.05"),
     ) -> None:
+        if lookback < 0:
+            raise ValueError(f"lookback must be >= 0, got {lookback}")
         self._lookback = lookback
         self._fraction = fraction
         self._min_trades = min_trades
@@ -50,16 +55,22 @@ class KellyCriterion:
         self._win_rate: Decimal = Decimal("0")
         self._win_loss_ratio: Decimal = Decimal("0")
         self._trade_count: int = 0
+        # Incremental round-trip extraction state (see _extend_pnls)
+        # lookback=0 keeps every trade (unbounded window)
+        self._pnls: deque[Decimal] = deque(maxlen=lookback or None)
+        self._open_fills: dict[str, deque[FillEvent]] = {}
+        self._fills_seen: int = 0
+        self._last_fill: Optional[FillEvent] = None
 
     def update(self, fill_log: list[FillEvent]) -> None:
         """Extract round-trip PnLs from fill_log and compute stats."""
-        pnls = self._extract_round_trip_pnls(fill_log)
-        if not pnls:
+        self._extend_pnls(fill_log)
+        if not self._pnls:
             self._trade_count = 0
             return
 
         # Use last N round-trips
-        recent = pnls[-self._lookback:]
+        recent = list(self._pnls)
         self._trade_count = len(recent)
 
         wins = [p for p in recent if p > Decimal("0")]
@@ -93,38 +104,53 @@ class KellyCriterion:
 
         return adjusted
 
-    @staticmethod
-    def _extract_round_trip_pnls(fill_log: list[FillEvent]) -> list[Decimal]:
-        """Extract PnLs from fill pairs (open + close)."""
-        pnls: list[Decimal] = []
-        open_fills: dict[str, list[FillEvent]] = {}
-
-        for fill in fill_log:
-            symbol = fill.symbol
-            if symbol not in open_fills:
-                open_fills[symbol] = []
-
-            stack = open_fills[symbol]
-            if not stack:
-                stack.append(fill)
-            elif stack[0].side == fill.side:
-                # Same direction — adding to position
-                stack.append(fill)
-            else:
-                # Opposite direction — closing
-                open_fill = stack.pop(0)
-                if open_fill.side == OrderSide.BUY:
-                    pnl = (fill.fill_price - open_fill.fill_price) * min(
-                        open_fill.quantity, fill.quantity,
-                    )
-                else:
-                    pnl = (open_fill.fill_price - fill.fill_price) * min(
-                        open_fill.quantity, fill.quantity,
-                    )
-                pnl -= fill.commission + open_fill.commission
-                pnls.append(pnl)
-
-        return pnls
+    def _extend_pnls(self, fill_log: list[FillEvent]) -> None:
+        """Pair the fills not seen by earlier calls into round-trip PnLs.
+
+        RiskManager passes the portfolio's whole fill log on every sizing
+        call, and that log only ever grows by appending. When ``fill_log``
+        still ends its previously seen prefix with the same fill object,
+        only the new fills are paired; otherwise the state is reset and
+        the log is paired from the start. Only the last ``lookback`` PnLs
+        are kept, which is all ``update`` reads.
+        """
+        seen = self._fills_seen
+        if seen > len(fill_log) or (
+            seen and fill_log[seen - 1] is not self._last_fill
+        ):
+            self._pnls.clear()
+            self._open_fills.clear()
+            seen = 0
+
+        for fill in islice(fill_log, seen, None):
+            self._pair_fill(fill)
+
+        self._fills_seen = len(fill_log)
+        self._last_fill = fill_log[-1] if fill_log else None
+
+    def _pair_fill(self, fill: FillEvent) -> None:
+        """Open, add to, or close a position with one fill (FIFO)."""
+        stack = self._open_fills.get(fill.symbol)
+        if stack is None:
+            stack = self._open_fills[fill.symbol] = deque()
+
+        if not stack or stack[0].side == fill.side:
+            # Opening, or same direction — adding to position
+            stack.append(fill)
+            return
+
+        # Opposite direction — closing
+        open_fill = stack.popleft()
+        if open_fill.side == OrderSide.BUY:
+            pnl = (fill.fill_price - open_fill.fill_price) * min(
+                open_fill.quantity, fill.quantity,
+            )
+        else:
+            pnl = (open_fill.fill_price - fill.fill_price) * min(
+                open_fill.quantity, fill.quantity,
+            )
+        pnl -= fill.commission + open_fill.commission
+        self._pnls.append(pnl)
 
 
 # ---------------------------------------------------------------------------
@@ -215,17 +241,37 @@ class DrawdownScaler:
         self._max_drawdown_pct = max_drawdown_pct
         self._full_stop_pct = full_stop_pct
         self._min_scale = min_scale
+        # Running peak over the entries scanned so far (see compute_scale)
+        self._peak: Decimal = Decimal("0")
+        self._entries_seen: int = 0
+        self._last_entry: Optional[dict] = None
 
     def compute_scale(self, equity_log: list[dict]) -> Decimal:
-        """Compute position scale factor based on current drawdown."""
+        """Compute position scale factor based on current drawdown.
+
+        The equity peak is kept across calls: when ``equity_log`` extends
+        the log seen last time (same entry object at the end of the seen
+        prefix, as with the append-only portfolio log or its prefixes),
+        only the new entries are scanned. Any other log is rescanned.
+        """
         if not equity_log:
             return Decimal("1")
 
-        peak = Decimal("0")
-        for entry in equity_log:
+        seen = self._entries_seen
+        if seen > len(equity_log) or (
+            seen and equity_log[seen - 1] is not self._last_entry
+        ):
+            self._peak = Decimal("0")
+            seen = 0
+
+        peak = self._peak
+        for entry in islice(equity_log, seen, None):
             eq = entry["equity"]
             if eq > peak:
                 peak = eq
+        self._peak = peak
+        self._entries_seen = len(equity_log)
+        self._last_entry = equity_log[-1]
 
         if peak <= Decimal("0"):
             return Decimal("1")
@@ -0,0 +1,65 @@
+"""
+_kernels.py — Optional Numba kernel for the breakout channel scan.
+
+BreakoutStrategy needs the highest high, lowest low and mean volume of
+the ``lookback`` bars before the current one, on every bar. As three
+NumPy reductions over short slices that is dominated by per-call
+overhead; with numba installed the three are fused into one @njit loop.
+Without numba the NumPy slice form is used.
+
+Inputs are the float64 columns from ``BaseStrategy.price_arrays()``.
+Max/min are exact either way, and volumes are whole numbers, so the
+mean is the same whichever path runs.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+
+
+def channel_stats_py(
+    high: np.ndarray,
+    low: np.ndarray,
+    volume: np.ndarray,
+    lookback: int,
+) -> tuple[float, float, float]:
+    """(max high, min low, mean volume) of the ``lookback`` bars before the last."""
+    n = high.shape[0]
+    start = n - lookback - 1
+    channel_high = high[start]
+    channel_low = low[start]
+    volume_sum = 0.0
+    for i in range(start, n - 1):
+        if high[i] > channel_high:
+            channel_high = high[i]
+        if low[i] < channel_low:
+            channel_low = low[i]
+        volume_sum += volume[i]
+    return channel_high, channel_low, volume_sum / lookback
+
+
+def _channel_stats_np(
+    high: np.ndarray,
+    low: np.ndarray,
+    volume: np.ndarray,
+    lookback: int,
+) -> tuple[float, float, float]:
+    """NumPy form of ``channel_stats_py``, used when numba is missing."""
+    window = slice(-(lookback + 1), -1)
+    return (
+        float(high[window].max()),
+        float(low[window].min()),
+        float(volume[window].mean()),
+    )
+
+
+if NUMBA_AVAILABLE:
+    channel_stats = njit(cache=True)(channel_stats_py)
+else:  # pragma: no cover - exercised only without numba
+    channel_stats = _channel_stats_np
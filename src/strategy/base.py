@@ -3,6 +3,7 @@ base.py — Abstract base class for all backtesting strategies.
 
 Provides:
 - Rolling buffer of historical bars (structurally prevents future access)
+- Column (structure-of-arrays) float64 view of the same bars for indicators
 - Parameter injection via constructor kwargs
 - Abstract calculate_signals() hook that concrete strategies must implement
 
@@ -14,6 +15,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Optional
 
+import numpy as np
+
 from src.events import MarketEvent, SignalEvent
 
 
@@ -41,6 +44,12 @@ class BaseStrategy(ABC):
         self._params: dict = dict(params) if params else {}
         self._bar_buffer: list[MarketEvent] = []
 
+        # OHLCV columns of the same window, one float64 row per field.
+        # Twice the window size so compaction only runs every
+        # ``max_buffer_size`` bars.
+        self._price_buf = np.empty((5, 2 * max_buffer_size), dtype=np.float64)
+        self._price_end = 0
+
     # ------------------------------------------------------------------
     # Properties
     # ------------------------------------------------------------------
@@ -71,7 +80,37 @@ class BaseStrategy(ABC):
         """Append a bar to the rolling buffer, trimming oldest if needed."""
         self._bar_buffer.append(event)
         if len(self._bar_buffer) > self._max_buffer_size:
-            self._bar_buffer = self._bar_buffer[-self._max_buffer_size:]
+            # Trim in place: no new list and no refcount pass over the window
+            del self._bar_buffer[:-self._max_buffer_size]
+
+        buf = self._price_buf
+        end = self._price_end
+        if end == buf.shape[1]:
+            # Move the newest max_buffer_size - 1 bars to the front
+            keep = self._max_buffer_size - 1
+            buf[:, :keep] = buf[:, end - keep:end]
+            end = keep
+        buf[0, end] = event.open_f
+        buf[1, end] = event.high_f
+        buf[2, end] = event.low_f
+        buf[3, end] = event.close_f
+        buf[4, end] = event.volume
+        self._price_end = end + 1
+
+    def price_arrays(
+        self,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return (open, high, low, close, volume) of the buffer as float64.
+
+        The arrays are read-only views aligned with ``self.bars`` (oldest
+        first). They are only valid until the next ``update_buffer`` call;
+        copy them to keep values across bars.
+        """
+        end = self._price_end
+        start = max(0, end - self._max_buffer_size)
+        window = self._price_buf[:, start:end]
+        window.flags.writeable = False
+        return window[0], window[1], window[2], window[3], window[4]
 
     # ------------------------------------------------------------------
     # Abstract hook
@@ -18,8 +18,12 @@ import pandas as pd
 import pandas_ta as ta
 
 from src.events import MarketEvent, SignalEvent, SignalType
+from src.strategy import _kernels
 from src.strategy.base import BaseStrategy
 
+# Fixed signal strengths, parsed once.
+_EXIT_STRENGTH = Decimal("0.5")
+
 
 class BreakoutStrategy(BaseStrategy):
     """Donchian Channel Breakout strategy with ATR filter.
@@ -57,20 +61,19 @@ class BreakoutStrategy(BaseStrategy):
         self.update_buffer(event)
 
         min_bars = self._lookback + 1
-        if len(self.bars) < min_bars:
+        if len(self._bar_buffer) < min_bars:
             return None
 
-        # Use lookback period (excluding current bar) for channel
-        lookback_bars = self._bar_buffer[-(self._lookback + 1):-1]
-        channel_high = max(float(b.high) for b in lookback_bars)
-        channel_low = min(float(b.low) for b in lookback_bars)
+        # Use lookback period (excluding current bar) for channel, plus the
+        # average volume for confirmation, in one scan of the float64 columns
+        _, highs, lows, _, volumes = self.price_arrays()
+        channel_high, channel_low, avg_volume = _kernels.channel_stats(
+            highs, lows, volumes, self._lookback,
+        )
 
-        current_close = float(event.close)
+        current_close = event.close_f
         current_volume = event.volume
 
-        # Average volume for confirmation
-        avg_volume = sum(b.volume for b in lookback_bars) / len(lookback_bars)
-
         # Exit logic — price back inside channel
         if self._in_position == "long" and current_close < channel_low:
             self._in_position = ""
@@ -78,7 +81,7 @@ class BreakoutStrategy(BaseStrategy):
                 symbol=event.symbol,
                 timestamp=event.timestamp,
                 signal_type=SignalType.EXIT,
-                strength=Decimal("0.5"),
+                strength=_EXIT_STRENGTH,
             )
         if self._in_position == "short" and current_close > channel_high:
             self._in_position = ""
@@ -86,7 +89,7 @@ class BreakoutStrategy(BaseStrategy):
                 symbol=event.symbol,
                 timestamp=event.timestamp,
                 signal_type=SignalType.EXIT,
-                strength=Decimal("0.5"),
+                strength=_EXIT_STRENGTH,
             )
 
         # Entry logic — breakout with volume confirmation
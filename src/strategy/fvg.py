@@ -19,6 +19,10 @@ from typing import Optional
 from src.events import MarketEvent, SignalEvent, SignalType
 from src.strategy.base import BaseStrategy
 
+# Fixed signal strengths, parsed once.
+_ENTRY_STRENGTH = Decimal("0.7")
+_EXIT_STRENGTH = Decimal("0.5")
+
 
 @dataclass
 class FVGZone:
@@ -108,7 +112,7 @@ class FVGStrategy(BaseStrategy):
                             symbol=event.symbol,
                             timestamp=event.timestamp,
                             signal_type=SignalType.LONG,
-                            strength=Decimal("0.7"),
+                            strength=_ENTRY_STRENGTH,
                         )
 
             # Bearish FVG: SHORT when price rises into gap zone
@@ -121,7 +125,7 @@ class FVGStrategy(BaseStrategy):
                             symbol=event.symbol,
                             timestamp=event.timestamp,
                             signal_type=SignalType.SHORT,
-                            strength=Decimal("0.7"),
+                            strength=_ENTRY_STRENGTH,
                         )
 
         # Remove filled gaps
@@ -145,7 +149,7 @@ class FVGStrategy(BaseStrategy):
                         symbol=event.symbol,
                         timestamp=event.timestamp,
                         signal_type=SignalType.EXIT,
-                        strength=Decimal("0.5"),
+                        strength=_EXIT_STRENGTH,
                     )
 
         if self._in_position == "short":
@@ -157,7 +161,7 @@ class FVGStrategy(BaseStrategy):
                         symbol=event.symbol,
                         timestamp=event.timestamp,
                         signal_type=SignalType.EXIT,
-                        strength=Decimal("0.5"),
+                        strength=_EXIT_STRENGTH,
                     )
 
         # Detect new FVG zones
@@ -9,10 +9,13 @@ Requirement: REG-02
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from decimal import Decimal
 from enum import Enum
+from typing import Optional
 
 from src.events import MarketEvent
+from src.strategy.regime.atr_regime import true_range
 
 
 class TrendStrength(Enum):
@@ -22,6 +25,21 @@ class TrendStrength(Enum):
     STRONG_TREND = "STRONG_TREND"
 
 
+_ZERO = Decimal("0")
+_ONE = Decimal("1")
+_HUNDRED = Decimal("100")
+
+# Lower bounds of each bucket above RANGING, parsed once at import.
+# bisect_right maps an ADX equal to a bound into the upper bucket.
+_TREND_THRESHOLDS = (Decimal("20"), Decimal("25"), Decimal("40"))
+_TREND_LABELS = (
+    TrendStrength.RANGING,
+    TrendStrength.WEAK_TREND,
+    TrendStrength.TRENDING,
+    TrendStrength.STRONG_TREND,
+)
+
+
 class ADXClassifier:
     """Compute Wilder's ADX and classify trend strength.
 
@@ -37,6 +55,9 @@ class ADXClassifier:
 
     def __init__(self, period: int = 14) -> None:
         self._period = period
+        # Decimal forms of the period, used by every Wilder smoothing step
+        self._period_d = Decimal(period)
+        self._period_minus_one = self._period_d - _ONE
 
         # Phase A accumulators
         self._raw_tr: list[Decimal] = []
@@ -81,12 +102,22 @@ class ADXClassifier:
     # Update
     # ------------------------------------------------------------------
 
-    def update(self, bar: MarketEvent, prev_bar: MarketEvent) -> Decimal:
-        """Feed a new bar pair and return current ADX value."""
+    def update(
+        self,
+        bar: MarketEvent,
+        prev_bar: MarketEvent,
+        tr: Optional[Decimal] = None,
+    ) -> Decimal:
+        """Feed a new bar pair and return current ADX value.
+
+        ``tr`` may be passed in when the caller has already computed the
+        True Range of this bar pair.
+        """
         self._bar_count += 1
 
         # Compute True Range, +DM, -DM
-        tr = self._true_range(bar, prev_bar)
+        if tr is None:
+            tr = true_range(bar, prev_bar.close)
         plus_dm, minus_dm = self._directional_movement(bar, prev_bar)
 
         if not self._phase_a_done:
@@ -97,15 +128,11 @@ class ADXClassifier:
         return self._adx
 
     def classify(self) -> TrendStrength:
-        """Classify current ADX into trend-strength bucket."""
-        if self._adx < Decimal("20"):
-            return TrendStrength.RANGING
-        elif self._adx < Decimal("25"):
-            return TrendStrength.WEAK_TREND
-        elif self._adx < Decimal("40"):
-            return TrendStrength.TRENDING
-        else:
-            return TrendStrength.STRONG_TREND
+        """Classify current ADX into trend-strength bucket.
+
+        <20 RANGING, <25 WEAK_TREND, <40 TRENDING, else STRONG_TREND.
+        """
+        return _TREND_LABELS[bisect_right(_TREND_THRESHOLDS, self._adx)]
 
     # ------------------------------------------------------------------
     # Phase A — Initial accumulation
@@ -146,7 +173,7 @@ class ADXClassifier:
         self, tr: Decimal, plus_dm: Decimal, minus_dm: Decimal,
     ) -> None:
         """Apply Wilder's smoothing and update ADX."""
-        p = Decimal(str(self._period))
+        p = self._period_d
 
         # Wilder's smoothing: Smooth = Smooth - Smooth/period + new_value
         self._smooth_tr = self._smooth_tr - self._smooth_tr / p + tr
@@ -165,21 +192,12 @@ class ADXClassifier:
                 self._dx_accumulator.clear()
         else:
             # ADX smoothing: ADX = (ADX * (period-1) + DX) / period
-            self._adx = (self._adx * (p - Decimal("1")) + dx) / p
+            self._adx = (self._adx * self._period_minus_one + dx) / p
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _true_range(bar: MarketEvent, prev_bar: MarketEvent) -> Decimal:
-        """Compute True Range."""
-        return max(
-            bar.high - bar.low,
-            abs(bar.high - prev_bar.close),
-            abs(bar.low - prev_bar.close),
-        )
-
     @staticmethod
     def _directional_movement(
         bar: MarketEvent, prev_bar: MarketEvent,
@@ -188,23 +206,23 @@ class ADXClassifier:
         up_move = bar.high - prev_bar.high
         down_move = prev_bar.low - bar.low
 
-        plus_dm = up_move if (up_move > down_move and up_move > 0) else Decimal("0")
-        minus_dm = down_move if (down_move > up_move and down_move > 0) else Decimal("0")
+        plus_dm = up_move if (up_move > down_move and up_move > 0) else _ZERO
+        minus_dm = down_move if (down_move > up_move and down_move > 0) else _ZERO
 
         return plus_dm, minus_dm
 
     def _update_di(self) -> None:
         """Compute +DI and -DI from smoothed values."""
         if self._smooth_tr == 0:
-            self._plus_di = Decimal("0")
-            self._minus_di = Decimal("0")
+            self._plus_di = _ZERO
+            self._minus_di = _ZERO
             return
-        self._plus_di = (self._smooth_plus_dm / self._smooth_tr) * Decimal("100")
-        self._minus_di = (self._smooth_minus_dm / self._smooth_tr) * Decimal("100")
+        self._plus_di = (self._smooth_plus_dm / self._smooth_tr) * _HUNDRED
+        self._minus_di = (self._smooth_minus_dm / self._smooth_tr) * _HUNDRED
 
     def _compute_dx(self) -> Decimal:
         """Compute DX from +DI and -DI."""
         di_sum = self._plus_di + self._minus_di
         if di_sum == 0:
-            return Decimal("0")
-        return (abs(self._plus_di - self._minus_di) / di_sum) * Decimal("100")
+            return _ZERO
+        return (abs(self._plus_di - self._minus_di) / di_sum) * _HUNDRED
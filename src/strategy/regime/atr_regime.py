@@ -12,11 +12,24 @@ from __future__ import annotations
 from collections import deque
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Iterable, Optional
 
 from src.events import MarketEvent
 
 
+def true_range(bar: MarketEvent, prev_close: Decimal) -> Decimal:
+    """True Range of ``bar`` against the previous close.
+
+    Shared by the ATR and ADX classifiers so RegimeClassifier can compute
+    it once per bar and hand it to both.
+    """
+    return max(
+        bar.high - bar.low,
+        abs(bar.high - prev_close),
+        abs(bar.low - prev_close),
+    )
+
+
 class VolatilityRegime(Enum):
     LOW = "LOW"
     NORMAL = "NORMAL"
@@ -50,6 +63,11 @@ class ATRRegimeClassifier:
         self._low_threshold = low_threshold
         self._high_threshold = high_threshold
         self._atr_history: deque[Decimal] = deque(maxlen=regime_lookback)
+        self._atr_sum: Decimal = Decimal("0")  # running sum of _atr_history
+        # Rolling True Range window and the last bar it covers
+        self._tr_window: deque[Decimal] = deque(maxlen=atr_period)
+        self._tr_sum: Decimal = Decimal("0")
+        self._last_bar: Optional[MarketEvent] = None
         self._current_atr: Decimal = Decimal("0")
         self._regime: VolatilityRegime = VolatilityRegime.NORMAL
 
@@ -70,57 +88,108 @@ class ATRRegimeClassifier:
     # ------------------------------------------------------------------
 
     def update(self, bar_buffer: list[MarketEvent]) -> VolatilityRegime:
-        """Compute ATR from bar_buffer and classify volatility regime."""
-        atr = self._compute_atr(bar_buffer)
-        if atr is None:
+        """Compute ATR from bar_buffer and classify volatility regime.
+
+        ATR is the simple mean True Range over the last ``atr_period``
+        bars, identical to ICTStrategy._update_atr.
+
+        When ``bar_buffer`` continues the stream seen by the previous call
+        (its second-to-last bar is the last bar fed), only the newest True
+        Range is added to the rolling window. Otherwise the window is
+        rebuilt from the buffer.
+        """
+        if len(bar_buffer) < 2:
+            # Start of a (new) stream: nothing to measure yet
+            self._last_bar = None
+            self._tr_window.clear()
+            self._tr_sum = Decimal("0")
             self._regime = VolatilityRegime.NORMAL
             return self._regime
 
-        self._current_atr = atr
+        bar = bar_buffer[-1]
+        expected_window = min(self._atr_period, len(bar_buffer) - 1)
+        if (
+            bar_buffer[-2] is self._last_bar
+            and min(self._atr_period, len(self._tr_window) + 1) == expected_window
+        ):
+            return self.update_bar(bar, bar_buffer[-2])
+
+        self._tr_window.clear()
+        for i in range(-expected_window, 0):
+            self._tr_window.append(
+                true_range(bar_buffer[i], bar_buffer[i - 1].close)
+            )
+        self._tr_sum = sum(self._tr_window)
+        self._last_bar = bar
+        return self._push_atr(self._tr_sum / Decimal(len(self._tr_window)))
+
+    def update_bar(
+        self,
+        bar: MarketEvent,
+        prev_bar: MarketEvent,
+        tr: Optional[Decimal] = None,
+    ) -> VolatilityRegime:
+        """Incremental form of ``update`` for a contiguous bar stream.
+
+        Keeps the last ``atr_period`` True Ranges and their running sum,
+        so each bar costs one TR instead of re-scanning the window. Gives
+        the same ATR as ``update(buffer)`` when ``prev_bar`` and ``bar``
+        are the last two bars of ``buffer``. ``tr`` may be passed in when
+        the caller has already computed it for this bar pair.
+        """
+        if tr is None:
+            tr = true_range(bar, prev_bar.close)
+        if len(self._tr_window) == self._atr_period:
+            self._tr_sum -= self._tr_window[0]
+        self._tr_window.append(tr)
+        self._tr_sum += tr
+        self._last_bar = bar
+        return self._push_atr(self._tr_sum / Decimal(len(self._tr_window)))
+
+    def update_stream(self, bars: Iterable[MarketEvent]) -> VolatilityRegime:
+        """Feed a bar stream one bar at a time, without building prefixes.
+
+        Same end state as calling ``update(bars[:end])`` for every
+        ``end``, but each bar after the first goes through ``update_bar``
+        so no buffer lists are allocated. Accepts any iterable.
+        """
+        prev_bar: Optional[MarketEvent] = None
+        for bar in bars:
+            if prev_bar is None:
+                self.update([bar])
+            else:
+                self.update_bar(bar, prev_bar)
+            prev_bar = bar
+        return self._regime
+
+    def _push_atr(self, atr: Decimal) -> VolatilityRegime:
+        """Record a new ATR in the rolling history and classify it."""
+        if len(self._atr_history) == self._regime_lookback:
+            self._atr_sum -= self._atr_history[0]
         self._atr_history.append(atr)
+        self._atr_sum += atr
+        self._current_atr = atr
+        return self._classify(atr)
 
+    def _classify(self, atr: Decimal) -> VolatilityRegime:
+        """Classify ``atr`` against the rolling ATR history."""
         # Warmup guard: not enough history to compare
         if len(self._atr_history) < self._atr_period:
             self._regime = VolatilityRegime.NORMAL
             return self._regime
 
-        mean_atr = sum(self._atr_history) / Decimal(str(len(self._atr_history)))
-        if mean_atr == 0:
+        if self._atr_sum == 0:
             self._regime = VolatilityRegime.NORMAL
             return self._regime
 
-        ratio = atr / mean_atr
-        if ratio < self._low_threshold:
+        # atr / mean_atr vs threshold, cross-multiplied to avoid both
+        # divisions: atr * n < threshold * sum  <=>  ratio < threshold
+        scaled_atr = atr * len(self._atr_history)
+        if scaled_atr < self._low_threshold * self._atr_sum:
             self._regime = VolatilityRegime.LOW
-        elif ratio > self._high_threshold:
+        elif scaled_atr > self._high_threshold * self._atr_sum:
             self._regime = VolatilityRegime.HIGH
         else:
             self._regime = VolatilityRegime.NORMAL
 
         return self._regime
-
-    # ------------------------------------------------------------------
-    # Internal ATR
-    # ------------------------------------------------------------------
-
-    def _compute_atr(self, bar_buffer: list[MarketEvent]) -> Optional[Decimal]:
-        """Simple ATR identical to ICTStrategy._update_atr."""
-        if len(bar_buffer) < 2:
-            return None
-
-        period = min(self._atr_period, len(bar_buffer) - 1)
-        if period < 1:
-            return None
-
-        tr_sum = Decimal("0")
-        for i in range(-period, 0):
-            bar = bar_buffer[i]
-            prev_close = bar_buffer[i - 1].close
-            tr = max(
-                bar.high - bar.low,
-                abs(bar.high - prev_close),
-                abs(bar.low - prev_close),
-            )
-            tr_sum += tr
-
-        return tr_sum / Decimal(str(period))
@@ -12,10 +12,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Iterable, Optional
 
 from src.events import MarketEvent
-from src.strategy.regime.atr_regime import ATRRegimeClassifier, VolatilityRegime
+from src.strategy.regime.atr_regime import (
+    ATRRegimeClassifier,
+    VolatilityRegime,
+    true_range,
+)
 from src.strategy.regime.adx_classifier import ADXClassifier, TrendStrength
 
 
@@ -115,14 +119,40 @@ class RegimeClassifier:
     def update(
         self, event: MarketEvent, bar_buffer: list[MarketEvent],
     ) -> MarketRegime:
-        """Update both classifiers and produce a MarketRegime."""
-        # ATR volatility regime
-        vol_regime = self._atr_clf.update(bar_buffer)
-
-        # ADX trend strength (needs prev bar)
-        if len(bar_buffer) >= 2:
-            prev_bar = bar_buffer[-2]
-            self._adx_clf.update(event, prev_bar)
+        """Update both classifiers and produce a MarketRegime.
+
+        ``bar_buffer`` must be the contiguous bar stream ending at
+        ``event``; only its last two bars are read, both classifiers
+        carry their own incremental state between calls.
+        """
+        prev_bar = bar_buffer[-2] if len(bar_buffer) >= 2 else None
+        return self._step(event, prev_bar)
+
+    def update_stream(
+        self, bars: Iterable[MarketEvent],
+    ) -> Optional[MarketRegime]:
+        """Feed a bar stream and return the final regime.
+
+        Equivalent to calling ``update(bar, bars[:i + 1])`` for each bar,
+        without materialising the growing prefix lists.
+        """
+        prev_bar: Optional[MarketEvent] = None
+        for bar in bars:
+            self._step(bar, prev_bar)
+            prev_bar = bar
+        return self._regime
+
+    def _step(
+        self, event: MarketEvent, prev_bar: Optional[MarketEvent],
+    ) -> MarketRegime:
+        """Advance both classifiers by one bar and snapshot the regime."""
+        if prev_bar is not None:
+            # One True Range feeds both ATR (volatility) and ADX (trend)
+            tr = true_range(event, prev_bar.close)
+            vol_regime = self._atr_clf.update_bar(event, prev_bar, tr)
+            self._adx_clf.update(event, prev_bar, tr)
+        else:
+            vol_regime = self._atr_clf.update([event])
 
         trend_strength = self._adx_clf.classify()
         adx = self._adx_clf.adx
@@ -14,7 +14,7 @@ Requirement: REG-04
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Optional
+from typing import Iterable, Optional
 
 from src.events import MarketEvent, SignalEvent
 from src.strategy.base import BaseStrategy
@@ -32,8 +32,9 @@ class RegimeGatedStrategy(BaseStrategy):
     ----------
     inner_strategy : BaseStrategy
         The strategy whose signals are gated.
-    allowed_regimes : list[RegimeType]
-        Signals are only forwarded in these regimes.
+    allowed_regimes : Iterable[RegimeType]
+        Signals are only forwarded in these regimes. Frozen into a set
+        once, so the per-bar gate is a single hash lookup.
     atr_period : int
         ATR period for regime classifier.
     adx_period : int
@@ -45,7 +46,7 @@ class RegimeGatedStrategy(BaseStrategy):
     def __init__(
         self,
         inner_strategy: BaseStrategy,
-        allowed_regimes: list[RegimeType],
+        allowed_regimes: Iterable[RegimeType],
         atr_period: int = 14,
         adx_period: int = 14,
         regime_lookback: int = 50,
@@ -56,7 +57,7 @@ class RegimeGatedStrategy(BaseStrategy):
             max_buffer_size=500,
         )
         self._inner = inner_strategy
-        self._allowed_regimes = set(allowed_regimes)
+        self._allowed_regimes: frozenset[RegimeType] = frozenset(allowed_regimes)
         self._regime_clf = RegimeClassifier(
             atr_period=atr_period,
             adx_period=adx_period,
@@ -60,14 +60,11 @@ class ReversalStrategy(BaseStrategy):
 
         # Need enough bars for RSI computation
         min_bars = max(self._sma_period, self._rsi_period) + 1
-        if len(self.bars) < min_bars:
+        if len(self._bar_buffer) < min_bars:
             return None
 
-        # Build pandas Series from rolling buffer closes
-        closes = pd.Series(
-            [float(bar.close) for bar in self._bar_buffer],
-            dtype=float,
-        )
+        # Build pandas Series from the rolling buffer's close column
+        closes = pd.Series(self.price_arrays()[3].copy(), dtype=float)
 
         # Compute indicators on rolling buffer
         rsi = ta.rsi(closes, length=self._rsi_period)
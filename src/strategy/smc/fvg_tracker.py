@@ -31,7 +31,10 @@ class FVGState(Enum):
     EXPIRED = "EXPIRED"
 
 
-@dataclass
+_ACTIVE_STATES = frozenset((FVGState.OPEN, FVGState.TOUCHED))
+
+
+@dataclass(slots=True)
 class FairValueGap:
     """Mutable FVG with state machine transitions."""
     direction: str  # "bullish" or "bearish"
@@ -82,10 +85,12 @@ class FVGTracker:
 
     def get_active_fvgs(self, direction: Optional[str] = None) -> list[FairValueGap]:
         """Return gaps in OPEN or TOUCHED state, optionally filtered by direction."""
-        result = [g for g in self._gaps if g.state in (FVGState.OPEN, FVGState.TOUCHED)]
-        if direction is not None:
-            result = [g for g in result if g.direction == direction]
-        return result
+        if direction is None:
+            return [g for g in self._gaps if g.state in _ACTIVE_STATES]
+        return [
+            g for g in self._gaps
+            if g.state in _ACTIVE_STATES and g.direction == direction
+        ]
 
     def detect_and_register(
         self,
@@ -114,42 +119,28 @@ class FVGTracker:
 
         bar1 = bar_buffer[-3]
         bar3 = bar_buffer[-1]
-        min_size = atr * self._min_size_atr_mult
-
-        gap: Optional[FairValueGap] = None
 
-        # Bullish FVG: bar1.high < bar3.low
+        # Bullish FVG: bar1.high < bar3.low; bearish FVG: bar1.low > bar3.high.
+        # Both share one size filter and one constructor below.
         if bar1.high < bar3.low:
-            size = bar3.low - bar1.high
-            if size >= min_size:
-                top = bar3.low
-                bottom = bar1.high
-                gap = FairValueGap(
-                    direction="bullish",
-                    top=top,
-                    bottom=bottom,
-                    midpoint=(top + bottom) / 2,
-                    formed_bar_idx=bar_idx,
-                )
-
-        # Bearish FVG: bar1.low > bar3.high
+            direction, top, bottom = "bullish", bar3.low, bar1.high
         elif bar1.low > bar3.high:
-            size = bar1.low - bar3.high
-            if size >= min_size:
-                top = bar1.low
-                bottom = bar3.high
-                gap = FairValueGap(
-                    direction="bearish",
-                    top=top,
-                    bottom=bottom,
-                    midpoint=(top + bottom) / 2,
-                    formed_bar_idx=bar_idx,
-                )
-
-        if gap is not None:
-            self._gaps.append(gap)
-            self._enforce_memory_limit()
+            direction, top, bottom = "bearish", bar1.low, bar3.high
+        else:
+            return None
+
+        if top - bottom < atr * self._min_size_atr_mult:
+            return None
 
+        gap = FairValueGap(
+            direction=direction,
+            top=top,
+            bottom=bottom,
+            midpoint=(top + bottom) / 2,
+            formed_bar_idx=bar_idx,
+        )
+        self._gaps.append(gap)
+        self._enforce_memory_limit()
         return gap
 
     def update_all_states(self, event: MarketEvent, bar_idx: int) -> None:
@@ -162,18 +153,21 @@ class FVGTracker:
         bar_idx : int
             Current absolute bar index.
         """
+        # Read the bar's Decimal fields once, not once per gap
+        high, low, close = event.high, event.low, event.close
+        min_formed_idx = bar_idx - self._max_age_bars
         for gap in self._gaps:
-            if gap.state in (FVGState.INVERTED, FVGState.EXPIRED):
+            state = gap.state
+            if state is FVGState.INVERTED or state is FVGState.EXPIRED:
                 continue
 
             # MITIGATED → INVERTED check (before skipping)
-            if gap.state == FVGState.MITIGATED:
-                self._check_inversion(gap, event)
+            if state is FVGState.MITIGATED:
+                self._check_inversion(gap, close)
                 continue
 
             # Age-based expiry
-            age = bar_idx - gap.formed_bar_idx
-            if age > self._max_age_bars:
+            if gap.formed_bar_idx < min_formed_idx:
                 gap.state = FVGState.EXPIRED
                 continue
 
@@ -181,112 +175,113 @@ class FVGTracker:
             if bar_idx <= gap.formed_bar_idx:
                 continue
 
-            self._transition_gap(gap, event)
+            if gap.direction == "bullish":
+                self._transition_bullish(gap, low, close)
+            else:
+                self._transition_bearish(gap, high, close)
 
-    def _check_inversion(self, gap: FairValueGap, event: MarketEvent) -> None:
+    def _check_inversion(self, gap: FairValueGap, close: Decimal) -> None:
         """Check MITIGATED → INVERTED transition."""
         if gap.direction == "bullish":
-            if event.close < gap.bottom:
+            if close < gap.bottom:
                 gap.state = FVGState.INVERTED
         else:
-            if event.close > gap.top:
+            if close > gap.top:
                 gap.state = FVGState.INVERTED
 
-    def _transition_gap(self, gap: FairValueGap, event: MarketEvent) -> None:
-        """Apply state transitions for a single gap."""
-        if gap.direction == "bullish":
-            self._transition_bullish(gap, event)
-        else:
-            self._transition_bearish(gap, event)
-
-    def _transition_bullish(self, gap: FairValueGap, event: MarketEvent) -> None:
+    def _transition_bullish(
+        self, gap: FairValueGap, low: Decimal, close: Decimal,
+    ) -> None:
         """State transitions for a bullish FVG (gap-up)."""
         if gap.state == FVGState.OPEN:
             # OPEN → TOUCHED: wick enters zone from above (price dips into gap)
-            if event.low <= gap.top:
+            if low <= gap.top:
                 gap.state = FVGState.TOUCHED
                 # Check immediate mitigation
-                self._check_mitigation_bullish(gap, event)
+                self._check_mitigation_bullish(gap, low, close)
 
         elif gap.state == FVGState.TOUCHED:
-            self._check_mitigation_bullish(gap, event)
+            self._check_mitigation_bullish(gap, low, close)
 
         # MITIGATED → INVERTED: close below bottom boundary
         if gap.state == FVGState.MITIGATED:
-            if event.close < gap.bottom:
+            if close < gap.bottom:
                 gap.state = FVGState.INVERTED
 
-    def _check_mitigation_bullish(self, gap: FairValueGap, event: MarketEvent) -> None:
+    def _check_mitigation_bullish(
+        self, gap: FairValueGap, low: Decimal, close: Decimal,
+    ) -> None:
         """Check if a bullish gap transitions to MITIGATED."""
         if gap.state != FVGState.TOUCHED:
             return
 
         if self._mitigation_mode == "wick":
             # Any wick below the bottom = mitigated
-            if event.low <= gap.bottom:
+            if low <= gap.bottom:
                 gap.state = FVGState.MITIGATED
         elif self._mitigation_mode == "50pct":
             # Wick reaches midpoint
-            if event.low <= gap.midpoint:
+            if low <= gap.midpoint:
                 gap.state = FVGState.MITIGATED
         elif self._mitigation_mode == "close":
             # Close below bottom
-            if event.close < gap.bottom:
+            if close < gap.bottom:
                 gap.state = FVGState.MITIGATED
 
-    def _transition_bearish(self, gap: FairValueGap, event: MarketEvent) -> None:
+    def _transition_bearish(
+        self, gap: FairValueGap, high: Decimal, close: Decimal,
+    ) -> None:
         """State transitions for a bearish FVG (gap-down)."""
         if gap.state == FVGState.OPEN:
             # OPEN → TOUCHED: wick enters zone from below (price rises into gap)
-            if event.high >= gap.bottom:
+            if high >= gap.bottom:
                 gap.state = FVGState.TOUCHED
-                self._check_mitigation_bearish(gap, event)
+                self._check_mitigation_bearish(gap, high, close)
 
         elif gap.state == FVGState.TOUCHED:
-            self._check_mitigation_bearish(gap, event)
+            self._check_mitigation_bearish(gap, high, close)
 
         # MITIGATED → INVERTED: close above top boundary
         if gap.state == FVGState.MITIGATED:
-            if event.close > gap.top:
+            if close > gap.top:
                 gap.state = FVGState.INVERTED
 
-    def _check_mitigation_bearish(self, gap: FairValueGap, event: MarketEvent) -> None:
+    def _check_mitigation_bearish(
+        self, gap: FairValueGap, high: Decimal, close: Decimal,
+    ) -> None:
         """Check if a bearish gap transitions to MITIGATED."""
         if gap.state != FVGState.TOUCHED:
             return
 
         if self._mitigation_mode == "wick":
-            if event.high >= gap.top:
+            if high >= gap.top:
                 gap.state = FVGState.MITIGATED
         elif self._mitigation_mode == "50pct":
-            if event.high >= gap.midpoint:
+            if high >= gap.midpoint:
                 gap.state = FVGState.MITIGATED
         elif self._mitigation_mode == "close":
-            if event.close > gap.top:
+            if close > gap.top:
                 gap.state = FVGState.MITIGATED
 
     def _enforce_memory_limit(self) -> None:
         """Expire oldest OPEN gaps if exceeding max_fvgs."""
-        active = [g for g in self._gaps if g.state in (FVGState.OPEN, FVGState.TOUCHED)]
-        while len(active) > self._max_fvgs:
-            # Find oldest OPEN gap and expire it
-            for g in self._gaps:
-                if g.state == FVGState.OPEN:
-                    g.state = FVGState.EXPIRED
-                    break
-            else:
-                # No OPEN left, expire oldest TOUCHED
+        excess = sum(g.state in _ACTIVE_STATES for g in self._gaps) - self._max_fvgs
+        if excess > 0:
+            # Oldest OPEN gaps go first; only once none are left does the
+            # oldest TOUCHED gap expire. One pass per state replaces the
+            # rescan after every single expiry.
+            for state in (FVGState.OPEN, FVGState.TOUCHED):
                 for g in self._gaps:
-                    if g.state == FVGState.TOUCHED:
-                        g.state = FVGState.EXPIRED
+                    if excess == 0:
                         break
-                else:
-                    break
-            active = [g for g in self._gaps if g.state in (FVGState.OPEN, FVGState.TOUCHED)]
+                    if g.state is state:
+                        g.state = FVGState.EXPIRED
+                        excess -= 1
 
         # Also prune fully terminal gaps from memory
-        self._gaps = [
-            g for g in self._gaps
-            if g.state not in (FVGState.EXPIRED, FVGState.INVERTED)
-               or (len(self._gaps) <= self._max_fvgs)
-        ]
+        if len(self._gaps) > self._max_fvgs:
+            self._gaps = [
+                g for g in self._gaps
+                if g.state is not FVGState.EXPIRED
+                and g.state is not FVGState.INVERTED
+            ]
@@ -27,18 +27,20 @@ Requirement: ICT-05
 
 from __future__ import annotations
 
+from collections import deque
 from decimal import Decimal
 from typing import Optional
 
 from src.events import MarketEvent, SignalEvent, SignalType
 from src.strategy.base import BaseStrategy
+from src.strategy.regime.atr_regime import true_range
 from src.strategy.smc.swing_detector import SwingDetector
 from src.strategy.smc.structure import (
     MarketStructureTracker,
     TrendState,
     BreakType,
 )
-from src.strategy.smc.fvg_tracker import FVGTracker, FVGState
+from src.strategy.smc.fvg_tracker import FVGTracker, FVGState, FairValueGap
 from src.strategy.smc.order_block import OrderBlockDetector, OBState
 from src.strategy.smc.liquidity_sweep import LiquiditySweepDetector
 from src.strategy.smc.inducement import InducementDetector
@@ -153,6 +155,11 @@ class ICTStrategy(BaseStrategy):
         self._warmup_bars: int = p.get("warmup_bars", 30)
         self._in_position: str = ""  # "long", "short", or ""
         self._current_atr: Decimal = Decimal("0")
+        # Rolling True Range window (the ATR period, capped by the buffer)
+        self._tr_window: deque[Decimal] = deque(
+            maxlen=max(0, min(self._atr_period, max_buffer_size - 1)),
+        )
+        self._tr_sum: Decimal = Decimal("0")
 
     # ------------------------------------------------------------------
     # Properties
@@ -366,11 +373,14 @@ class ICTStrategy(BaseStrategy):
             ob for ob in self._ob_detector.active_obs
             if ob.direction == "bullish"
         ]
+        # Active bullish FVGs, fetched once on the first OB price reaches
+        active_fvgs: Optional[list[FairValueGap]] = None
         for ob in bullish_obs:
             # Price in OB zone
             if event.low <= ob.ob_high and event.close >= ob.ob_low:
                 # Overlapping bullish FVG (OPEN or TOUCHED)
-                active_fvgs = self._fvg_tracker.get_active_fvgs("bullish")
+                if active_fvgs is None:
+                    active_fvgs = self._fvg_tracker.get_active_fvgs("bullish")
                 for fvg in active_fvgs:
                     if self._zones_overlap(
                         ob.ob_low, ob.ob_high, fvg.bottom, fvg.top,
@@ -414,11 +424,14 @@ class ICTStrategy(BaseStrategy):
             ob for ob in self._ob_detector.active_obs
             if ob.direction == "bearish"
         ]
+        # Active bearish FVGs, fetched once on the first OB price reaches
+        active_fvgs: Optional[list[FairValueGap]] = None
         for ob in bearish_obs:
             # Price in OB zone
             if event.high >= ob.ob_low and event.close <= ob.ob_high:
                 # Overlapping bearish FVG (OPEN or TOUCHED)
-                active_fvgs = self._fvg_tracker.get_active_fvgs("bearish")
+                if active_fvgs is None:
+                    active_fvgs = self._fvg_tracker.get_active_fvgs("bearish")
                 for fvg in active_fvgs:
                     if self._zones_overlap(
                         ob.ob_low, ob.ob_high, fvg.bottom, fvg.top,
@@ -446,23 +459,21 @@ class ICTStrategy(BaseStrategy):
         return a_low <= b_high and b_low <= a_high
 
     def _update_atr(self) -> None:
-        """Compute simple ATR from the bar buffer."""
-        if len(self._bar_buffer) < 2:
-            return
-
-        period = min(self._atr_period, len(self._bar_buffer) - 1)
-        if period < 1:
+        """Update the simple ATR with the newest bar's True Range.
+
+        Keeps the last ``atr_period`` True Ranges and their running sum,
+        like ATRRegimeClassifier.update_bar, so each bar costs one TR
+        instead of re-scanning the window. Same Decimal result as summing
+        the window from the bar buffer.
+        """
+        window = self._tr_window
+        if len(self._bar_buffer) < 2 or not window.maxlen:
             return
 
-        tr_sum = Decimal("0")
-        for i in range(-period, 0):
-            bar = self._bar_buffer[i]
-            prev_close = self._bar_buffer[i - 1].close
-            tr = max(
-                bar.high - bar.low,
-                abs(bar.high - prev_close),
-                abs(bar.low - prev_close),
-            )
-            tr_sum += tr
+        tr = true_range(self._bar_buffer[-1], self._bar_buffer[-2].close)
+        if len(window) == window.maxlen:
+            self._tr_sum -= window[0]
+        window.append(tr)
+        self._tr_sum += tr
 
-        self._current_atr = tr_sum / Decimal(str(period))
+        self._current_atr = self._tr_sum / Decimal(len(window))
@@ -33,7 +33,7 @@ class OBState(Enum):
     INVALIDATED = "INVALIDATED"
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBlock:
     """Mutable Order Block with state tracking."""
     direction: str  # "bullish" or "bearish"
@@ -79,10 +79,13 @@ class OrderBlockDetector:
         self._ob_max_age = ob_max_age_bars
         self._close_mitigation = close_mitigation
         self._order_blocks: list[OrderBlock] = []
+        # ACTIVE subset of _order_blocks, same order. At most max_active_obs
+        # long, so per-bar updates skip the mitigated/invalidated history.
+        self._active: list[OrderBlock] = []
 
     @property
     def active_obs(self) -> list[OrderBlock]:
-        return [ob for ob in self._order_blocks if ob.state == OBState.ACTIVE]
+        return list(self._active)
 
     @property
     def all_obs(self) -> list[OrderBlock]:
@@ -163,6 +166,7 @@ class OrderBlockDetector:
                     formed_bar_idx=ob_idx,
                 )
                 self._order_blocks.append(ob)
+                self._active.append(ob)
                 self._enforce_limits(bar_count)
                 return ob
 
@@ -198,6 +202,7 @@ class OrderBlockDetector:
                     formed_bar_idx=ob_idx,
                 )
                 self._order_blocks.append(ob)
+                self._active.append(ob)
                 self._enforce_limits(bar_count)
                 return ob
 
@@ -210,59 +215,61 @@ class OrderBlockDetector:
         - Invalidation: close beyond 50% Mean Threshold.
         - Age expiry: OBs older than max_age bars.
         """
-        for ob in self._order_blocks:
-            if ob.state != OBState.ACTIVE:
-                continue
-
+        # Read the bar's Decimal fields once, not once per OB
+        close = event.close
+        min_formed_idx = bar_count - self._ob_max_age
+        still_active: list[OrderBlock] = []
+        for ob in self._active:
             # Age expiry
-            age = bar_count - ob.formed_bar_idx
-            if age > self._ob_max_age:
+            if ob.formed_bar_idx < min_formed_idx:
                 ob.state = OBState.INVALIDATED
                 continue
 
             if ob.direction == "bullish":
-                self._update_bullish_ob(ob, event)
+                self._update_bullish_ob(ob, close, event.low)
             else:
-                self._update_bearish_ob(ob, event)
+                self._update_bearish_ob(ob, close, event.high)
+            if ob.state is OBState.ACTIVE:
+                still_active.append(ob)
+        self._active = still_active
 
-    def _update_bullish_ob(self, ob: OrderBlock, event: MarketEvent) -> None:
+    def _update_bullish_ob(
+        self, ob: OrderBlock, close: Decimal, low: Decimal,
+    ) -> None:
         """Update a bullish OB (support zone)."""
         # Invalidation: close below 50% of OB zone
-        if event.close < ob.ob_50pct:
+        if close < ob.ob_50pct:
             ob.state = OBState.INVALIDATED
             return
 
         # Mitigation: price touches OB zone
-        if self._close_mitigation:
-            if event.close <= ob.ob_high and event.close >= ob.ob_low:
-                ob.state = OBState.MITIGATED
-        else:
-            if event.low <= ob.ob_high and event.low >= ob.ob_low:
-                ob.state = OBState.MITIGATED
+        touch = close if self._close_mitigation else low
+        if ob.ob_low <= touch <= ob.ob_high:
+            ob.state = OBState.MITIGATED
 
-    def _update_bearish_ob(self, ob: OrderBlock, event: MarketEvent) -> None:
+    def _update_bearish_ob(
+        self, ob: OrderBlock, close: Decimal, high: Decimal,
+    ) -> None:
         """Update a bearish OB (resistance zone)."""
         # Invalidation: close above 50% of OB zone
-        if event.close > ob.ob_50pct:
+        if close > ob.ob_50pct:
             ob.state = OBState.INVALIDATED
             return
 
         # Mitigation: price touches OB zone
-        if self._close_mitigation:
-            if event.close >= ob.ob_low and event.close <= ob.ob_high:
-                ob.state = OBState.MITIGATED
-        else:
-            if event.high >= ob.ob_low and event.high <= ob.ob_high:
-                ob.state = OBState.MITIGATED
+        touch = close if self._close_mitigation else high
+        if ob.ob_low <= touch <= ob.ob_high:
+            ob.state = OBState.MITIGATED
 
     def _enforce_limits(self, bar_count: int) -> None:
         """Remove oldest active OBs if exceeding max limit."""
-        active = self.active_obs
+        active = self._active
         while len(active) > self._max_active:
-            # Invalidate oldest active
-            oldest = min(active, key=lambda ob: ob.formed_bar_idx)
-            oldest.state = OBState.INVALIDATED
-            active = self.active_obs
+            # Invalidate oldest active (first one on formed_bar_idx ties)
+            oldest = min(
+                range(len(active)), key=lambda i: active[i].formed_bar_idx,
+            )
+            active.pop(oldest).state = OBState.INVALIDATED
 
         # Prune invalidated/mitigated that are old
         self._order_blocks = [
@@ -36,7 +36,7 @@ class BreakType(Enum):
     CHOCH = "CHOCH"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StructureBreak:
     """Immutable record of a BOS or CHOCH event."""
     break_type: BreakType
@@ -46,6 +46,27 @@ class StructureBreak:
     bar_idx: int
 
 
+# Transition table: (trend before, break direction) -> break type. A break
+# against the trend is a CHOCH; with the trend or from UNDEFINED a BOS.
+_BREAK_TYPE: dict[tuple[TrendState, str], BreakType] = {
+    (trend, direction): (
+        BreakType.CHOCH
+        if (trend, direction) in (
+            (TrendState.DOWNTREND, "bullish"), (TrendState.UPTREND, "bearish"),
+        )
+        else BreakType.BOS
+    )
+    for trend in TrendState
+    for direction in ("bullish", "bearish")
+}
+
+# Either break type leaves the trend pointing the way price broke
+_TREND_AFTER: dict[str, TrendState] = {
+    "bullish": TrendState.UPTREND,
+    "bearish": TrendState.DOWNTREND,
+}
+
+
 class MarketStructureTracker:
     """Tracks market structure via swing highs/lows and detects BOS/CHOCH.
 
@@ -118,58 +139,29 @@ class MarketStructureTracker:
         if bar_idx <= self._last_break_bar:
             return None
 
-        result: Optional[StructureBreak] = None
-
-        # --- Bullish break: close above last swing high ---
-        if self._last_swing_high is not None and close > self._last_swing_high.price:
-            if self._trend == TrendState.DOWNTREND:
-                # Against trend → CHOCH
-                result = StructureBreak(
-                    break_type=BreakType.CHOCH,
-                    direction="bullish",
-                    broken_level=self._last_swing_high.price,
-                    timestamp=timestamp,
-                    bar_idx=bar_idx,
-                )
-                self._trend = TrendState.UPTREND
-            else:
-                # With trend or UNDEFINED → BOS
-                result = StructureBreak(
-                    break_type=BreakType.BOS,
-                    direction="bullish",
-                    broken_level=self._last_swing_high.price,
-                    timestamp=timestamp,
-                    bar_idx=bar_idx,
-                )
-                self._trend = TrendState.UPTREND
-
-        # --- Bearish break: close below last swing low ---
-        elif self._last_swing_low is not None and close < self._last_swing_low.price:
-            if self._trend == TrendState.UPTREND:
-                # Against trend → CHOCH
-                result = StructureBreak(
-                    break_type=BreakType.CHOCH,
-                    direction="bearish",
-                    broken_level=self._last_swing_low.price,
-                    timestamp=timestamp,
-                    bar_idx=bar_idx,
-                )
-                self._trend = TrendState.DOWNTREND
-            else:
-                # With trend or UNDEFINED → BOS
-                result = StructureBreak(
-                    break_type=BreakType.BOS,
-                    direction="bearish",
-                    broken_level=self._last_swing_low.price,
-                    timestamp=timestamp,
-                    bar_idx=bar_idx,
-                )
-                self._trend = TrendState.DOWNTREND
-
-        if result is not None:
-            self._last_break_bar = bar_idx
-            self._breaks.append(result)
-            if len(self._breaks) > self._max_history:
-                self._breaks = self._breaks[-self._max_history:]
+        # Bullish break: close above last swing high; otherwise bearish
+        # break: close below last swing low
+        sh = self._last_swing_high
+        if sh is not None and close > sh.price:
+            direction, level = "bullish", sh.price
+        else:
+            sl = self._last_swing_low
+            if sl is None or close >= sl.price:
+                return None
+            direction, level = "bearish", sl.price
+
+        result = StructureBreak(
+            break_type=_BREAK_TYPE[self._trend, direction],
+            direction=direction,
+            broken_level=level,
+            timestamp=timestamp,
+            bar_idx=bar_idx,
+        )
+        self._trend = _TREND_AFTER[direction]
+
+        self._last_break_bar = bar_idx
+        self._breaks.append(result)
+        if len(self._breaks) > self._max_history:
+            del self._breaks[:-self._max_history]
 
         return result
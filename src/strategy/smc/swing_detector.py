@@ -23,7 +23,7 @@ from typing import Optional
 from src.events import MarketEvent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SwingPoint:
     """Immutable record of a confirmed swing high or low."""
     price: Decimal
@@ -122,7 +122,7 @@ class SwingDetector:
                 self._swing_highs.append(sp)
                 new_highs.append(sp)
                 if len(self._swing_highs) > self._max_history:
-                    self._swing_highs = self._swing_highs[-self._max_history:]
+                    del self._swing_highs[:-self._max_history]
 
         # --- Swing Low check ---
         is_swing_low = True
@@ -143,6 +143,6 @@ class SwingDetector:
                 self._swing_lows.append(sp)
                 new_lows.append(sp)
                 if len(self._swing_lows) > self._max_history:
-                    self._swing_lows = self._swing_lows[-self._max_history:]
+                    del self._swing_lows[:-self._max_history]
 
         return new_highs, new_lows
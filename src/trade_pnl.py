@@ -0,0 +1,83 @@
+"""
+trade_pnl.py — Exact per-trade PnL extraction from a fill log.
+
+Shared by the Monte Carlo trade shuffler, the portfolio router and the
+HTML report, which all pair fills the same way:
+- Consecutive fills on the same side replace the open entry
+- The next opposite-side fill closes it as one round trip
+- PnL = price move * entry quantity - entry and exit frictions
+
+Prices, frictions and quantities are scaled to Python ints once, so the
+pairing runs on native integers and stays exact (no float, no Decimal
+per trade). Depends only on src.events.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+from src.events import FillEvent, OrderSide
+
+
+def _decimal_places(value: Decimal) -> int:
+    """Number of fractional digits in ``value`` (0 for integers)."""
+    exponent = value.as_tuple().exponent
+    return -exponent if isinstance(exponent, int) and exponent < 0 else 0
+
+
+def pair_fills_to_scaled_pnls(
+    fill_log: list[FillEvent],
+) -> tuple[list[int], int]:
+    """Extract per-trade PnLs as exact scaled integers.
+
+    Prices, frictions and quantities are converted once to ``int`` at the
+    smallest common power of ten, so the pairing loop runs on native
+    integers instead of Decimal objects. Results are exact — the scale is
+    derived from the inputs, nothing is truncated.
+
+    Returns (scaled_pnls, scale) where ``pnl == scaled_pnl / 10**scale``.
+    """
+    if not fill_log:
+        return [], 0
+
+    price_places = max(
+        max(
+            _decimal_places(f.fill_price), _decimal_places(f.commission),
+            _decimal_places(f.slippage), _decimal_places(f.spread_cost),
+        )
+        for f in fill_log
+    )
+    qty_places = max(_decimal_places(f.quantity) for f in fill_log)
+    price_mult = 10 ** price_places
+    qty_mult = 10 ** qty_places
+
+    def to_int(value: Decimal, mult: int) -> int:
+        return int(value * mult)
+
+    pnls: list[int] = []
+    open_side = None
+    open_price = open_qty = open_friction = 0
+
+    for fill in fill_log:
+        price = to_int(fill.fill_price, price_mult)
+        friction = to_int(
+            fill.commission + fill.slippage + fill.spread_cost, price_mult,
+        )
+        if open_side is None or fill.side == open_side:
+            open_side = fill.side
+            open_price = price
+            open_qty = to_int(fill.quantity, qty_mult)
+            open_friction = friction
+            continue
+
+        # Pair: entry and exit
+        if open_side == OrderSide.BUY:
+            pnl = (price - open_price) * open_qty
+        else:
+            pnl = (open_price - price) * open_qty
+        # Subtract friction
+        pnl -= (open_friction + friction) * qty_mult
+        pnls.append(pnl)
+        open_side = None
+
+    return pnls, price_places + qty_places
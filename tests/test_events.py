@@ -83,7 +83,7 @@ def fill_event(now: datetime) -> FillEvent:
 
 
 # ---------------------------------------------------------------------------
-# TestFrozenImmutability — 4 tests
+# TestFrozenImmutability — 5 tests
 # ---------------------------------------------------------------------------
 
 class TestFrozenImmutability:
@@ -105,9 +105,13 @@ class TestFrozenImmutability:
         with pytest.raises(FrozenInstanceError):
             fill_event.fill_price = Decimal("200.00")
 
+    def test_market_event_uses_slots(self, market_event: MarketEvent) -> None:
+        assert not hasattr(market_event, "__dict__")
+        assert "close" in MarketEvent.__slots__
+
 
 # ---------------------------------------------------------------------------
-# TestFieldTypes — 8 tests
+# TestFieldTypes — 11 tests
 # ---------------------------------------------------------------------------
 
 class TestFieldTypes:
@@ -130,6 +134,43 @@ class TestFieldTypes:
         assert isinstance(market_event.symbol, str)
         assert isinstance(market_event.timeframe, str)
 
+    def test_market_event_float_views_survive_replace_and_pickle(
+        self, market_event: MarketEvent
+    ) -> None:
+        import dataclasses
+        import pickle
+
+        moved = dataclasses.replace(market_event, close=Decimal("190.00"))
+        assert moved.close_f == 190.0
+        restored = pickle.loads(pickle.dumps(market_event))
+        assert restored.close_f == market_event.close_f
+        assert restored.ts_ns == market_event.ts_ns
+
+    def test_market_event_ts_ns_is_epoch_nanoseconds(
+        self, market_event: MarketEvent
+    ) -> None:
+        # fixture timestamp: 2024-01-15 09:30 UTC
+        assert market_event.ts_ns == 1_705_311_000 * 10**9
+        naive = MarketEvent(
+            symbol="AAPL", timestamp=datetime(2024, 1, 15, 9, 30),
+            open=Decimal("1"), high=Decimal("1"), low=Decimal("1"),
+            close=Decimal("1"), volume=1, timeframe="1d",
+        )
+        assert naive.ts_ns == market_event.ts_ns
+
+    def test_market_event_float_views_mirror_ohlc(
+        self, market_event: MarketEvent
+    ) -> None:
+        assert market_event.high_f == 183.5
+        assert market_event.close_f == float(market_event.close)
+        # Float views do not take part in equality
+        assert market_event == MarketEvent(
+            symbol="AAPL", timestamp=market_event.timestamp,
+            open=Decimal("182.150"), high=Decimal("183.50"),
+            low=Decimal("181.00"), close=Decimal("182.80"),
+            volume=1_500_000, timeframe="1d",
+        )
+
     def test_signal_event_strength_is_decimal(
         self, signal_event: SignalEvent
     ) -> None:
@@ -409,6 +409,64 @@ class TestMultiAssetEngine:
         # Max 1 buy fill should go through
         assert open_positions <= 2  # Could be 1 or 2 depending on timing
 
+    def test_fill_symbol_mask_matches_fill_log(self):
+        """Bitmask of filled symbols agrees with the string-based fill log."""
+        bars_a = [_make_bar(100, symbol="AAPL", idx=i) for i in range(3)]
+        bars_b = [_make_bar(200, symbol="MSFT", idx=i) for i in range(3)]
+
+        handlers = {
+            "AAPL": _MockDataHandler(bars_a),
+            "MSFT": _MockDataHandler(bars_b),
+        }
+        strategies = {
+            "AAPL": _MockStrategy("AAPL", signal_bar=1),
+            "MSFT": _MockStrategy("MSFT"),
+        }
+
+        result = create_multi_asset_engine(
+            handlers=handlers, strategies=strategies,
+            initial_cash=Decimal("100000"),
+        ).run()
+
+        assert result.symbol_ids == {"AAPL": 0, "MSFT": 1}
+        symbols_in_fills = {f.symbol for f in result.fill_log}
+        assert symbols_in_fills == {"AAPL"}
+        assert result.fill_symbol_mask == 0b01
+        assert result.has_fills_for("AAPL")
+        assert not result.has_fills_for("MSFT")
+        assert not result.has_fills_for("UNKNOWN")
+
+    def test_margin_check_waits_for_first_fill(self):
+        """No symbol filled or held yet → the margin scan is skipped."""
+        bars = [_make_bar(100, symbol="AAPL", idx=i) for i in range(3)]
+        portfolio = Portfolio(initial_cash=Decimal("100000"))
+        portfolio.check_margin = MagicMock(return_value=[])
+        MultiAssetEngine(
+            handlers={"AAPL": _MockDataHandler(bars)},
+            strategies={"AAPL": _MockStrategy("AAPL", signal_bar=2)},
+            portfolio=portfolio,
+            execution_handlers={"AAPL": ExecutionHandler()},
+        ).run()
+        # Signal on the second bar fills on the third; only that bar checks
+        assert portfolio.check_margin.call_count == 1
+
+    def test_position_held_at_start_is_still_exited(self):
+        """A position in the passed-in portfolio counts as held."""
+        bars = [_make_bar(100, symbol="AAPL", idx=i) for i in range(3)]
+        portfolio = Portfolio(initial_cash=Decimal("100000"))
+        portfolio.process_fill(_make_fill("BUY", 10, 100, symbol="AAPL"))
+        result = MultiAssetEngine(
+            handlers={"AAPL": _MockDataHandler(bars)},
+            strategies={"AAPL": _MockExitStrategy("AAPL", exit_bar=1)},
+            portfolio=portfolio,
+            execution_handlers={"AAPL": ExecutionHandler()},
+        ).run()
+        assert any(
+            isinstance(e, OrderEvent) and e.side == OrderSide.SELL
+            for e in result.event_log
+        )
+        assert portfolio.positions["AAPL"].quantity == Decimal("0")
+
     def test_exit_closes_correct_symbol(self):
         """EXIT signal closes the correct symbol's position."""
         # 3 bars each: bar 1 signals LONG, bar 3 signals EXIT
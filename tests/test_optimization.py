@@ -11,6 +11,7 @@ Tests cover:
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
 from unittest.mock import patch, MagicMock
@@ -20,6 +21,7 @@ import pytest
 from src.events import MarketEvent, FillEvent, OrderSide
 from src.optimization.walk_forward import (
     WFOResult, WFOWindow, _BarSliceHandler,
+    _window_starts,
     run_walk_forward,
 )
 from src.optimization.sensitivity import (
@@ -31,11 +33,14 @@ from src.optimization.monte_carlo import (
     run_monte_carlo,
     _pair_fills_to_pnls,
     _simulate_equity_curve,
+    _simulate_equity_curves,
+    _simulate_equity_curves_numpy,
 )
 from src.optimization.robustness import (
     RobustnessReport,
     compute_robustness,
 )
+from src.trade_pnl import pair_fills_to_scaled_pnls
 
 
 # ---------------------------------------------------------------------------
@@ -44,6 +49,10 @@ from src.optimization.robustness import (
 
 BASE_TS = datetime(2024, 1, 1, 9, 30)
 
+# Shared Decimal constants — parsed once per module instead of per call.
+_D0 = Decimal("0")
+_D10K = Decimal("10000")
+
 
 def make_bar(idx: int, close: str, vol: int = 1000) -> MarketEvent:
     return MarketEvent(
@@ -72,11 +81,18 @@ def make_fill(
         quantity=Decimal(qty),
         fill_price=Decimal(price),
         commission=Decimal(commission),
-        slippage=Decimal("0"),
-        spread_cost=Decimal("0"),
+        slippage=_D0,
+        spread_cost=_D0,
     )
 
 
+@dataclass
+class _StubResult:
+    """Plain stand-in for BacktestResult — only the fields WFO/sensitivity read."""
+    equity_log: list = field(default_factory=list)
+    fill_log: list = field(default_factory=list)
+
+
 def make_bars(n: int, base: float = 100.0, trend: float = 0.1) -> list[MarketEvent]:
     """Generate n bars with gentle uptrend."""
     bars = []
@@ -86,6 +102,18 @@ def make_bars(n: int, base: float = 100.0, trend: float = 0.1) -> list[MarketEve
     return bars
 
 
+# MarketEvents are frozen, so one build can be shared by a whole class.
+
+@pytest.fixture(scope="class")
+def bars_5() -> list[MarketEvent]:
+    return make_bars(5)
+
+
+@pytest.fixture(scope="class")
+def bars_200() -> list[MarketEvent]:
+    return make_bars(200)
+
+
 # ===========================================================================
 # BarSliceHandler Tests
 # ===========================================================================
@@ -93,9 +121,8 @@ def make_bars(n: int, base: float = 100.0, trend: float = 0.1) -> list[MarketEve
 
 class TestBarSliceHandler:
 
-    def test_streams_all_bars(self):
-        bars = make_bars(5)
-        handler = _BarSliceHandler(bars, "TEST", "1d")
+    def test_streams_all_bars(self, bars_5):
+        handler = _BarSliceHandler(bars_5, "TEST", "1d")
         streamed = list(handler.stream_bars())
         assert len(streamed) == 5
         assert handler.symbol == "TEST"
@@ -105,6 +132,18 @@ class TestBarSliceHandler:
         handler = _BarSliceHandler([], "TEST", "1d")
         assert list(handler.stream_bars()) == []
 
+    def test_index_window_streams_without_copy(self):
+        bars = make_bars(10)
+        handler = _BarSliceHandler(bars, "TEST", "1d", start=3, stop=7)
+        streamed = list(handler.stream_bars())
+        assert streamed == bars[3:7]
+        assert streamed[0] is bars[3]
+
+    def test_window_starts_arithmetic(self):
+        assert list(_window_starts(200, 50, 25, 25)) == [0, 25, 50, 75, 100, 125]
+        assert list(_window_starts(10, 50, 20, 20)) == []
+        assert list(_window_starts(75, 50, 25, 10)) == [0]
+
 
 # ===========================================================================
 # Monte Carlo Tests
@@ -118,7 +157,7 @@ class TestPairFillsToPnls:
             make_fill(0, OrderSide.BUY, "100"),
             make_fill(1, OrderSide.SELL, "110"),
         ]
-        pnls, equity = _pair_fills_to_pnls(fills, Decimal("10000"))
+        pnls, equity = _pair_fills_to_pnls(fills, _D10K)
         assert len(pnls) == 1
         # PnL = (110 - 100) * 10 - 2 (commissions) = 98
         assert pnls[0] == Decimal("98")
@@ -129,7 +168,7 @@ class TestPairFillsToPnls:
             make_fill(0, OrderSide.SELL, "110"),
             make_fill(1, OrderSide.BUY, "100"),
         ]
-        pnls, equity = _pair_fills_to_pnls(fills, Decimal("10000"))
+        pnls, equity = _pair_fills_to_pnls(fills, _D10K)
         assert len(pnls) == 1
         # PnL = (110 - 100) * 10 - 2 = 98
         assert pnls[0] == Decimal("98")
@@ -141,19 +180,32 @@ class TestPairFillsToPnls:
             make_fill(2, OrderSide.BUY, "103"),
             make_fill(3, OrderSide.SELL, "108"),
         ]
-        pnls, _ = _pair_fills_to_pnls(fills, Decimal("10000"))
+        pnls, _ = _pair_fills_to_pnls(fills, _D10K)
         assert len(pnls) == 2
 
     def test_empty_fills(self):
-        pnls, equity = _pair_fills_to_pnls([], Decimal("10000"))
+        pnls, equity = _pair_fills_to_pnls([], _D10K)
         assert pnls == []
-        assert equity == Decimal("10000")
+        assert equity == _D10K
 
     def test_unpaired_fill(self):
         fills = [make_fill(0, OrderSide.BUY, "100")]
-        pnls, _ = _pair_fills_to_pnls(fills, Decimal("10000"))
+        pnls, _ = _pair_fills_to_pnls(fills, _D10K)
         assert len(pnls) == 0
 
+    def test_scaled_pnls_are_exact_for_forex_prices(self):
+        fills = [
+            make_fill(0, OrderSide.BUY, "1.08515", qty="1000", commission="0.5"),
+            make_fill(1, OrderSide.SELL, "1.08742", qty="1000", commission="0.5"),
+        ]
+        scaled, scale = pair_fills_to_scaled_pnls(fills)
+        assert scale == 5
+        # (1.08742 - 1.08515) * 1000 - 1 = 1.27
+        assert scaled == [127000]
+        pnls, equity = _pair_fills_to_pnls(fills, _D10K)
+        assert pnls == [Decimal("1.27")]
+        assert equity == Decimal("10001.27")
+
 
 class TestSimulateEquityCurve:
 
@@ -173,6 +225,45 @@ class TestSimulateEquityCurve:
         assert max_dd == 0.0
         assert final == 10300.0
 
+    def test_accepts_ndarray(self):
+        import numpy as np
+        final, max_dd = _simulate_equity_curve(
+            np.array([100.0, -200.0, 300.0]), 10000.0,
+        )
+        assert final == 10200.0
+        assert max_dd == pytest.approx(200.0 / 10100.0 * 100.0)
+
+    def test_empty_pnls(self):
+        final, max_dd = _simulate_equity_curve([], 10000.0)
+        assert final == 10000.0
+        assert max_dd == 0.0
+
+    def test_numba_kernel_matches_numpy(self):
+        import numpy as np
+        pytest.importorskip("numba")
+        rng = np.random.default_rng(0)
+        matrix = rng.normal(0.0, 150.0, size=(64, 40))
+        jit_final, jit_dd = _simulate_equity_curves(matrix, 10000.0)
+        np_final, np_dd = _simulate_equity_curves_numpy(matrix, 10000.0)
+        np.testing.assert_array_equal(jit_final, np_final)
+        np.testing.assert_allclose(jit_dd, np_dd, rtol=1e-12)
+
+    def test_numpy_fallback_no_drawdown_fast_path(self, monkeypatch):
+        import numpy as np
+        from src.optimization import _mc_numba
+        monkeypatch.setattr(_mc_numba, "NUMBA_AVAILABLE", False)
+        matrix = np.array([[100.0, 0.0, 100.0], [0.0, 100.0, 100.0]])
+        finals, max_dds = _simulate_equity_curves(matrix, 10000.0)
+        assert finals.tolist() == [10200.0, 10200.0]
+        assert max_dds.tolist() == [0.0, 0.0]
+
+    def test_numpy_fallback_without_numba(self, monkeypatch):
+        from src.optimization import _mc_numba
+        monkeypatch.setattr(_mc_numba, "NUMBA_AVAILABLE", False)
+        final, max_dd = _simulate_equity_curve([100.0, -200.0, 300.0], 10000.0)
+        assert final == 10200.0
+        assert max_dd == pytest.approx(200.0 / 10100.0 * 100.0)
+
 
 class TestRunMonteCarlo:
 
@@ -204,6 +295,16 @@ class TestRunMonteCarlo:
         assert result.n_trades == 0
         assert result.n_permutations == 0
 
+    def test_result_types_are_frozen_with_slots(self):
+        from dataclasses import FrozenInstanceError
+
+        for cls in (MCResult, WFOResult, WFOWindow, SensitivityResult,
+                    RobustnessReport):
+            assert "__slots__" in vars(cls), cls.__name__
+        result = run_monte_carlo([], n_permutations=100)
+        with pytest.raises(FrozenInstanceError):
+            result.n_trades = 5
+
     def test_reproducible_with_seed(self):
         fills = [
             make_fill(0, OrderSide.BUY, "100"),
@@ -217,6 +318,28 @@ class TestRunMonteCarlo:
         r2 = run_monte_carlo(fills, n_permutations=50, seed=123)
         assert r1.p5_equity == r2.p5_equity
         assert r1.p95_equity == r2.p95_equity
+        # Generator.permuted(out=) is fully determined by the seed: every
+        # permutation, not just the summary percentiles, must match.
+        assert r1.permutations == r2.permutations
+
+    def test_batched_permutations_match_scalar_simulation(self):
+        fills = [
+            make_fill(0, OrderSide.BUY, "100"),
+            make_fill(1, OrderSide.SELL, "110"),
+            make_fill(2, OrderSide.BUY, "105"),
+            make_fill(3, OrderSide.SELL, "95"),
+            make_fill(4, OrderSide.BUY, "108"),
+            make_fill(5, OrderSide.SELL, "120"),
+        ]
+        result = run_monte_carlo(fills, n_permutations=20, seed=7)
+        assert len(result.permutations) == 20
+        for perm in result.permutations:
+            # Shuffling preserves the trade multiset, so the final equity
+            # is invariant; only the path (and drawdown) changes.
+            assert perm.final_equity == pytest.approx(
+                result.original_final_equity,
+            )
+            assert perm.max_drawdown_pct >= 0.0
 
 
 # ===========================================================================
@@ -228,12 +351,13 @@ class TestSensitivity:
 
     def test_basic_sensitivity(self):
         """Test with mocked engine to avoid data loading."""
-        mock_result = MagicMock()
-        mock_result.equity_log = [
-            {"timestamp": BASE_TS, "equity": Decimal("10000"), "cash": Decimal("10000")},
-            {"timestamp": BASE_TS + timedelta(days=1), "equity": Decimal("10100"), "cash": Decimal("10100")},
-        ]
-        mock_result.fill_log = []
+        mock_result = _StubResult(
+            equity_log=[
+                {"timestamp": BASE_TS, "equity": _D10K, "cash": _D10K},
+                {"timestamp": BASE_TS + timedelta(days=1), "equity": Decimal("10100"), "cash": Decimal("10100")},
+            ],
+            fill_log=[],
+        )
 
         mock_engine = MagicMock()
         mock_engine.run.return_value = mock_result
@@ -268,11 +392,12 @@ class TestSensitivity:
         assert result.overall_stability == 0.0
 
     def test_non_numeric_params_skipped(self):
-        mock_result = MagicMock()
-        mock_result.equity_log = [
-            {"timestamp": BASE_TS, "equity": Decimal("10000"), "cash": Decimal("10000")},
-        ]
-        mock_result.fill_log = []
+        mock_result = _StubResult(
+            equity_log=[
+                {"timestamp": BASE_TS, "equity": _D10K, "cash": _D10K},
+            ],
+            fill_log=[],
+        )
         mock_engine = MagicMock()
         mock_engine.run.return_value = mock_result
 
@@ -292,11 +417,12 @@ class TestSensitivity:
 
     def test_zero_param_skipped(self):
         """Parameters with value 0 should be skipped (can't perturb 0)."""
-        mock_result = MagicMock()
-        mock_result.equity_log = [
-            {"timestamp": BASE_TS, "equity": Decimal("10000"), "cash": Decimal("10000")},
-        ]
-        mock_result.fill_log = []
+        mock_result = _StubResult(
+            equity_log=[
+                {"timestamp": BASE_TS, "equity": _D10K, "cash": _D10K},
+            ],
+            fill_log=[],
+        )
         mock_engine = MagicMock()
         mock_engine.run.return_value = mock_result
 
@@ -326,12 +452,13 @@ class TestWalkForward:
         """Test WFO with mocked data and engine."""
         bars = make_bars(100, base=100.0, trend=0.5)
 
-        mock_result = MagicMock()
-        mock_result.equity_log = [
-            {"timestamp": BASE_TS, "equity": Decimal("10000"), "cash": Decimal("10000")},
-            {"timestamp": BASE_TS + timedelta(days=1), "equity": Decimal("10200"), "cash": Decimal("10200")},
-        ]
-        mock_result.fill_log = []
+        mock_result = _StubResult(
+            equity_log=[
+                {"timestamp": BASE_TS, "equity": _D10K, "cash": _D10K},
+                {"timestamp": BASE_TS + timedelta(days=1), "equity": Decimal("10200"), "cash": Decimal("10200")},
+            ],
+            fill_log=[],
+        )
 
         mock_engine = MagicMock()
         mock_engine.run.return_value = mock_result
@@ -367,15 +494,16 @@ class TestWalkForward:
         assert len(result.windows) == 0
         assert result.mean_oos_sharpe == 0.0
 
-    def test_window_count(self):
+    def test_window_count(self, bars_200):
         """Verify correct number of windows generated."""
-        bars = make_bars(200)
+        bars = bars_200
 
-        mock_result = MagicMock()
-        mock_result.equity_log = [
-            {"timestamp": BASE_TS, "equity": Decimal("10000"), "cash": Decimal("10000")},
-        ]
-        mock_result.fill_log = []
+        mock_result = _StubResult(
+            equity_log=[
+                {"timestamp": BASE_TS, "equity": _D10K, "cash": _D10K},
+            ],
+            fill_log=[],
+        )
         mock_engine = MagicMock()
         mock_engine.run.return_value = mock_result
 
@@ -399,9 +527,9 @@ class TestWalkForward:
         expected_windows = (200 - 50 - 25) // 25 + 1
         assert len(result.windows) == expected_windows
 
-    def test_no_state_leakage_between_windows(self):
+    def test_no_state_leakage_between_windows(self, bars_200):
         """TEST-11: Each window gets a fresh strategy instance."""
-        bars = make_bars(200)
+        bars = bars_200
         strategy_instances = []
 
         original_cls = MagicMock()
@@ -411,11 +539,12 @@ class TestWalkForward:
             return instance
         original_cls.side_effect = track_instances
 
-        mock_result = MagicMock()
-        mock_result.equity_log = [
-            {"timestamp": BASE_TS, "equity": Decimal("10000"), "cash": Decimal("10000")},
-        ]
-        mock_result.fill_log = []
+        mock_result = _StubResult(
+            equity_log=[
+                {"timestamp": BASE_TS, "equity": _D10K, "cash": _D10K},
+            ],
+            fill_log=[],
+        )
         mock_engine = MagicMock()
         mock_engine.run.return_value = mock_result
 
@@ -437,6 +566,21 @@ class TestWalkForward:
         ids = [id(s) for s in strategy_instances]
         assert len(set(ids)) == len(ids)
 
+    def test_strategy_class_import_is_cached(self):
+        from src.optimization.walk_forward import _import_strategy_class
+
+        _import_strategy_class.cache_clear()
+        fake_module = MagicMock()
+        try:
+            with patch("importlib.import_module", return_value=fake_module) as imp:
+                first = _import_strategy_class("reversal")
+                calls_after_first = imp.call_count
+                second = _import_strategy_class("reversal")
+            assert first is second
+            assert imp.call_count == calls_after_first
+        finally:
+            _import_strategy_class.cache_clear()
+
 
 # ===========================================================================
 # Robustness Report Tests
@@ -14,6 +14,11 @@ from src.portfolio import Portfolio
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Shared Decimal constants — parsed once per module instead of per call.
+_D0 = Decimal("0")
+_D10K = Decimal("10000")
+
+
 def _make_fill(
     side: OrderSide = OrderSide.BUY,
     quantity: str = "100",
@@ -60,8 +65,8 @@ class TestCashAndPositions:
 
     def test_initial_cash(self):
         """Portfolio starts with specified initial cash."""
-        p = Portfolio(initial_cash=Decimal("10000"))
-        assert p.cash == Decimal("10000")
+        p = Portfolio(initial_cash=_D10K)
+        assert p.cash == _D10K
 
     def test_cash_is_decimal(self):
         """Cash is always Decimal."""
@@ -70,7 +75,7 @@ class TestCashAndPositions:
 
     def test_buy_reduces_cash(self):
         """Buying reduces cash by cost."""
-        p = Portfolio(initial_cash=Decimal("10000"))
+        p = Portfolio(initial_cash=_D10K)
         fill = _make_fill(side=OrderSide.BUY, quantity="100", fill_price="50.00")
         p.process_fill(fill)
         # Cost: 100 * 50 = 5000
@@ -78,7 +83,7 @@ class TestCashAndPositions:
 
     def test_sell_increases_cash(self):
         """Selling (closing long) increases cash by proceeds."""
-        p = Portfolio(initial_cash=Decimal("10000"))
+        p = Portfolio(initial_cash=_D10K)
         # Buy first
         buy_fill = _make_fill(side=OrderSide.BUY, quantity="100", fill_price="50.00", day=15)
         p.process_fill(buy_fill)
@@ -90,12 +95,20 @@ class TestCashAndPositions:
 
     def test_position_tracked_after_buy(self):
         """Position is created after a buy fill."""
-        p = Portfolio(initial_cash=Decimal("10000"))
+        p = Portfolio(initial_cash=_D10K)
         fill = _make_fill(side=OrderSide.BUY, quantity="100", fill_price="50.00")
         p.process_fill(fill)
         assert "TEST" in p.positions
         assert p.positions["TEST"].quantity == Decimal("100")
 
+    def test_latest_equity_falls_back_to_cash(self):
+        """latest_equity is cash before any bar, then the last logged equity."""
+        p = Portfolio(initial_cash=_D10K)
+        assert p.latest_equity == _D10K
+        p.process_fill(_make_fill(quantity="100", fill_price="50.00"))
+        p.update_equity(_make_bar(close="55.00"))
+        assert p.latest_equity == p.equity_log[-1]["equity"] == Decimal("5500")
+
 
 # ===========================================================================
 # TestPnLAccuracy
@@ -109,7 +122,7 @@ class TestPnLAccuracy:
 
         This test uses exact Decimal equality, NOT pytest.approx().
         """
-        p = Portfolio(initial_cash=Decimal("10000"))
+        p = Portfolio(initial_cash=_D10K)
         buy = _make_fill(side=OrderSide.BUY, quantity="100", fill_price="50.00", day=15)
         sell = _make_fill(side=OrderSide.SELL, quantity="100", fill_price="52.00", day=16)
         p.process_fill(buy)
@@ -119,7 +132,7 @@ class TestPnLAccuracy:
 
     def test_round_trip_pnl_with_commission(self):
         """PnL accounts for commissions exactly."""
-        p = Portfolio(initial_cash=Decimal("10000"))
+        p = Portfolio(initial_cash=_D10K)
         buy = _make_fill(
             side=OrderSide.BUY, quantity="100", fill_price="50.00",
             commission="5.00", day=15,
@@ -136,7 +149,7 @@ class TestPnLAccuracy:
 
     def test_short_trade_pnl(self):
         """Short sell at 52, buy to cover at 50 = 200 PnL."""
-        p = Portfolio(initial_cash=Decimal("10000"))
+        p = Portfolio(initial_cash=_D10K)
         sell = _make_fill(side=OrderSide.SELL, quantity="100", fill_price="52.00", day=15)
         buy = _make_fill(side=OrderSide.BUY, quantity="100", fill_price="50.00", day=16)
         p.process_fill(sell)
@@ -156,7 +169,7 @@ class TestPositionSizing:
         """1% risk on $10000 with 20-pip stop = correct lot size."""
         p = Portfolio(risk_per_trade=Decimal("0.01"))
         size = p.calculate_position_size(
-            equity=Decimal("10000"),
+            equity=_D10K,
             stop_distance=Decimal("0.0020"),  # 20 pips
             price=Decimal("1.2000"),
         )
@@ -168,11 +181,11 @@ class TestPositionSizing:
         """Zero stop distance returns zero position size."""
         p = Portfolio()
         size = p.calculate_position_size(
-            equity=Decimal("10000"),
-            stop_distance=Decimal("0"),
+            equity=_D10K,
+            stop_distance=_D0,
             price=Decimal("100"),
         )
-        assert size == Decimal("0")
+        assert size == _D0
 
 
 # ===========================================================================
@@ -189,7 +202,7 @@ class TestEquityLog:
 
     def test_equity_log_grows_with_bars(self):
         """One entry per bar processed."""
-        p = Portfolio(initial_cash=Decimal("10000"))
+        p = Portfolio(initial_cash=_D10K)
         for i in range(5):
             bar = _make_bar(close="50.00", day=15 + i)
             p.update_equity(bar)
@@ -197,7 +210,7 @@ class TestEquityLog:
 
     def test_equity_correct_with_position(self):
         """Equity = cash + position value."""
-        p = Portfolio(initial_cash=Decimal("10000"))
+        p = Portfolio(initial_cash=_D10K)
         buy = _make_fill(side=OrderSide.BUY, quantity="100", fill_price="50.00")
         p.process_fill(buy)
 
@@ -218,7 +231,7 @@ class TestMarginMonitoring:
     def test_no_liquidation_when_adequate(self):
         """No liquidation needed when equity is adequate."""
         p = Portfolio(
-            initial_cash=Decimal("10000"),
+            initial_cash=_D10K,
             margin_requirement=Decimal("0.25"),
         )
         buy = _make_fill(side=OrderSide.BUY, quantity="100", fill_price="50.00")
@@ -243,15 +256,36 @@ class TestMarginMonitoring:
         to_liquidate = p.check_margin({"TEST": Decimal("40.00")})
         assert "TEST" in to_liquidate
 
+    def test_margin_check_across_symbols_uses_shared_equity(self):
+        """All symbols are valued against one equity figure."""
+        p = Portfolio(
+            initial_cash=Decimal("6000"),
+            margin_requirement=Decimal("0.50"),
+        )
+        p.process_fill(_make_fill(quantity="100", fill_price="50.00"))
+        p.process_fill(FillEvent(
+            symbol="SMALL", timestamp=datetime(2024, 1, 15, 10, 0),
+            side=OrderSide.BUY, quantity=Decimal("10"),
+            fill_price=Decimal("10.00"), commission=_D0,
+            slippage=_D0, spread_cost=_D0,
+        ))
+
+        # cash = 900; equity = 900 + 100*(48-50) + 10*(10-10) = 700
+        # TEST requires 100*48*0.5 = 2400 -> liquidate
+        # SMALL requires 10*10*0.5 = 50 -> keep
+        prices = {"TEST": Decimal("48.00"), "SMALL": Decimal("10.00")}
+        assert p.compute_equity(prices) == Decimal("700")
+        assert p.check_margin(prices) == ["TEST"]
+
     def test_force_liquidate_closes_position(self):
         """Force liquidation closes the position."""
-        p = Portfolio(initial_cash=Decimal("10000"))
+        p = Portfolio(initial_cash=_D10K)
         buy = _make_fill(side=OrderSide.BUY, quantity="100", fill_price="50.00")
         p.process_fill(buy)
 
         fill = p.force_liquidate("TEST", Decimal("45.00"))
         assert fill is not None
-        assert p.positions["TEST"].quantity == Decimal("0")
+        assert p.positions["TEST"].quantity == _D0
 
 
 # ===========================================================================
@@ -281,7 +315,7 @@ class TestOrderValidation:
 
     def test_accept_valid_order(self):
         """Valid orders pass validation."""
-        p = Portfolio(initial_cash=Decimal("10000"))
+        p = Portfolio(initial_cash=_D10K)
         valid, reason = p.validate_order(
             "TEST", OrderSide.BUY, Decimal("100"), Decimal("50"), bar_volume=1000,
         )
@@ -297,7 +331,7 @@ class TestBalanceInvariant:
 
     def test_balance_invariant_after_round_trip(self):
         """cash + position_value == initial_equity + realized_pnl."""
-        p = Portfolio(initial_cash=Decimal("10000"))
+        p = Portfolio(initial_cash=_D10K)
 
         buy = _make_fill(side=OrderSide.BUY, quantity="100", fill_price="50.00", day=15)
         p.process_fill(buy)
@@ -307,12 +341,12 @@ class TestBalanceInvariant:
 
         # After round trip: all positions closed
         # cash should be initial + realized PnL
-        expected = Decimal("10000") + p.realized_pnl
+        expected = _D10K + p.realized_pnl
         assert p.cash == expected
 
     def test_balance_invariant_with_open_position(self):
         """Equity = initial + unrealized PnL while position is open."""
-        p = Portfolio(initial_cash=Decimal("10000"))
+        p = Portfolio(initial_cash=_D10K)
 
         buy = _make_fill(side=OrderSide.BUY, quantity="100", fill_price="50.00")
         p.process_fill(buy)
@@ -323,6 +357,44 @@ class TestBalanceInvariant:
         assert equity == Decimal("5500")
 
 
+# ===========================================================================
+# TestEquityCache
+# ===========================================================================
+
+class TestEquityCache:
+    """compute_equity memo is invalidated by fills and by new prices."""
+
+    def test_cache_invalidated_by_fill(self):
+        p = Portfolio(initial_cash=_D10K)
+        prices = {"TEST": Decimal("55.00")}
+        assert p.compute_equity(prices) == _D10K
+
+        p.process_fill(_make_fill(quantity="100", fill_price="50.00"))
+        assert p.compute_equity(prices) == Decimal("5500")
+
+    def test_cache_keyed_on_prices(self):
+        p = Portfolio(initial_cash=_D10K)
+        p.process_fill(_make_fill(quantity="100", fill_price="50.00"))
+        assert p.compute_equity({"TEST": Decimal("55.00")}) == Decimal("5500")
+        assert p.compute_equity({"TEST": Decimal("45.00")}) == Decimal("4500")
+        assert p.compute_equity({"TEST": Decimal("55.00")}) == Decimal("5500")
+
+    def test_cache_invalidated_by_failed_fill(self, monkeypatch):
+        """A fill that raises after mutating cash still drops the memo."""
+        p = Portfolio(initial_cash=_D10K)
+        prices = {"TEST": Decimal("55.00")}
+        assert p.compute_equity(prices) == _D10K
+
+        def partial_buy(fill, friction):
+            p._cash -= Decimal("100")
+            raise RuntimeError("fill failed")
+
+        monkeypatch.setattr(p, "_process_buy", partial_buy)
+        with pytest.raises(RuntimeError):
+            p.process_fill(_make_fill())
+        assert p.compute_equity(prices) == Decimal("9900")
+
+
 # ===========================================================================
 # TestFIFO
 # ===========================================================================
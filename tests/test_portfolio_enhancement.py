@@ -8,6 +8,7 @@ Covers:
 
 from __future__ import annotations
 
+import math
 from datetime import datetime, timedelta
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
@@ -50,11 +51,47 @@ def make_bar(idx: int, close: str, vol: int = 1000) -> MarketEvent:
     )
 
 
+class _StubStrategy:
+    """Plain strategy stand-in: returns queued signals, then None.
+
+    Used instead of MagicMock where only ``calculate_signals`` is called,
+    so per-bar dispatch is an ordinary method call.
+    """
+
+    __slots__ = ("_signals", "calls")
+
+    def __init__(self, signals: tuple = ()) -> None:
+        self._signals = iter(signals)
+        self.calls = 0
+
+    def calculate_signals(self, event: MarketEvent) -> SignalEvent | None:
+        self.calls += 1
+        return next(self._signals, None)
+
+
+def _cents(cents: int) -> Decimal:
+    """Decimal price from an integer number of cents (no string parsing)."""
+    return Decimal(cents).scaleb(-2)
+
+
 def make_bars(n: int, base: float = 100.0, trend: float = 0.5) -> list[MarketEvent]:
+    """Trending bars (same prices as make_bar), built from integer cents."""
+    base_cents = round(base * 100)
+    step_cents = round(trend * 100)
     bars = []
     for i in range(n):
-        price = base + i * trend
-        bars.append(make_bar(i, f"{price:.2f}"))
+        close_cents = base_cents + i * step_cents
+        close = _cents(close_cents)
+        bars.append(MarketEvent(
+            symbol="TEST",
+            timestamp=BASE_TS + timedelta(days=i),
+            open=close,
+            high=_cents(close_cents + 100),
+            low=_cents(close_cents - 100),
+            close=close,
+            volume=1000,
+            timeframe="1d",
+        ))
     return bars
 
 
@@ -69,12 +106,8 @@ class TestPortfolioRouter:
         """Two strategies generate signals on shared portfolio."""
         bars = make_bars(20)
 
-        # Mock strategies
-        strat_a = MagicMock()
-        strat_a.calculate_signals.return_value = None
-
-        strat_b = MagicMock()
-        strat_b.calculate_signals.return_value = None
+        strat_a = _StubStrategy()
+        strat_b = _StubStrategy()
 
         # Mock data handler
         mock_dh = MagicMock()
@@ -91,6 +124,7 @@ class TestPortfolioRouter:
         assert result.total_bars == 20
         assert "strat_a" in result.attributions
         assert "strat_b" in result.attributions
+        assert strat_a.calls == strat_b.calls == 20
 
     def test_weighted_sizing(self):
         """Weight affects position size calculation."""
@@ -100,7 +134,7 @@ class TestPortfolioRouter:
         mock_dh.stream_bars.return_value = iter([])
 
         router = PortfolioRouter(
-            strategies={"a": MagicMock()},
+            strategies={"a": _StubStrategy()},
             weights={"a": 0.5},
             data_handler=mock_dh,
         )
@@ -111,6 +145,20 @@ class TestPortfolioRouter:
         qty = router._calculate_weighted_quantity(bar, Decimal("0.5"))
         assert qty == Decimal("5")
 
+    def test_weighted_sizing_truncates_to_whole_shares(self):
+        """Fractional share counts are truncated, never rounded up."""
+        bar = make_bar(0, "7")
+        mock_dh = MagicMock()
+        mock_dh.stream_bars.return_value = iter([])
+        router = PortfolioRouter(
+            strategies={"a": _StubStrategy()},
+            weights={"a": 0.3},
+            data_handler=mock_dh,
+        )
+        # 10000 * 0.3 * 0.10 / 7 = 42.857...
+        qty = router._calculate_weighted_quantity(bar, router._decimal_weights["a"])
+        assert qty == Decimal("42")
+
     def test_attribution_tracking(self):
         """Strategy attribution correctly counts signals."""
         bars = make_bars(5)
@@ -122,8 +170,7 @@ class TestPortfolioRouter:
             strength=Decimal("0.8"),
         )
 
-        strat_a = MagicMock()
-        strat_a.calculate_signals.side_effect = [signal, None, None, None, None]
+        strat_a = _StubStrategy((signal,))
 
         mock_dh = MagicMock()
         mock_dh.stream_bars.return_value = iter(bars)
@@ -159,7 +206,7 @@ class TestPortfolioRouter:
         mock_dh = MagicMock()
         mock_dh.stream_bars.return_value = iter([])
         router = PortfolioRouter(
-            strategies={"a": MagicMock()},
+            strategies={"a": _StubStrategy()},
             weights={"a": 0.0},
             data_handler=mock_dh,
         )
@@ -172,7 +219,7 @@ class TestPortfolioRouter:
         mock_dh = MagicMock()
         mock_dh.stream_bars.return_value = iter([])
         router = PortfolioRouter(
-            strategies={"a": MagicMock()},
+            strategies={"a": _StubStrategy()},
             weights={"a": 1.0},
             data_handler=mock_dh,
         )
@@ -214,6 +261,18 @@ class TestBenchmarkEquity:
         # 50000 / 100 = 500 shares × 110 = 55000
         assert float(equity[-1]["equity"]) == pytest.approx(55000.0, rel=1e-6)
 
+    def test_equity_entries_are_decimal_with_bar_timestamps(self):
+        bars = make_bars(5)
+        equity = compute_benchmark_equity(bars)
+        assert [e["timestamp"] for e in equity] == [b.timestamp for b in bars]
+        assert all(isinstance(e["equity"], Decimal) for e in equity)
+
+    def test_equity_is_exact_decimal(self):
+        """Equity is shares * close in Decimal, not a float round trip."""
+        bars = [make_bar(0, "3"), make_bar(1, "7")]
+        equity = compute_benchmark_equity(bars)
+        assert equity[-1]["equity"] == Decimal("10000") / Decimal("3") * Decimal("7")
+
 
 class TestBenchmarkMetrics:
 
@@ -282,6 +341,16 @@ class TestBenchmarkMetrics:
         assert metrics.strategy_return_pct == pytest.approx(10.0, rel=0.01)
         assert metrics.benchmark_return_pct == pytest.approx(5.0, rel=0.01)
 
+    def test_zero_equity_step_skipped(self):
+        """A return out of a zero equity is dropped, not divided by zero."""
+        strat = self._make_equity_log([10000, 0, 10000, 10100, 10200, 10300])
+        bench = self._make_equity_log([10000, 10100, 10200, 10300, 10400, 10500])
+
+        metrics = compute_benchmark_metrics(strat, bench)
+        assert metrics.strategy_return_pct == pytest.approx(3.0, rel=0.01)
+        assert math.isfinite(metrics.beta)
+        assert math.isfinite(metrics.information_ratio)
+
 
 # ===========================================================================
 # Integration Tests
@@ -69,6 +69,16 @@ def _make_indexed_bar(idx: int, price: float, spread: float = 1.0) -> MarketEven
     )
 
 
+@pytest.fixture(scope="module")
+def flat_bars() -> tuple[MarketEvent, ...]:
+    """30 bars at price 100 with spread 1.0, built once per module.
+
+    MarketEvent is frozen, so tests can share the tuple; tests that
+    extend the series copy a slice into a list first.
+    """
+    return tuple(_make_indexed_bar(i, 100, 1.0) for i in range(30))
+
+
 class _MockAlwaysLongStrategy(BaseStrategy):
     """Mock strategy that always returns LONG signal."""
 
@@ -107,26 +117,26 @@ class _MockNeverSignalStrategy(BaseStrategy):
 class TestATRRegimeClassifier:
     """Tests for ATRRegimeClassifier (REG-01)."""
 
-    def test_warmup_returns_normal(self):
+    def test_warmup_returns_normal(self, flat_bars):
         """During warmup (< atr_period history), regime = NORMAL."""
         clf = ATRRegimeClassifier(atr_period=14, regime_lookback=50)
-        buf = [_make_indexed_bar(i, 100, 1.0) for i in range(5)]
+        buf = flat_bars[:5]
         result = clf.update(buf)
         assert result == VolatilityRegime.NORMAL
 
-    def test_stable_atr_returns_normal(self):
+    def test_stable_atr_returns_normal(self, flat_bars):
         """Consistent bars produce NORMAL regime."""
         clf = ATRRegimeClassifier(atr_period=5, regime_lookback=20)
-        buf = [_make_indexed_bar(i, 100, 1.0) for i in range(30)]
+        buf = flat_bars[:30]
         for end in range(6, len(buf) + 1):
             clf.update(buf[:end])
         assert clf.regime == VolatilityRegime.NORMAL
 
-    def test_high_spike_detected(self):
+    def test_high_spike_detected(self, flat_bars):
         """Sudden volatility spike → HIGH regime."""
         clf = ATRRegimeClassifier(atr_period=5, regime_lookback=20)
         # 25 stable bars
-        buf = [_make_indexed_bar(i, 100, 1.0) for i in range(25)]
+        buf = list(flat_bars[:25])
         for end in range(6, 26):
             clf.update(buf[:end])
 
@@ -155,10 +165,10 @@ class TestATRRegimeClassifier:
 
         assert clf.regime == VolatilityRegime.LOW
 
-    def test_properties(self):
+    def test_properties(self, flat_bars):
         """Properties return correct values."""
         clf = ATRRegimeClassifier(atr_period=5)
-        buf = [_make_indexed_bar(i, 100, 1.0) for i in range(10)]
+        buf = flat_bars[:10]
         clf.update(buf)
         assert clf.regime == VolatilityRegime.NORMAL
         assert clf.current_atr >= Decimal("0")
@@ -172,13 +182,61 @@ class TestATRRegimeClassifier:
         single = [_make_indexed_bar(0, 100, 1.0)]
         assert clf.update(single) == VolatilityRegime.NORMAL
 
-    def test_regime_property_consistency(self):
+    def test_regime_property_consistency(self, flat_bars):
         """Returned value matches .regime property."""
         clf = ATRRegimeClassifier(atr_period=5)
-        buf = [_make_indexed_bar(i, 100, 1.0) for i in range(10)]
+        buf = flat_bars[:10]
         result = clf.update(buf)
         assert result == clf.regime
 
+    def test_update_stream_matches_prefix_updates(self):
+        """update_stream reaches the same state as update(buf[:end]) calls."""
+        buf = [_make_indexed_bar(i, 100, 5.0) for i in range(20)]
+        buf += [_make_indexed_bar(i, 100, 0.1) for i in range(20, 35)]
+        by_prefix = ATRRegimeClassifier(atr_period=5, regime_lookback=20)
+        for end in range(1, len(buf) + 1):
+            by_prefix.update(buf[:end])
+
+        streamed = ATRRegimeClassifier(atr_period=5, regime_lookback=20)
+        assert streamed.update_stream(buf) == by_prefix.regime == VolatilityRegime.LOW
+        assert streamed.current_atr == by_prefix.current_atr
+
+    def test_update_bar_matches_window_recompute(self, flat_bars):
+        """Rolling-TR update_bar gives exactly the windowed ATR and regime."""
+        buf = list(flat_bars[:25])
+        buf += [_make_indexed_bar(i, 100, 10.0) for i in range(25, 35)]
+        windowed = ATRRegimeClassifier(atr_period=5, regime_lookback=20)
+        rolling = ATRRegimeClassifier(atr_period=5, regime_lookback=20)
+        for end in range(2, len(buf) + 1):
+            expected = windowed.update(buf[:end])
+            assert rolling.update_bar(buf[end - 1], buf[end - 2]) == expected
+            assert rolling.current_atr == windowed.current_atr
+        assert rolling.regime == VolatilityRegime.HIGH
+
+    def test_ratio_on_threshold_is_normal(self):
+        """ATR exactly at low_threshold × mean ATR is not LOW (strict <)."""
+        clf = ATRRegimeClassifier(atr_period=1, regime_lookback=2)
+        buf = [
+            _make_indexed_bar(0, 100, 1.0),
+            _make_indexed_bar(1, 100, 1.0),  # TR 2.0
+            _make_indexed_bar(2, 100, 0.6),  # TR 1.2 -> ratio 1.2 / 1.6 = 0.75
+        ]
+        clf.update(buf[:2])
+        assert clf.update(buf) == VolatilityRegime.NORMAL
+
+    def test_non_contiguous_buffer_rebuilds_window(self, flat_bars):
+        """A buffer that does not continue the stream gets a fresh ATR window."""
+        clf = ATRRegimeClassifier(atr_period=5, regime_lookback=20)
+        buf = flat_bars[:20]
+        for end in range(2, len(buf) + 1):
+            clf.update(buf[:end])
+
+        other = [_make_indexed_bar(i, 150, 4.0) for i in range(3)]
+        fresh = ATRRegimeClassifier(atr_period=5, regime_lookback=20)
+        fresh.update(other)
+        clf.update(other)
+        assert clf.current_atr == fresh.current_atr
+
 
 # ---------------------------------------------------------------------------
 # TestADXClassifier
@@ -187,10 +245,10 @@ class TestATRRegimeClassifier:
 class TestADXClassifier:
     """Tests for ADXClassifier (REG-02)."""
 
-    def test_warmup_returns_zero(self):
+    def test_warmup_returns_zero(self, flat_bars):
         """Before Phase A completes, ADX = 0."""
         clf = ADXClassifier(period=14)
-        bars = [_make_indexed_bar(i, 100, 1.0) for i in range(5)]
+        bars = flat_bars[:5]
         for i in range(1, len(bars)):
             clf.update(bars[i], bars[i - 1])
         assert clf.adx == Decimal("0")
@@ -230,6 +288,19 @@ class TestADXClassifier:
         clf._adx = Decimal("50")
         assert clf.classify() == TrendStrength.STRONG_TREND
 
+    def test_classify_boundaries_go_to_upper_bucket(self):
+        """ADX exactly on a threshold falls into the higher bucket."""
+        clf = ADXClassifier(period=14)
+        expected = {
+            "19.99": TrendStrength.RANGING,
+            "20": TrendStrength.WEAK_TREND,
+            "25": TrendStrength.TRENDING,
+            "40": TrendStrength.STRONG_TREND,
+        }
+        for adx, strength in expected.items():
+            clf._adx = Decimal(adx)
+            assert clf.classify() == strength
+
     def test_di_values_uptrend(self):
         """+DI > -DI in uptrend."""
         clf = ADXClassifier(period=5)
@@ -273,9 +344,7 @@ class TestRegimeClassifier:
 
     def _feed_bars(self, clf, bars):
         """Feed a sequence of bars into the classifier."""
-        for i, bar in enumerate(bars):
-            buf = bars[:i + 1]
-            clf.update(bar, buf)
+        clf.update_stream(bars)
 
     def test_strong_trend_classification(self):
         """Strong trending bars produce a trending-family regime."""
@@ -322,11 +391,39 @@ class TestRegimeClassifier:
         assert regime is not None
         assert regime.bullish_pressure is True
 
+    def test_update_stream_matches_prefix_updates(self):
+        """update_stream gives the same regime as per-prefix update calls."""
+        bars = [_make_indexed_bar(i, 100 + i * 2, 1.0 + (i % 4) * 0.5) for i in range(40)]
+        by_prefix = RegimeClassifier(atr_period=5, adx_period=5, regime_lookback=20)
+        for i, bar in enumerate(bars):
+            by_prefix.update(bar, bars[:i + 1])
+
+        streamed = RegimeClassifier(atr_period=5, adx_period=5, regime_lookback=20)
+        assert streamed.update_stream(iter(bars)) == by_prefix.regime
+
     def test_regime_property_before_update(self):
         """Before any update, regime is None."""
         clf = RegimeClassifier()
         assert clf.regime is None
 
+    def test_shared_true_range_matches_standalone_classifiers(self):
+        """Feeding one TR to both sub-classifiers changes no values."""
+        bars = [_make_indexed_bar(i, 100 + (i % 7) * 2 - i * 0.5, 1.0 + (i % 3)) for i in range(40)]
+        clf = RegimeClassifier(atr_period=5, adx_period=5, regime_lookback=20)
+        self._feed_bars(clf, bars)
+
+        atr = ATRRegimeClassifier(atr_period=5, regime_lookback=20)
+        adx = ADXClassifier(period=5)
+        for end in range(1, len(bars) + 1):
+            atr.update(bars[:end])
+        for i in range(1, len(bars)):
+            adx.update(bars[i], bars[i - 1])
+
+        assert clf.regime.current_atr == atr.current_atr
+        assert clf.regime.vol_regime == atr.regime
+        assert clf.regime.adx == adx.adx
+        assert clf.regime.plus_di == adx.plus_di
+
 
 # ---------------------------------------------------------------------------
 # TestRegimeGatedStrategy
@@ -380,6 +477,15 @@ class TestRegimeGatedStrategy:
 
         assert inner.call_count == 10
 
+    def test_allowed_regimes_accepts_any_iterable(self):
+        """allowed_regimes is consumed once; a generator gates like a list."""
+        gated = RegimeGatedStrategy(
+            inner_strategy=_MockAlwaysLongStrategy(),
+            allowed_regimes=(rt for rt in RegimeType),
+        )
+        bar = _make_indexed_bar(0, 100, 1.0)
+        assert gated.calculate_signals(bar) is not None
+
     def test_current_regime_property(self):
         """current_regime property returns MarketRegime after update."""
         inner = _MockNeverSignalStrategy()
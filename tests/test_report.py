@@ -12,8 +12,8 @@ Covers:
 
 from __future__ import annotations
 
+import gzip
 import os
-import tempfile
 from datetime import datetime, timedelta
 from decimal import Decimal
 from unittest.mock import patch
@@ -29,6 +29,7 @@ from src.report import (
     _build_equity_figure,
     _build_drawdown_figure,
     _fig_to_html,
+    _load_template,
 )
 
 
@@ -89,6 +90,17 @@ def _make_result() -> BacktestResult:
     )
 
 
+@pytest.fixture(scope="module")
+def result() -> BacktestResult:
+    """Shared sample result; reports only read it."""
+    return _make_result()
+
+
+@pytest.fixture(scope="module")
+def metrics() -> MetricsResult:
+    return _make_metrics()
+
+
 # ===========================================================================
 # Trade Extraction Tests
 # ===========================================================================
@@ -138,6 +150,19 @@ class TestPairFillsToTrades:
     def test_empty_fills(self):
         assert _pair_fills_to_trades([]) == []
 
+    def test_pnl_nets_all_frictions(self):
+        """Commission, slippage and spread of both legs are deducted."""
+        fills = [
+            FillEvent("TEST", BASE_TS, OrderSide.BUY, Decimal("2.5"),
+                      Decimal("100.10"), Decimal("1"), Decimal("0.05"), Decimal("0.025")),
+            FillEvent("TEST", BASE_TS + timedelta(days=1), OrderSide.SELL, Decimal("2.5"),
+                      Decimal("101.30"), Decimal("1"), Decimal("0.05"), Decimal("0.025")),
+        ]
+        trades = _pair_fills_to_trades(fills)
+        # 1.20 * 2.5 - 2 * (1 + 0.05 + 0.025)
+        assert trades[0]["pnl"] == 0.85
+        assert trades[0]["quantity"] == 2.5
+
 
 # ===========================================================================
 # Chart Tests
@@ -146,26 +171,36 @@ class TestPairFillsToTrades:
 
 class TestCharts:
 
-    def test_equity_figure_has_data(self):
-        result = _make_result()
+    def test_equity_figure_has_data(self, result):
         fig = _build_equity_figure(result.equity_log)
         assert len(fig.data) > 0
 
+    def test_figure_timestamps_are_iso_strings(self, result):
+        fig = _build_drawdown_figure(result.equity_log)
+        assert fig.data[0].x[0] == BASE_TS.isoformat()
+        assert len(fig.data[0].x) == len(result.equity_log)
+
     def test_equity_figure_empty(self):
         fig = _build_equity_figure([])
         assert len(fig.data) == 0
 
-    def test_drawdown_figure_has_data(self):
-        result = _make_result()
+    def test_drawdown_figure_has_data(self, result):
         fig = _build_drawdown_figure(result.equity_log)
         assert len(fig.data) > 0
 
+    def test_drawdown_values_from_running_peak(self):
+        equity_log = [
+            {"timestamp": BASE_TS + timedelta(days=i), "equity": Decimal(e)}
+            for i, e in enumerate(["100", "120", "90", "130", "117"])
+        ]
+        fig = _build_drawdown_figure(equity_log)
+        assert list(fig.data[0].y) == pytest.approx([0, 0, -25, 0, -10])
+
     def test_drawdown_figure_empty(self):
         fig = _build_drawdown_figure([])
         assert len(fig.data) == 0
 
-    def test_fig_to_html(self):
-        result = _make_result()
+    def test_fig_to_html(self, result):
         fig = _build_equity_figure(result.equity_log)
         html = _fig_to_html(fig)
         assert "<div" in html
@@ -179,9 +214,7 @@ class TestCharts:
 
 class TestHTMLReport:
 
-    def test_basic_html_generation(self):
-        result = _make_result()
-        metrics = _make_metrics()
+    def test_basic_html_generation(self, result, metrics):
         html = generate_report(
             result, metrics,
             format="html",
@@ -194,74 +227,74 @@ class TestHTMLReport:
         assert "500.00" in html  # Net PnL
         assert "1.50" in html   # Sharpe
 
-    def test_kpi_section(self):
-        result = _make_result()
-        metrics = _make_metrics()
+    def test_kpi_section(self, result, metrics):
         html = generate_report(result, metrics, format="html")
         assert "Key Performance Indicators" in html
         assert "Net PnL" in html
         assert "Sharpe Ratio" in html
 
-    def test_trade_list(self):
-        result = _make_result()
-        metrics = _make_metrics()
+    def test_trade_list(self, result, metrics):
         html = generate_report(result, metrics, format="html")
         assert "Trade List" in html
         assert "LONG" in html
 
-    def test_custom_title(self):
-        result = _make_result()
-        metrics = _make_metrics()
+    def test_custom_title(self, result, metrics):
         html = generate_report(
             result, metrics, format="html",
             title="My Custom Report",
         )
         assert "My Custom Report" in html
 
-    def test_branding(self):
-        result = _make_result()
-        metrics = _make_metrics()
+    def test_branding(self, result, metrics):
         html = generate_report(
             result, metrics, format="html",
             branding="apex-backtest v2.0",
         )
         assert "apex-backtest v2.0" in html
 
-    def test_hide_sections(self):
-        result = _make_result()
-        metrics = _make_metrics()
+    def test_hide_sections(self, result, metrics):
         html = generate_report(
             result, metrics, format="html",
             show_sections={"show_trades": False},
         )
         assert "Trade List" not in html
 
-    def test_output_to_file(self):
-        result = _make_result()
-        metrics = _make_metrics()
-        with tempfile.NamedTemporaryFile(suffix=".html", delete=False) as f:
-            path = f.name
-
-        try:
-            html = generate_report(
-                result, metrics, format="html",
-                output_path=path,
-            )
-            assert os.path.exists(path)
-            with open(path, encoding="utf-8") as f:
-                content = f.read()
-            assert "<!DOCTYPE html>" in content
-        finally:
-            os.unlink(path)
-
-    def test_empty_result(self):
+    def test_output_to_file(self, result, metrics, tmp_path):
+        path = tmp_path / "report.html"
+        html = generate_report(
+            result, metrics, format="html",
+            output_path=str(path),
+        )
+        assert "<!DOCTYPE html>" in html
+        # The file holds exactly the returned report
+        assert path.read_text(encoding="utf-8") == html
+
+    def test_output_to_gzip_file(self, result, metrics, tmp_path):
+        path = tmp_path / "report.html.gz"
+        html = generate_report(
+            result, metrics, format="html",
+            output_path=str(path),
+        )
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            assert f.read() == html
+
+        # compress=True without the suffix writes report.html.gz instead
+        path = tmp_path / "report.html"
+        generate_report(
+            result, metrics, format="html",
+            output_path=str(path), compress=True,
+        )
+        assert not path.exists()
+        with gzip.open(tmp_path / "report.html.gz", "rt", encoding="utf-8") as f:
+            assert "<!DOCTYPE html>" in f.read()
+
+    def test_empty_result(self, metrics):
         """Empty result should not crash."""
         result = BacktestResult()
-        metrics = _make_metrics()
         html = generate_report(result, metrics, format="html")
         assert "<!DOCTYPE html>" in html
 
-    def test_robustness_section(self):
+    def test_robustness_section(self, result, metrics):
         from src.optimization.robustness import RobustnessReport
         rob = RobustnessReport(
             wfo_efficiency=0.8,
@@ -279,8 +312,6 @@ class TestHTMLReport:
             overall_pass=True,
             score=85.0,
         )
-        result = _make_result()
-        metrics = _make_metrics()
         html = generate_report(
             result, metrics, format="html",
             robustness=rob,
@@ -296,26 +327,26 @@ class TestHTMLReport:
 
 class TestPDFReport:
 
-    def test_pdf_fallback_to_html(self):
+    def test_pdf_fallback_to_html(self, result, metrics, tmp_path):
         """Without WeasyPrint, falls back to HTML file."""
-        result = _make_result()
-        metrics = _make_metrics()
-
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            path = f.name
-
-        try:
-            output = generate_report(
-                result, metrics, format="pdf",
-                output_path=path,
-            )
-            # Should produce a file (HTML fallback if no WeasyPrint)
-            html_path = path.replace(".pdf", ".html")
-            assert os.path.exists(html_path) or os.path.exists(path)
-        finally:
-            for p in [path, path.replace(".pdf", ".html")]:
-                if os.path.exists(p):
-                    os.unlink(p)
+        path = tmp_path / "report.pdf"
+        output = generate_report(
+            result, metrics, format="pdf",
+            output_path=str(path),
+        )
+        # Should produce a file (HTML fallback if no WeasyPrint)
+        assert os.path.exists(output)
+        assert output in (str(path), str(tmp_path / "report.html"))
+
+    def test_compressed_pdf_fallback_returns_gz_path(self, result, metrics, tmp_path):
+        """A gzipped HTML fallback is returned under its real .gz path."""
+        path = tmp_path / "report.pdf"
+        output = generate_report(
+            result, metrics, format="pdf",
+            output_path=str(path), compress=True,
+        )
+        assert os.path.exists(output)
+        assert output in (str(path), str(tmp_path / "report.html.gz"))
 
 
 # ===========================================================================
@@ -325,25 +356,27 @@ class TestPDFReport:
 
 class TestTemplate:
 
-    def test_custom_template(self):
+    def test_custom_template(self, result, metrics, tmp_path):
         """Custom template can be loaded."""
-        with tempfile.NamedTemporaryFile(
-            suffix=".html", mode="w", delete=False, encoding="utf-8",
-        ) as f:
-            f.write("<html><body>Custom: {{ title }}</body></html>")
-            template_path = f.name
-
-        try:
-            result = _make_result()
-            metrics = _make_metrics()
-            html = generate_report(
-                result, metrics, format="html",
-                template_path=template_path,
-                title="TestTitle",
-            )
-            assert "Custom: TestTitle" in html
-        finally:
-            os.unlink(template_path)
+        template_path = tmp_path / "custom.html"
+        template_path.write_text(
+            "<html><body>Custom: {{ title }}</body></html>", encoding="utf-8",
+        )
+        html = generate_report(
+            result, metrics, format="html",
+            template_path=str(template_path),
+            title="TestTitle",
+        )
+        assert "Custom: TestTitle" in html
+
+    def test_templates_compiled_once(self, tmp_path):
+        """Built-in and custom templates are reused across reports."""
+        assert _load_template(None) is _load_template(None)
+
+        template_path = tmp_path / "custom.html"
+        template_path.write_text("<p>{{ title }}</p>", encoding="utf-8")
+        first = _load_template(str(template_path))
+        assert _load_template(str(template_path)) is first
 
 
 # ===========================================================================
@@ -15,7 +15,9 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 from decimal import Decimal
+from types import SimpleNamespace
 from typing import Optional
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -35,6 +37,8 @@ from src.risk_manager import (
 # ---------------------------------------------------------------------------
 
 BASE_TS = datetime(2024, 1, 15, 10, 0, 0)
+_ZERO = Decimal("0")
+_ONE = Decimal("1")
 
 
 def _make_bar(
@@ -43,8 +47,8 @@ def _make_bar(
 ) -> MarketEvent:
     """Create a MarketEvent with Decimal prices."""
     c = Decimal(str(close))
-    h = Decimal(str(high)) if high is not None else c + Decimal("1")
-    l = Decimal(str(low)) if low is not None else c - Decimal("1")
+    h = Decimal(str(high)) if high is not None else c + _ONE
+    l = Decimal(str(low)) if low is not None else c - _ONE
     o = Decimal(str(open_)) if open_ is not None else c
     return MarketEvent(
         symbol=symbol,
@@ -66,8 +70,8 @@ def _make_fill(
         quantity=Decimal(str(quantity)),
         fill_price=Decimal(str(fill_price)),
         commission=Decimal(str(commission)),
-        slippage=Decimal("0"),
-        spread_cost=Decimal("0"),
+        slippage=_ZERO,
+        spread_cost=_ZERO,
     )
 
 
@@ -79,6 +83,28 @@ def _make_portfolio(initial_cash="10000", fills=None) -> Portfolio:
     return p
 
 
+@pytest.fixture(scope="class")
+def round_trips():
+    """Build long round-trip fill lists, cached per pattern for the class.
+
+    ``round_trips((100, 110), (100, 95))`` gives BUY/SELL pairs of 10
+    shares on consecutive days. FillEvents are immutable, so cached fills
+    are shared; each call returns a fresh list.
+    """
+    cache: dict[tuple, list[FillEvent]] = {}
+
+    def make(*trips: tuple) -> list[FillEvent]:
+        if trips not in cache:
+            fills = []
+            for i, (entry, exit_) in enumerate(trips):
+                fills.append(_make_fill("BUY", 10, entry, day=i * 2))
+                fills.append(_make_fill("SELL", 10, exit_, day=i * 2 + 1))
+            cache[trips] = fills
+        return list(cache[trips])
+
+    return make
+
+
 class _MockATRStrategy(BaseStrategy):
     """Mock strategy with configurable current_atr."""
 
@@ -219,61 +245,37 @@ class TestRiskManagerCore:
 class TestKellyCriterion:
     """Tests for KellyCriterion (RISK-03)."""
 
-    def test_warmup_returns_none(self):
+    def test_warmup_returns_none(self, round_trips):
         """With fewer than min_trades, kelly_fraction returns None."""
         kelly = KellyCriterion(min_trades=20)
         # Only 2 round-trips
-        fills = [
-            _make_fill("BUY", 10, 100, day=1),
-            _make_fill("SELL", 10, 110, day=2),
-            _make_fill("BUY", 10, 100, day=3),
-            _make_fill("SELL", 10, 105, day=4),
-        ]
-        kelly.update(fills)
+        kelly.update(round_trips((100, 110), (100, 105)))
         assert kelly.kelly_fraction() is None
 
-    def test_100_pct_wins_capped(self):
+    def test_100_pct_wins_capped(self, round_trips):
         """100% win rate is capped at max_kelly_pct."""
         kelly = KellyCriterion(min_trades=2, max_kelly_pct=Decimal("0.05"))
-        fills = []
-        for i in range(10):
-            fills.append(_make_fill("BUY", 10, 100, day=i * 2))
-            fills.append(_make_fill("SELL", 10, 110, day=i * 2 + 1))
-        kelly.update(fills)
+        kelly.update(round_trips(*[(100, 110)] * 10))
         frac = kelly.kelly_fraction()
         assert frac is not None
         assert frac <= Decimal("0.05")
 
-    def test_50_50_ratio_returns_zero(self):
+    def test_50_50_ratio_returns_zero(self, round_trips):
         """50% win rate with 1:1 ratio → Kelly = 0."""
         kelly = KellyCriterion(min_trades=4, fraction=Decimal("1.0"))
-        fills = []
-        # 2 wins (+10 each)
-        for i in range(2):
-            fills.append(_make_fill("BUY", 10, 100, day=i * 2))
-            fills.append(_make_fill("SELL", 10, 110, day=i * 2 + 1))
-        # 2 losses (-10 each)
-        for i in range(2, 4):
-            fills.append(_make_fill("BUY", 10, 110, day=i * 2))
-            fills.append(_make_fill("SELL", 10, 100, day=i * 2 + 1))
-        kelly.update(fills)
+        # 2 wins (+10 each), then 2 losses (-10 each)
+        kelly.update(round_trips(*[(100, 110)] * 2, *[(110, 100)] * 2))
         frac = kelly.kelly_fraction()
         assert frac is not None
         assert frac == Decimal("0")
 
-    def test_half_kelly_scaling(self):
+    def test_half_kelly_scaling(self, round_trips):
         """Half-Kelly reduces the raw Kelly fraction by 50%."""
         kelly_full = KellyCriterion(min_trades=2, fraction=Decimal("1.0"), max_kelly_pct=Decimal("1.0"))
         kelly_half = KellyCriterion(min_trades=2, fraction=Decimal("0.5"), max_kelly_pct=Decimal("1.0"))
 
-        fills = []
         # High win rate
-        for i in range(8):
-            fills.append(_make_fill("BUY", 10, 100, day=i * 2))
-            fills.append(_make_fill("SELL", 10, 120, day=i * 2 + 1))
-        for i in range(8, 10):
-            fills.append(_make_fill("BUY", 10, 100, day=i * 2))
-            fills.append(_make_fill("SELL", 10, 95, day=i * 2 + 1))
+        fills = round_trips(*[(100, 120)] * 8, *[(100, 95)] * 2)
 
         kelly_full.update(fills)
         kelly_half.update(fills)
@@ -284,30 +286,50 @@ class TestKellyCriterion:
         # Half Kelly should be ~50% of full Kelly
         assert half_frac < full_frac
 
-    def test_update_from_fill_log(self):
+    def test_update_from_fill_log(self, round_trips):
         """update() processes fill_log correctly."""
         kelly = KellyCriterion(min_trades=1)
-        fills = [
-            _make_fill("BUY", 10, 100, day=1),
-            _make_fill("SELL", 10, 150, day=2),
-        ]
-        kelly.update(fills)
+        kelly.update(round_trips((100, 150)))
         frac = kelly.kelly_fraction()
         assert frac is not None
         assert frac > Decimal("0")
 
-    def test_negative_kelly_returns_zero(self):
+    def test_negative_kelly_returns_zero(self, round_trips):
         """All losses → Kelly is negative → clamped to 0."""
         kelly = KellyCriterion(min_trades=2, fraction=Decimal("1.0"))
-        fills = []
-        for i in range(5):
-            fills.append(_make_fill("BUY", 10, 100, day=i * 2))
-            fills.append(_make_fill("SELL", 10, 80, day=i * 2 + 1))
-        kelly.update(fills)
+        kelly.update(round_trips(*[(100, 80)] * 5))
         frac = kelly.kelly_fraction()
         assert frac is not None
         assert frac == Decimal("0")
 
+    def test_growing_fill_log_matches_fresh_update(self):
+        """Incremental updates on an appended log equal a one-shot update."""
+        fills = []
+        for i in range(6):
+            fills.append(_make_fill("BUY", 10, 100, day=i * 2))
+            fills.append(_make_fill("SELL", 10, 100 + (-1) ** i * (i + 5), day=i * 2 + 1))
+
+        incremental = KellyCriterion(lookback=4, min_trades=1, max_kelly_pct=Decimal("1"))
+        for end in range(1, len(fills) + 1):
+            incremental.update(fills[:end])
+        fresh = KellyCriterion(lookback=4, min_trades=1, max_kelly_pct=Decimal("1"))
+        fresh.update(fills)
+        assert incremental.kelly_fraction() == fresh.kelly_fraction()
+
+        # An unrelated log is re-paired from scratch
+        incremental.update(fills[:2])
+        assert incremental.kelly_fraction() > Decimal("0")
+
+    def test_zero_lookback_uses_every_trade(self, round_trips):
+        """lookback=0 keeps the whole history rather than no trades."""
+        kelly = KellyCriterion(lookback=0, min_trades=5)
+        kelly.update(round_trips(*[(100, 110)] * 5))
+        assert kelly.kelly_fraction() is not None
+
+    def test_negative_lookback_rejected(self):
+        with pytest.raises(ValueError, match="lookback must be >= 0"):
+            KellyCriterion(lookback=-1)
+
 
 # ---------------------------------------------------------------------------
 # TestPortfolioHeatMonitor
@@ -443,67 +465,85 @@ class TestDrawdownScaler:
         scaler = DrawdownScaler()
         assert scaler.compute_scale([]) == Decimal("1")
 
+    def test_peak_carried_across_growing_log(self):
+        """Prefixes of one log reuse the running peak; other logs rescan."""
+        scaler = DrawdownScaler(
+            max_drawdown_pct=Decimal("0.10"),
+            full_stop_pct=Decimal("0.20"),
+            min_scale=Decimal("0.25"),
+        )
+        equity_log = [
+            {"equity": Decimal(str(e)), "timestamp": BASE_TS + timedelta(hours=i)}
+            for i, e in enumerate([10000, 9000, 8500])
+        ]
+        scales = [scaler.compute_scale(equity_log[:i + 1]) for i in range(3)]
+        assert scales == [Decimal("1"), Decimal("1"), Decimal("0.625")]
+
+        # A new log with a lower peak must not inherit the old one
+        other = [{"equity": Decimal("8500"), "timestamp": BASE_TS}]
+        assert scaler.compute_scale(other) == Decimal("1")
+
 
 # ---------------------------------------------------------------------------
 # TestEngineIntegration
 # ---------------------------------------------------------------------------
 
-class TestEngineIntegration:
-    """Tests for RiskManager-Engine integration."""
+@pytest.fixture
+def engine_harness():
+    """Frictionless portfolio, execution, ATR=2 strategy and one bar.
 
-    def test_engine_with_risk_manager_sizes_differently(self):
-        """Engine with RiskManager uses risk-based sizing, not 10%."""
-        from src.engine import BacktestEngine
-        from src.execution import ExecutionHandler
+    Function-scoped: the tests write to the portfolio's equity log.
+    """
+    from src.execution import ExecutionHandler
 
-        portfolio = Portfolio(initial_cash=Decimal("10000"))
-        execution = ExecutionHandler(
+    return SimpleNamespace(
+        portfolio=Portfolio(initial_cash=Decimal("10000")),
+        execution=ExecutionHandler(
             slippage_pct=Decimal("0"),
             commission_per_trade=Decimal("0"),
             commission_per_share=Decimal("0"),
             spread_pct=Decimal("0"),
-        )
+        ),
+        strategy=_MockATRStrategy("2.0"),
+        bar=_make_bar(100, idx=0),
+    )
+
+
+class TestEngineIntegration:
+    """Tests for RiskManager-Engine integration."""
+
+    def test_engine_with_risk_manager_sizes_differently(self, engine_harness):
+        """Engine with RiskManager uses risk-based sizing, not 10%."""
+        from src.engine import BacktestEngine
+
+        h = engine_harness
         rm = RiskManager(
             risk_per_trade=Decimal("0.01"),
             atr_multiplier=Decimal("2.0"),
             max_position_pct=Decimal("0.50"),
         )
-        strategy = _MockATRStrategy("2.0")
-        bar = _make_bar(100, idx=0)
 
         # Create engine with RiskManager
-        from unittest.mock import MagicMock
-        dh = MagicMock()
-        engine = BacktestEngine(dh, strategy, portfolio, execution, risk_manager=rm)
+        engine = BacktestEngine(
+            MagicMock(), h.strategy, h.portfolio, h.execution, risk_manager=rm,
+        )
 
         # Manually call sizing
-        portfolio.update_equity(bar)
-        qty = engine._calculate_order_quantity(bar)
+        h.portfolio.update_equity(h.bar)
+        qty = engine._calculate_order_quantity(h.bar)
 
         # With RM: risk=100, stop=4, raw=25, max=50 → 25
         assert qty == Decimal("25")
 
-    def test_engine_without_risk_manager_legacy(self):
+    def test_engine_without_risk_manager_legacy(self, engine_harness):
         """Engine without RiskManager uses legacy 10% sizing."""
         from src.engine import BacktestEngine
-        from src.execution import ExecutionHandler
-
-        portfolio = Portfolio(initial_cash=Decimal("10000"))
-        execution = ExecutionHandler(
-            slippage_pct=Decimal("0"),
-            commission_per_trade=Decimal("0"),
-            commission_per_share=Decimal("0"),
-            spread_pct=Decimal("0"),
-        )
-        strategy = _MockATRStrategy("2.0")
-        bar = _make_bar(100, idx=0)
 
-        from unittest.mock import MagicMock
-        dh = MagicMock()
-        engine = BacktestEngine(dh, strategy, portfolio, execution)
+        h = engine_harness
+        engine = BacktestEngine(MagicMock(), h.strategy, h.portfolio, h.execution)
 
-        portfolio.update_equity(bar)
-        qty = engine._calculate_order_quantity(bar)
+        h.portfolio.update_equity(h.bar)
+        qty = engine._calculate_order_quantity(h.bar)
 
         # Legacy: 10% of 10000 / 100 = 10
         assert qty == Decimal("10")
@@ -512,7 +552,6 @@ class TestEngineIntegration:
         """create_engine() works without risk_manager parameter."""
         from src.engine import create_engine
         from src.data_handler import DataHandler
-        from unittest.mock import MagicMock
 
         dh = MagicMock(spec=DataHandler)
         strategy = _MockATRStrategy("1.0")
@@ -702,6 +702,23 @@ class TestSMCStrategy:
             strat.calculate_signals(bar)
         assert strat._current_atr > 0
 
+    def test_atr_rolls_over_last_period_bars(self):
+        """Rolling ATR only covers the last atr_period True Ranges."""
+        strat = self._make_strategy(warmup_bars=0, atr_period=2)
+        bars = [
+            make_bar(0, "100", "105", "95", "102"),   # no TR yet
+            make_bar(1, "102", "108", "98", "106"),   # TR = 10
+            make_bar(2, "106", "112", "100", "110"),  # TR = 12
+            make_bar(3, "110", "111", "109", "110"),  # TR = 2
+        ]
+        atrs = []
+        for bar in bars:
+            strat.calculate_signals(bar)
+            atrs.append(strat._current_atr)
+        assert atrs == [
+            Decimal("0"), Decimal("10"), Decimal("11"), Decimal("7"),
+        ]
+
     def test_no_entry_without_confluence(self):
         """No signal without all entry conditions met."""
         strat = self._make_strategy(warmup_bars=0, swing_strength=1)
@@ -5,8 +5,11 @@ from __future__ import annotations
 import pytest
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import Optional
 
+import numpy as np
+
 from src.events import MarketEvent, SignalEvent, SignalType
 from src.strategy.base import BaseStrategy
 from src.strategy.reversal import ReversalStrategy
@@ -18,6 +21,16 @@ from src.strategy.fvg import FVGStrategy
 # Helpers
 # ---------------------------------------------------------------------------
 
+_HUNDRED = Decimal("100")
+_DUMMY_STRENGTH = Decimal("0.8")
+
+
+def _price(value: float) -> Decimal:
+    """Two-decimal price from a generated float."""
+    return Decimal(f"{value:.2f}")
+
+
+@lru_cache(maxsize=None)
 def _make_bar(
     close: str = "100.00",
     high: str = "101.00",
@@ -26,7 +39,12 @@ def _make_bar(
     volume: int = 1000,
     day_offset: int = 0,
 ) -> MarketEvent:
-    """Create a MarketEvent with configurable price."""
+    """Create a MarketEvent with configurable price.
+
+    Memoized like the generators below: MarketEvent is frozen, so repeated
+    calls with the same arguments (the all-defaults bar included) share
+    one instance.
+    """
     return MarketEvent(
         symbol="TEST",
         timestamp=datetime(2024, 1, 15 + day_offset, 10, 0),
@@ -44,12 +62,12 @@ class _DummyStrategy(BaseStrategy):
 
     def calculate_signals(self, event: MarketEvent) -> Optional[SignalEvent]:
         # Simple: emit LONG if close > 100, else None
-        if event.close > Decimal("100"):
+        if event.close > _HUNDRED:
             return SignalEvent(
                 symbol=event.symbol,
                 timestamp=event.timestamp,
                 signal_type=SignalType.LONG,
-                strength=Decimal("0.8"),
+                strength=_DUMMY_STRENGTH,
             )
         return None
 
@@ -135,6 +153,20 @@ class TestRollingBuffer:
         for buffered_bar in strategy.bars:
             assert buffered_bar.timestamp <= current
 
+    def test_price_arrays_track_rolling_buffer(self):
+        """Column arrays stay aligned with bars across buffer compaction."""
+        strategy = _DummyStrategy(
+            symbol="TEST", timeframe="1d", max_buffer_size=3,
+        )
+        for i in range(10):
+            strategy.update_buffer(_make_bar(close=f"{100 + i}.00", day_offset=i))
+            _, high, low, close, volume = strategy.price_arrays()
+            assert list(close) == [b.close_f for b in strategy.bars]
+        assert list(close) == [107.0, 108.0, 109.0]
+        assert list(high) == [101.0] * 3
+        assert list(volume) == [1000.0] * 3
+        assert not close.flags.writeable
+
 
 # ===========================================================================
 # TestParameterInjection
@@ -172,48 +204,64 @@ class TestParameterInjection:
 # ---------------------------------------------------------------------------
 # Helpers for concrete strategy tests
 # ---------------------------------------------------------------------------
+# Generators are memoized: MarketEvent is frozen, so tests asking for the
+# same series share one tuple instead of rebuilding it bar by bar.
 
+@lru_cache(maxsize=None)
 def _generate_trending_bars(
     start_price: float = 100.0,
     count: int = 200,
     trend: str = "up",
     volatility: float = 1.0,
-) -> list[MarketEvent]:
-    """Generate a synthetic bar series with a clear trend."""
-    import math
-    bars = []
-    price = start_price
-    for i in range(count):
-        if trend == "up":
-            price += volatility * 0.2
-        elif trend == "down":
-            price -= volatility * 0.2
-        else:
-            price = start_price + volatility * 2 * math.sin(i * 0.3)
-
-        noise = volatility * math.sin(i * 1.7) * 0.5
-        open_ = price + noise * 0.3
-        high = max(price, open_) + abs(noise) + 0.1
-        low = min(price, open_) - abs(noise) - 0.1
-        close = price + noise * 0.1
-
-        day = 1 + i // 1440
-        hour = (i // 60) % 24
-        minute = i % 60
-        bars.append(MarketEvent(
+) -> tuple[MarketEvent, ...]:
+    """Generate a synthetic bar series with a clear trend.
+
+    The price path is computed as float64 arrays; only the MarketEvent
+    construction runs per bar.
+    """
+    i = np.arange(count)
+    if trend in ("up", "down"):
+        step = volatility * 0.2 if trend == "up" else -(volatility * 0.2)
+        # Sequential cumsum so each price equals the running float sum.
+        steps = np.full(count + 1, step)
+        steps[0] = start_price
+        price = np.cumsum(steps)[1:]
+    else:
+        price = start_price + volatility * 2 * np.sin(i * 0.3)
+
+    noise = volatility * np.sin(i * 1.7) * 0.5
+    open_ = price + noise * 0.3
+    high = np.maximum(price, open_) + np.abs(noise) + 0.1
+    low = np.minimum(price, open_) - np.abs(noise) - 0.1
+    close = price + noise * 0.1
+
+    # Minute-spaced timestamps from 2024-01-01 00:00, built in one shot.
+    timestamps = (
+        np.datetime64("2024-01-01T00:00")
+        + i.astype("timedelta64[m]")
+    ).astype("datetime64[us]").tolist()
+    return tuple(
+        MarketEvent(
             symbol="TEST",
-            timestamp=datetime(2024, 1, day, hour, minute),
-            open=Decimal(str(round(open_, 2))),
-            high=Decimal(str(round(high, 2))),
-            low=Decimal(str(round(low, 2))),
-            close=Decimal(str(round(close, 2))),
-            volume=1000 + i * 10,
+            timestamp=ts,
+            open=_price(o),
+            high=_price(h),
+            low=_price(lo),
+            close=_price(c),
+            volume=1000 + n * 10,
             timeframe="1d",
+        )
+        for n, (ts, o, h, lo, c) in enumerate(zip(
+            timestamps, open_.tolist(), high.tolist(), low.tolist(),
+            close.tolist(),
         ))
-    return bars
+    )
 
 
-def _generate_rsi_extreme_bars(direction: str = "oversold", count: int = 50) -> list[MarketEvent]:
+@lru_cache(maxsize=None)
+def _generate_rsi_extreme_bars(
+    direction: str = "oversold", count: int = 50,
+) -> tuple[MarketEvent, ...]:
     """Generate bars that push RSI to extreme levels."""
     bars = []
     price = 100.0
@@ -237,17 +285,18 @@ def _generate_rsi_extreme_bars(direction: str = "oversold", count: int = 50) ->
         bars.append(MarketEvent(
             symbol="TEST",
             timestamp=datetime(2024, 1, 1, 10, i),
-            open=Decimal(str(round(open_, 2))),
-            high=Decimal(str(round(high, 2))),
-            low=Decimal(str(round(low, 2))),
-            close=Decimal(str(round(close, 2))),
+            open=_price(open_),
+            high=_price(high),
+            low=_price(low),
+            close=_price(close),
             volume=1000,
             timeframe="1d",
         ))
-    return bars
+    return tuple(bars)
 
 
-def _generate_breakout_bars(count: int = 50) -> list[MarketEvent]:
+@lru_cache(maxsize=None)
+def _generate_breakout_bars(count: int = 50) -> tuple[MarketEvent, ...]:
     """Generate bars: consolidation then breakout."""
     import math
     bars = []
@@ -267,19 +316,20 @@ def _generate_breakout_bars(count: int = 50) -> list[MarketEvent]:
         bars.append(MarketEvent(
             symbol="TEST",
             timestamp=datetime(2024, 1, 1, 10, i),
-            open=Decimal(str(round(open_, 2))),
-            high=Decimal(str(round(high, 2))),
-            low=Decimal(str(round(low, 2))),
-            close=Decimal(str(round(close, 2))),
+            open=_price(open_),
+            high=_price(high),
+            low=_price(low),
+            close=_price(close),
             volume=vol,
             timeframe="1d",
         ))
-    return bars
+    return tuple(bars)
 
 
-def _generate_fvg_bars() -> list[MarketEvent]:
+@lru_cache(maxsize=None)
+def _generate_fvg_bars() -> tuple[MarketEvent, ...]:
     """Generate bars that create a bullish FVG and then fill it."""
-    return [
+    return (
         MarketEvent(
             symbol="TEST", timestamp=datetime(2024, 1, 1, 10, 0),
             open=Decimal("99"), high=Decimal("100"), low=Decimal("98"),
@@ -305,9 +355,49 @@ def _generate_fvg_bars() -> list[MarketEvent]:
             open=Decimal("102"), high=Decimal("107"), low=Decimal("101.5"),
             close=Decimal("106"), volume=1200, timeframe="1d",
         ),
+    )
+
+
+def _run_signals(strategy: BaseStrategy, bars) -> list[SignalEvent]:
+    """Feed ``bars`` through ``strategy`` and collect the emitted signals."""
+    return [
+        sig for bar in bars
+        if (sig := strategy.calculate_signals(bar)) is not None
     ]
 
 
+# Each scenario is simulated once per module; the tests below only assert
+# different properties of the same signal list.
+
+@pytest.fixture(scope="module")
+def reversal_signals() -> list[SignalEvent]:
+    s = ReversalStrategy(
+        symbol="TEST", timeframe="1d",
+        params={"rsi_period": 14, "rsi_oversold": 30, "sma_period": 5},
+    )
+    return _run_signals(
+        s, _generate_rsi_extreme_bars(direction="oversold", count=50),
+    )
+
+
+@pytest.fixture(scope="module")
+def breakout_signals() -> list[SignalEvent]:
+    s = BreakoutStrategy(
+        symbol="TEST", timeframe="1d",
+        params={"lookback": 20, "volume_factor": 1.5},
+    )
+    return _run_signals(s, _generate_breakout_bars(count=50))
+
+
+@pytest.fixture(scope="module")
+def fvg_signals() -> list[SignalEvent]:
+    s = FVGStrategy(
+        symbol="TEST", timeframe="1d",
+        params={"min_gap_size_pct": 0.1},
+    )
+    return _run_signals(s, _generate_fvg_bars())
+
+
 # ===========================================================================
 # TestReversalStrategy
 # ===========================================================================
@@ -332,42 +422,18 @@ class TestReversalStrategy:
         result = s.calculate_signals(_make_bar())
         assert result is None
 
-    def test_reversal_generates_long_on_oversold(self):
-        s = ReversalStrategy(
-            symbol="TEST", timeframe="1d",
-            params={"rsi_period": 14, "rsi_oversold": 30, "sma_period": 5},
-        )
-        bars = _generate_rsi_extreme_bars(direction="oversold", count=50)
-        signals = []
-        for bar in bars:
-            sig = s.calculate_signals(bar)
-            if sig is not None:
-                signals.append(sig)
-        assert len(signals) > 0
-        long_signals = [s for s in signals if s.signal_type == SignalType.LONG]
+    def test_reversal_generates_long_on_oversold(self, reversal_signals):
+        assert len(reversal_signals) > 0
+        long_signals = [
+            s for s in reversal_signals if s.signal_type == SignalType.LONG
+        ]
         assert len(long_signals) > 0
 
-    def test_reversal_signal_has_correct_symbol(self):
-        s = ReversalStrategy(
-            symbol="TEST", timeframe="1d",
-            params={"rsi_period": 14, "rsi_oversold": 30, "sma_period": 5},
-        )
-        for bar in _generate_rsi_extreme_bars(direction="oversold", count=50):
-            sig = s.calculate_signals(bar)
-            if sig is not None:
-                assert sig.symbol == "TEST"
-                break
+    def test_reversal_signal_has_correct_symbol(self, reversal_signals):
+        assert all(sig.symbol == "TEST" for sig in reversal_signals)
 
-    def test_reversal_strength_is_decimal(self):
-        s = ReversalStrategy(
-            symbol="TEST", timeframe="1d",
-            params={"rsi_period": 14, "rsi_oversold": 30, "sma_period": 5},
-        )
-        for bar in _generate_rsi_extreme_bars(direction="oversold", count=50):
-            sig = s.calculate_signals(bar)
-            if sig is not None:
-                assert isinstance(sig.strength, Decimal)
-                break
+    def test_reversal_strength_is_decimal(self, reversal_signals):
+        assert all(isinstance(sig.strength, Decimal) for sig in reversal_signals)
 
 
 # ===========================================================================
@@ -393,30 +459,27 @@ class TestBreakoutStrategy:
         result = s.calculate_signals(_make_bar())
         assert result is None
 
-    def test_breakout_generates_signal_on_breakout(self):
-        s = BreakoutStrategy(
-            symbol="TEST", timeframe="1d",
-            params={"lookback": 20, "volume_factor": 1.5},
-        )
-        signals = []
-        for bar in _generate_breakout_bars(count=50):
-            sig = s.calculate_signals(bar)
-            if sig is not None:
-                signals.append(sig)
-        assert len(signals) > 0
-        long_signals = [s for s in signals if s.signal_type == SignalType.LONG]
+    def test_breakout_generates_signal_on_breakout(self, breakout_signals):
+        assert len(breakout_signals) > 0
+        long_signals = [
+            s for s in breakout_signals if s.signal_type == SignalType.LONG
+        ]
         assert len(long_signals) > 0
 
-    def test_breakout_signal_strength_is_decimal(self):
-        s = BreakoutStrategy(
-            symbol="TEST", timeframe="1d",
-            params={"lookback": 20, "volume_factor": 1.5},
-        )
+    def test_breakout_signal_strength_is_decimal(self, breakout_signals):
+        assert all(isinstance(sig.strength, Decimal) for sig in breakout_signals)
+
+    def test_breakout_channel_kernel_matches_numpy(self):
+        """Fused channel scan equals the NumPy max/min/mean of the window."""
+        from src.strategy import _kernels
+
+        s = BreakoutStrategy(symbol="TEST", timeframe="1d")
         for bar in _generate_breakout_bars(count=50):
-            sig = s.calculate_signals(bar)
-            if sig is not None:
-                assert isinstance(sig.strength, Decimal)
-                break
+            s.update_buffer(bar)
+        _, highs, lows, _, volumes = s.price_arrays()
+        assert _kernels.channel_stats(highs, lows, volumes, 20) == (
+            _kernels._channel_stats_np(highs, lows, volumes, 20)
+        )
 
 
 # ===========================================================================
@@ -442,30 +505,13 @@ class TestFVGStrategy:
         result = s.calculate_signals(_make_bar())
         assert result is None
 
-    def test_fvg_detects_bullish_gap_and_signals(self):
-        s = FVGStrategy(
-            symbol="TEST", timeframe="1d",
-            params={"min_gap_size_pct": 0.1},
-        )
-        signals = []
-        for bar in _generate_fvg_bars():
-            sig = s.calculate_signals(bar)
-            if sig is not None:
-                signals.append(sig)
-        assert len(signals) > 0
-        long_signals = [s for s in signals if s.signal_type == SignalType.LONG]
+    def test_fvg_detects_bullish_gap_and_signals(self, fvg_signals):
+        assert len(fvg_signals) > 0
+        long_signals = [s for s in fvg_signals if s.signal_type == SignalType.LONG]
         assert len(long_signals) > 0
 
-    def test_fvg_signal_strength_is_decimal(self):
-        s = FVGStrategy(
-            symbol="TEST", timeframe="1d",
-            params={"min_gap_size_pct": 0.1},
-        )
-        for bar in _generate_fvg_bars():
-            sig = s.calculate_signals(bar)
-            if sig is not None:
-                assert isinstance(sig.strength, Decimal)
-                break
+    def test_fvg_signal_strength_is_decimal(self, fvg_signals):
+        assert all(isinstance(sig.strength, Decimal) for sig in fvg_signals)
 
 
 # ===========================================================================